@@ -142,6 +142,16 @@ DATABASES = {
     }
 }
 
+# Database-backed so the web, scheduler and worker processes share anti-bot
+# cooldowns and the Apollo backoff. Create the table with
+# `manage.py createcachetable` (entrypoint.sh runs it after migrating).
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "automoto_cache",
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -224,15 +234,55 @@ DEFAULT_SCRAPE_KEYWORDS = os.getenv(
 DEFAULT_SCRAPE_LOCATION = os.getenv("DEFAULT_SCRAPE_LOCATION", "us")
 DEFAULT_SCRAPE_MAX_PAGES = _env_int("DEFAULT_SCRAPE_MAX_PAGES", 1)
 DEFAULT_ENRICHMENT_LIMIT = _env_int("DEFAULT_ENRICHMENT_LIMIT", 10)
+SCRAPE_MAX_WORKERS = _env_int("SCRAPE_MAX_WORKERS", 4)
 API_SCRAPER_TIMEOUT_SECONDS = _env_int("API_SCRAPER_TIMEOUT_SECONDS", 30)
+# Stream API payloads (via ijson) instead of buffering them; also per website
+API_STREAMING_ENABLED = os.getenv("API_STREAMING_ENABLED", "False").lower() == "true"
 REQUEST_SCRAPER_TIMEOUT_SECONDS = _env_int("REQUEST_SCRAPER_TIMEOUT_SECONDS", 30)
 REQUEST_DETAIL_TIMEOUT_SECONDS = _env_int("REQUEST_DETAIL_TIMEOUT_SECONDS", 20)
+REQUEST_DETAIL_CONCURRENCY = _env_int("REQUEST_DETAIL_CONCURRENCY", 2)
+# Stop paginating once this fraction of a results page is already stored
+# (1.0 = only fully known pages, 0 always walks max_pages)
+SCRAPER_INCREMENTAL_STOP_RATIO = _env_float("SCRAPER_INCREMENTAL_STOP_RATIO", 1.0)
+# Revalidate search pages and API feeds with stored ETag/Last-Modified values
+HTTP_CONDITIONAL_REQUESTS_ENABLED = (
+    os.getenv("HTTP_CONDITIONAL_REQUESTS_ENABLED", "True").lower() == "true"
+)
+HTTP_VALIDATOR_CACHE_MAX_BODY_BYTES = _env_int(
+    "HTTP_VALIDATOR_CACHE_MAX_BODY_BYTES", 5000000
+)
+# Shared HTTP connection pools and connect-error retries for all scrapers
+HTTP_POOL_HOSTS = _env_int("HTTP_POOL_HOSTS", 32)
+HTTP_POOL_CONNECTIONS_PER_HOST = _env_int("HTTP_POOL_CONNECTIONS_PER_HOST", 8)
+HTTP_CONNECT_RETRIES = _env_int("HTTP_CONNECT_RETRIES", 3)
+HTTP_RETRY_BACKOFF_SECONDS = _env_float("HTTP_RETRY_BACKOFF_SECONDS", 0.5)
+# On-disk response cache: off, record (read-through with TTL) or replay (cache only)
+HTTP_RESPONSE_CACHE_MODE = os.getenv("HTTP_RESPONSE_CACHE_MODE", "off")
+HTTP_RESPONSE_CACHE_DIR = os.getenv("HTTP_RESPONSE_CACHE_DIR", "")
+HTTP_RESPONSE_CACHE_TTL_SECONDS = _env_int("HTTP_RESPONSE_CACHE_TTL_SECONDS", 86400)
+HTTP_RESPONSE_CACHE_MAX_BYTES = _env_int("HTTP_RESPONSE_CACHE_MAX_BYTES", 536870912)
+# Processes that parse fetched HTML off the fetch threads (0 parses inline)
+SCRAPER_PARSE_WORKERS = _env_int("SCRAPER_PARSE_WORKERS", 0)
+# HTML parser backend: html.parser, lxml or selectolax (overridable per website)
+SCRAPER_HTML_PARSER = os.getenv("SCRAPER_HTML_PARSER", "html.parser")
+REQUEST_ASYNC_ENGINE_ENABLED = (
+    os.getenv("REQUEST_ASYNC_ENGINE_ENABLED", "False").lower() == "true"
+)
+REQUEST_ASYNC_PER_HOST_LIMIT = _env_int("REQUEST_ASYNC_PER_HOST_LIMIT", 2)
+REQUEST_ASYNC_MAX_CONNECTIONS = _env_int("REQUEST_ASYNC_MAX_CONNECTIONS", 50)
 ANTI_BOT_FAILURE_THRESHOLD = _env_int("ANTI_BOT_FAILURE_THRESHOLD", 3)
 ANTI_BOT_COOLDOWN_SECONDS = _env_int("ANTI_BOT_COOLDOWN_SECONDS", 3600)
 SCHEDULER_CLEANUP_MAX_AGE_SECONDS = _env_int(
     "SCHEDULER_CLEANUP_MAX_AGE_SECONDS", 604800
 )
 SCHEDULER_CLEANUP_CRON = os.getenv("SCHEDULER_CLEANUP_CRON", "0 0 * * 1")
+# When true the scheduler only enqueues ScrapeWorkUnit rows for run_workers
+SCHEDULER_ENQUEUE_ONLY = os.getenv("SCHEDULER_ENQUEUE_ONLY", "False").lower() == "true"
+WORK_QUEUE_WORKERS = _env_int("WORK_QUEUE_WORKERS", 2)
+WORK_QUEUE_POLL_SECONDS = _env_float("WORK_QUEUE_POLL_SECONDS", 5.0)
+WORK_QUEUE_LEASE_SECONDS = _env_int("WORK_QUEUE_LEASE_SECONDS", 3600)
+WORK_QUEUE_MAX_ATTEMPTS = _env_int("WORK_QUEUE_MAX_ATTEMPTS", 3)
+WORK_QUEUE_RETRY_DELAY_SECONDS = _env_int("WORK_QUEUE_RETRY_DELAY_SECONDS", 300)
 STEALTH_WINDOW_WIDTH_MIN = _env_int("STEALTH_WINDOW_WIDTH_MIN", 1200)
 STEALTH_WINDOW_WIDTH_MAX = _env_int("STEALTH_WINDOW_WIDTH_MAX", 1920)
 STEALTH_WINDOW_HEIGHT_MIN = _env_int("STEALTH_WINDOW_HEIGHT_MIN", 800)
@@ -243,18 +293,26 @@ STEALTH_WARMUP_SITES = _env_csv(
 )
 STEALTH_RECONNECT_TIME_SECONDS = _env_int("STEALTH_RECONNECT_TIME_SECONDS", 8)
 STEALTH_CAPTCHA_RETRIES = _env_int("STEALTH_CAPTCHA_RETRIES", 2)
-REQUEST_PAGE_JITTER_MIN_SECONDS = _env_float("REQUEST_PAGE_JITTER_MIN_SECONDS", 1.2)
-REQUEST_PAGE_JITTER_MAX_SECONDS = _env_float("REQUEST_PAGE_JITTER_MAX_SECONDS", 3.0)
-REQUEST_DETAIL_JITTER_MIN_SECONDS = _env_float("REQUEST_DETAIL_JITTER_MIN_SECONDS", 0.8)
-REQUEST_DETAIL_JITTER_MAX_SECONDS = _env_float("REQUEST_DETAIL_JITTER_MAX_SECONDS", 1.8)
-REQUEST_BETWEEN_PAGES_JITTER_MIN_SECONDS = _env_float(
-    "REQUEST_BETWEEN_PAGES_JITTER_MIN_SECONDS", 1.0
-)
-REQUEST_BETWEEN_PAGES_JITTER_MAX_SECONDS = _env_float(
-    "REQUEST_BETWEEN_PAGES_JITTER_MAX_SECONDS", 2.4
+# Detail tabs loaded at once per results page (1 keeps one-at-a-time fetching)
+STEALTH_DETAIL_TABS = _env_int("STEALTH_DETAIL_TABS", 1)
+# Warm browser pool owned by the scheduler process (0 disables it)
+STEALTH_POOL_SIZE = _env_int("STEALTH_POOL_SIZE", 1)
+STEALTH_POOL_MAX_PAGES = _env_int("STEALTH_POOL_MAX_PAGES", 200)
+STEALTH_POOL_MAX_AGE_SECONDS = _env_int("STEALTH_POOL_MAX_AGE_SECONDS", 21600)
+# Per-domain token bucket shared by all scrapers (0 requests/minute disables it)
+SCRAPER_RATE_LIMIT_PER_MINUTE = _env_float("SCRAPER_RATE_LIMIT_PER_MINUTE", 30)
+SCRAPER_RATE_LIMIT_BURST = _env_int("SCRAPER_RATE_LIMIT_BURST", 2)
+# Random spread applied to the spacing between requests, as a fraction of it
+SCRAPER_RATE_LIMIT_JITTER = _env_float("SCRAPER_RATE_LIMIT_JITTER", 0.3)
+# Overrides as domain=requests_per_minute, e.g. linkedin.com=6,indeed.com=12
+SCRAPER_DOMAIN_RATE_LIMITS = _env_csv("SCRAPER_DOMAIN_RATE_LIMITS", "")
+# Learned per-website rate: +step per clean page, x factor on blocks/429/503
+SCRAPER_PACING_INCREASE_PER_MINUTE = _env_float(
+    "SCRAPER_PACING_INCREASE_PER_MINUTE", 2.0
 )
-STEALTH_PAGE_JITTER_MIN_SECONDS = _env_float("STEALTH_PAGE_JITTER_MIN_SECONDS", 1.5)
-STEALTH_PAGE_JITTER_MAX_SECONDS = _env_float("STEALTH_PAGE_JITTER_MAX_SECONDS", 3.2)
+SCRAPER_PACING_DECREASE_FACTOR = _env_float("SCRAPER_PACING_DECREASE_FACTOR", 0.5)
+SCRAPER_PACING_MIN_PER_MINUTE = _env_float("SCRAPER_PACING_MIN_PER_MINUTE", 2)
+SCRAPER_PACING_MAX_PER_MINUTE = _env_float("SCRAPER_PACING_MAX_PER_MINUTE", 120)
 STEALTH_POST_OPEN_JITTER_MIN_SECONDS = _env_float(
     "STEALTH_POST_OPEN_JITTER_MIN_SECONDS", 3.0
 )
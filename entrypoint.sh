@@ -20,6 +20,7 @@ chmod 777 /app/downloaded_files
 
 if [ "$RUN_MIGRATIONS" = "true" ]; then
   python manage.py migrate --noinput
+  python manage.py createcachetable
 fi
 
 if [ "$RUN_COLLECTSTATIC" = "true" ]; then
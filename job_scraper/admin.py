@@ -6,10 +6,12 @@ from .management.commands.run_scheduler import run_scheduled_scrape
 from .models import (
     Contact,
     CustomWebsite,
+    HttpValidatorCache,
     Job,
     ScheduledScrape,
     ScheduledScrapeRun,
     ScraperExecutionLog,
+    ScrapeWorkUnit,
 )
 
 # Ensure admin uses its own login path, separate from the app's /accounts/login/
@@ -50,6 +52,10 @@ class CustomWebsiteAdmin(admin.ModelAdmin):
             {
                 "fields": (
                     "use_stealth",
+                    "detail_fetch_limit",
+                    "use_async_engine",
+                    "html_parser",
+                    "pacing_rate_per_minute",
                     "job_list_selector",
                     "title_selector",
                     "company_selector",
@@ -70,6 +76,8 @@ class CustomWebsiteAdmin(admin.ModelAdmin):
             {
                 "fields": (
                     "is_api",
+                    "api_fetch_once",
+                    "api_stream_response",
                     "api_jobs_path",
                     "api_title_key",
                     "api_company_key",
@@ -234,3 +242,41 @@ class ScheduledScrapeRunAdmin(admin.ModelAdmin):
 
     has_email_error.boolean = True
     has_email_error.short_description = "Email Error"
+
+
+@admin.register(ScrapeWorkUnit)
+class ScrapeWorkUnitAdmin(admin.ModelAdmin):
+    list_display = (
+        "run",
+        "website",
+        "phrase",
+        "status",
+        "attempts",
+        "worker_id",
+        "available_at",
+        "completed_at",
+    )
+    list_filter = ("status", "website")
+    search_fields = ("phrase", "worker_id", "last_error")
+    readonly_fields = (
+        "run",
+        "website",
+        "phrase",
+        "location",
+        "max_pages",
+        "attempts",
+        "lease_expires_at",
+        "worker_id",
+        "job_ids",
+        "last_error",
+        "created_at",
+        "completed_at",
+    )
+
+
+@admin.register(HttpValidatorCache)
+class HttpValidatorCacheAdmin(admin.ModelAdmin):
+    list_display = ("url", "etag", "last_modified", "not_modified_count", "checked_at")
+    search_fields = ("url",)
+    readonly_fields = ("url_hash", "url", "etag", "last_modified", "encoding")
+    exclude = ("body",)
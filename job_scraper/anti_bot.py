@@ -24,6 +24,14 @@ FAILURE_THRESHOLD = settings.ANTI_BOT_FAILURE_THRESHOLD
 COOLDOWN_SECONDS = settings.ANTI_BOT_COOLDOWN_SECONDS
 
 
+class ScrapeFailed(Exception):
+    """A website yielded nothing because of an error, a block or a cooldown.
+
+    Only raised by scrapers built with ``raise_errors=True`` (the work-queue
+    workers, which retry the unit); everything else logs and moves on.
+    """
+
+
 def classify_anti_bot_response(status_code: int | None = None, html_content: str = "", card_count: int = 0) -> dict[str, Any]:
     content = (html_content or "").lower()
     matched_markers = [marker for marker in CHALLENGE_MARKERS if marker in content]
@@ -113,6 +121,7 @@ def jitter_sleep(min_seconds: float, max_seconds: float) -> None:
     time.sleep(random.uniform(min_seconds, max_seconds))
 
 
+
 def _failure_key(website_id: int) -> str:
     return f"scraper_antibot_failures_{website_id}"
 
@@ -1,19 +1,49 @@
+import gzip
 import logging
+import tempfile
 import time
 import uuid
 from datetime import datetime
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from django.conf import settings
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 
-import requests
 from requests import Response
 
+from .anti_bot import BLOCK_STATUS_CODES, ScrapeFailed
+from .http_sessions import get_session
+from .http_validators import conditional_get, is_not_modified, remember_validators
+from .job_store import upsert_jobs
+from .json_paths import compile_accessor, compile_extractor, is_streamable_path
+from .json_stream import iter_json_items, json_streaming_available
+from .keyword_matcher import RFP_MARKERS, PhraseMatcher
 from .models import CustomWebsite, Job, ScraperExecutionLog
+from .rate_limiter import (
+    record_pacing_backoff,
+    record_pacing_success,
+    throttle,
+    website_rate,
+)
+from .response_cache import (
+    cached_client,
+    is_cached,
+    is_cached_response,
+    remember_response,
+)
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_BYTES = 64 * 1024
+API_ITEM_FIELDS = ("title", "company", "location", "description", "source_url")
+
+
+def api_fetches_once(website: CustomWebsite) -> bool:
+    """True when one download per run serves every keyword phrase."""
+    return website.is_api and (
+        website.api_fetch_once or "{keywords}" not in website.search_url
+    )
+
 
 class ApiScraper:
     """
@@ -21,34 +51,99 @@ class ApiScraper:
     Bypasses browser stealth scraping entirely for faster, reliable data fetching.
     """
 
-    def __init__(self, run_id: Optional[str] = None) -> None:
+    def __init__(
+        self, run_id: Optional[str] = None, raise_errors: bool = False
+    ) -> None:
         self._run_id = run_id
+        self._raise_errors = raise_errors
 
     def scrape(self, website: CustomWebsite, keywords: str, location: str) -> List[Job]:
         keywords = (keywords or "").strip()
+        return self._scrape(website, keywords, [keywords], location)
+
+    def scrape_phrases(
+        self,
+        website: CustomWebsite,
+        phrases: List[str],
+        location: str,
+        responses: Optional[Dict[str, Response]] = None,
+    ) -> List[Job]:
+        """
+        Fetch the search URL once with an empty keyword and match every
+        phrase against the payload locally. Passing the same ``responses``
+        dict across websites reuses payloads for identical URLs.
+        """
+        phrases = [phrase.strip() for phrase in phrases if phrase.strip()]
+        return self._scrape(website, "", phrases, location, responses)
+
+    def _scrape(
+        self,
+        website: CustomWebsite,
+        fetch_keywords: str,
+        phrases: List[str],
+        location: str,
+        responses: Optional[Dict[str, Response]] = None,
+    ) -> List[Job]:
         location = (location or "").strip()
         started_at = time.monotonic()
         saved_jobs = []
         json_dump = ""
         error_msg = ""
+        failure = ""
         payload_jobs_count = 0
         matched_jobs_count = 0
-        keyword_terms = [term for term in keywords.lower().split() if term]
+        phrase_matcher = PhraseMatcher(
+            [[term for term in phrase.lower().split() if term] for phrase in phrases]
+        )
+        keywords = ", ".join(phrase for phrase in phrases if phrase)
+        # The feed is matched locally, so a 304 only means "nothing to do" for
+        # the same website and phrase set that stored the validators.
+        phrase_set = sorted({phrase.lower() for phrase in phrases if phrase})
+        scope = f"{website.id}:{','.join(phrase_set)}"
+        stream = self._streams_response(website)
+        artifact = None
 
         self._ensure_run_id()
         self._log_scrape_start(website)
 
         try:
-            response = self._fetch_response(website, keywords, location)
-            data, json_dump, error_msg = self._parse_response(response)
+            # A streamed body can only be read once, so it is never shared.
+            response = self._fetch_response(
+                website,
+                fetch_keywords,
+                location,
+                None if stream else responses,
+                stream=stream,
+                scope=scope,
+            )
+            if is_not_modified(response):
+                self._log_execution(website, 0, "", "")
+                self._log_scrape_done(website, 0, 0, 0, started_at, False)
+                return []
 
             job_entries = []
-            if not error_msg:
+            url = self._build_url(website, fetch_keywords, location)
+            if stream and response.ok:
+                artifact = tempfile.TemporaryFile()
                 job_entries, payload_jobs_count, matched_jobs_count, error_msg = (
-                    self._collect_job_entries(website, data, keyword_terms, keywords)
+                    self._stream_job_entries(
+                        website, response, phrase_matcher, artifact
+                    )
                 )
+            else:
+                data, json_dump, error_msg = self._parse_response(response)
+                if not error_msg:
+                    remember_response(url, response)
+                    job_entries, payload_jobs_count, matched_jobs_count, error_msg = (
+                        self._collect_job_entries(website, data, phrase_matcher)
+                    )
 
-            saved_jobs = self._save_jobs(job_entries)
+            saved_jobs = upsert_jobs(job_entries)
+            if not error_msg:
+                # Only once the jobs are stored: the next run's 304 skips them.
+                remember_validators(url, response, store_body=not stream, scope=scope)
+            # A fetch or payload error; "no matches" is not a failure.
+            failure = "" if saved_jobs else error_msg
             error_msg = self._finalize_error_message(
                 error_msg,
                 payload_jobs_count,
@@ -60,6 +155,7 @@ class ApiScraper:
                 len(saved_jobs),
                 error_msg,
                 json_dump,
+                artifact,
             )
             self._log_scrape_done(
                 website,
@@ -69,7 +165,6 @@ class ApiScraper:
                 started_at,
                 bool(error_msg),
             )
-            return saved_jobs
         except Exception as exc:
             error_msg = f"Unexpected API error: {exc}"
             logger.exception(
@@ -78,7 +173,9 @@ class ApiScraper:
                 website.id,
                 website.name,
             )
-            self._log_execution(website, len(saved_jobs), error_msg, json_dump)
+            self._log_execution(
+                website, len(saved_jobs), error_msg, json_dump, artifact
+            )
             self._log_scrape_done(
                 website,
                 payload_jobs_count,
@@ -87,9 +184,15 @@ class ApiScraper:
                 started_at,
                 True,
             )
-            return saved_jobs
+            if self._raise_errors:
+                raise
         finally:
+            if artifact is not None:
+                artifact.close()
             self._run_id = None
+        if failure and self._raise_errors:
+            raise ScrapeFailed(failure)
+        return saved_jobs
 
     def _ensure_run_id(self) -> None:
         if not self._run_id:
@@ -103,15 +206,75 @@ class ApiScraper:
             website.name,
         )
 
-    def _fetch_response(self, website: CustomWebsite, keywords: str, location: str) -> Response:
-        url = website.search_url.format(keywords=keywords, location=location, page=1)
+    def _streams_response(self, website: CustomWebsite) -> bool:
+        if not (website.api_stream_response or settings.API_STREAMING_ENABLED):
+            return False
+        if not json_streaming_available():
+            logger.warning(
+                "api_streaming_unavailable website_id=%s website=%s fallback=buffered",
+                website.id,
+                website.name,
+            )
+            return False
+        if not is_streamable_path(website.api_jobs_path):
+            logger.warning(
+                "api_streaming_unsupported_path website_id=%s path=%s fallback=buffered",
+                website.id,
+                website.api_jobs_path,
+            )
+            return False
+        return True
+
+    def _build_url(self, website: CustomWebsite, keywords: str, location: str) -> str:
+        return website.search_url.format(keywords=keywords, location=location, page=1)
+
+    def _fetch_response(
+        self,
+        website: CustomWebsite,
+        keywords: str,
+        location: str,
+        responses: Optional[Dict[str, Response]] = None,
+        stream: bool = False,
+        scope: str = "",
+    ) -> Response:
+        url = self._build_url(website, keywords, location)
+        # A 304 answered another scope's validators; fetch with our own.
+        if (
+            responses is not None
+            and url in responses
+            and not is_not_modified(responses[url])
+        ):
+            logger.info(
+                "api_fetch_reused run_id=%s website_id=%s url=%s",
+                self._run_id,
+                website.id,
+                url,
+            )
+            return responses[url]
+
         logger.info(
             "api_fetch_start run_id=%s website_id=%s url=%s",
             self._run_id,
             website.id,
             url,
         )
-        return requests.get(url, timeout=settings.API_SCRAPER_TIMEOUT_SECONDS)
+        if not is_cached(url):
+            throttle(url, website_rate(website))
+        response = conditional_get(
+            cached_client(get_session("api")),
+            url,
+            timeout=settings.API_SCRAPER_TIMEOUT_SECONDS,
+            stream=stream,
+            scope=scope,
+        )
+        if not is_cached_response(response):
+            if response.status_code in BLOCK_STATUS_CODES:
+                record_pacing_backoff(website)
+            elif response.ok:
+                record_pacing_success(website)
+        if responses is not None:
+            responses[url] = response
+        return response
 
     def _parse_response(self, response: Response) -> Tuple[Any, str, str]:
         json_dump = response.text if hasattr(response, "text") else ""
@@ -125,19 +288,21 @@ class ApiScraper:
         self,
         website: CustomWebsite,
         data: Any,
-        keyword_terms: List[str],
-        keywords: str,
+        phrase_matcher: PhraseMatcher,
     ) -> Tuple[List[dict], int, int, str]:
-        job_list = self._get_nested_data(data, website.api_jobs_path)
+        job_list = compile_accessor(website.api_jobs_path)(data)
         if not job_list or not isinstance(job_list, list):
             return [], 0, 0, f"No job list found at path '{website.api_jobs_path}'"
 
         payload_jobs_count = len(job_list)
         matched_jobs_count = 0
         job_entries = []
+        extract = self._item_extractor(website)
 
         for item in job_list:
-            job_entry = self._build_job_entry(website, item, keyword_terms)
+            job_entry = self._build_job_entry(
+                website, item, phrase_matcher, extract
+            )
             if job_entry is None:
                 continue
             matched_jobs_count += 1
@@ -145,25 +310,69 @@ class ApiScraper:
 
         return job_entries, payload_jobs_count, matched_jobs_count, ""
 
-    def _build_job_entry(self, website: CustomWebsite, item: Any, keyword_terms: List[str]) -> Optional[dict]:
+    def _stream_job_entries(
+        self,
+        website: CustomWebsite,
+        response: Response,
+        phrase_matcher: PhraseMatcher,
+        artifact: Any,
+    ) -> Tuple[List[dict], int, int, str]:
+        """Match items as the body arrives; raw bytes go gzipped to ``artifact``."""
+        payload_jobs_count = 0
+        job_entries = []
+        extract = self._item_extractor(website)
         try:
-            job_data = {
-                "title": self._get_val(item, website.api_title_key),
-                "company": self._get_val(item, website.api_company_key),
-                "location": self._get_val(item, website.api_location_key),
-                "description": self._get_val(item, website.api_description_key),
-                "source_url": self._get_val(item, website.api_url_key),
-            }
+            with gzip.GzipFile(fileobj=artifact, mode="wb") as sink:
+                chunks = response.iter_content(chunk_size=STREAM_CHUNK_BYTES)
+                for item in iter_json_items(chunks, website.api_jobs_path, sink):
+                    payload_jobs_count += 1
+                    job_entry = self._build_job_entry(
+                        website, item, phrase_matcher, extract
+                    )
+                    if job_entry is not None:
+                        job_entries.append(job_entry)
+        except Exception as exc:
+            return [], payload_jobs_count, 0, f"API Request Failed: {exc}"
+        finally:
+            response.close()
+
+        if not payload_jobs_count:
+            return [], 0, 0, f"No job list found at path '{website.api_jobs_path}'"
+        return job_entries, payload_jobs_count, len(job_entries), ""
+
+    def _item_extractor(self, website: CustomWebsite) -> Callable[[Any], tuple]:
+        """Compiled ``(title, company, location, description, url)`` reader."""
+        return compile_extractor(
+            (
+                website.api_title_key,
+                website.api_company_key,
+                website.api_location_key,
+                website.api_description_key,
+                website.api_url_key,
+            )
+        )
+
+    def _build_job_entry(
+        self,
+        website: CustomWebsite,
+        item: Any,
+        phrase_matcher: PhraseMatcher,
+        extract: Callable[[Any], tuple],
+    ) -> Optional[dict]:
+        try:
+            job_data = dict(zip(API_ITEM_FIELDS, extract(item)))
 
             if not job_data["title"] or not job_data["source_url"]:
                 return None
 
-            searchable_text = (
-                job_data["title"] + " " + job_data["description"]
-            ).lower()
-            if keyword_terms and not all(
-                term in searchable_text for term in keyword_terms
-            ):
+            # An item matches when every term of at least one phrase appears.
+            matched_terms = [
+                phrase_matcher.phrase_terms[index]
+                for index in phrase_matcher.matches(
+                    job_data["title"] + " " + job_data["description"]
+                )
+            ]
+            if not matched_terms:
                 return None
 
             return {
@@ -174,7 +383,11 @@ class ApiScraper:
                     "location": job_data["location"].strip(),
                     "source_website": website.name,
                     "description": job_data["description"],
-                    "is_rfp": ("contract" in keyword_terms or "rfp" in keyword_terms),
+                    "is_rfp": any(
+                        marker in terms
+                        for terms in matched_terms
+                        for marker in RFP_MARKERS
+                    ),
                 },
             }
         except Exception:
@@ -185,17 +398,6 @@ class ApiScraper:
             )
             return None
 
-    def _save_jobs(self, job_entries: List[dict]) -> List[Job]:
-        saved_jobs = []
-        for job_entry in job_entries:
-            job, created = Job.objects.update_or_create(
-                source_url=job_entry["source_url"],
-                defaults=job_entry["defaults"],
-            )
-            if created:
-                saved_jobs.append(job)
-        return saved_jobs
-
     def _finalize_error_message(
         self,
         error_msg: str,
@@ -219,6 +421,7 @@ class ApiScraper:
         jobs_found: int,
         error_message: str,
         json_dump: str,
+        artifact: Any = None,
     ) -> None:
         log = ScraperExecutionLog.objects.create(
             website=website,
@@ -227,8 +430,15 @@ class ApiScraper:
             error_message=error_message,
         )
 
-        if json_dump:
-            timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if artifact is not None:
+            artifact.seek(0)
+            log.html_dump.save(
+                f"{website.name}_api_{timestamp_str}.json.gz",
+                File(artifact),
+                save=True,
+            )
+        elif json_dump:
             log.html_dump.save(
                 f"{website.name}_api_{timestamp_str}.json",
                 ContentFile(json_dump.encode("utf-8")),
@@ -255,19 +465,3 @@ class ApiScraper:
             int((time.monotonic() - started_at) * 1000),
             has_error,
         )
-
-    def _get_nested_data(self, data: Any, path: str) -> Any:
-        if not path:
-            return data
-        keys = path.split(".")
-        for key in keys:
-            if isinstance(data, dict):
-                data = data.get(key)
-            else:
-                return None
-        return data
-
-    def _get_val(self, item: Any, key: str) -> str:
-        if not key:
-            return ""
-        return str(self._get_nested_data(item, key) or "")
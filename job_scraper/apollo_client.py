@@ -7,6 +7,7 @@ from django.core.cache import cache
 
 import requests
 
+from .http_sessions import get_session
 from .models import Contact
 
 logger = logging.getLogger(__name__)
@@ -122,7 +123,9 @@ class ApolloClient:
             "X-Api-Key": self.api_key,
         }
 
-        response = requests.post(endpoint, params=params, headers=headers, timeout=10)
+        response = get_session("apollo").post(
+            endpoint, params=params, headers=headers, timeout=10
+        )
         response.raise_for_status()
         payload = response.json()
         people = self._extract_people(payload)
@@ -147,7 +150,9 @@ class ApolloClient:
             "reveal_phone_number": False,
         }
 
-        response = requests.post(endpoint, json=payload, headers=headers, timeout=15)
+        response = get_session("apollo").post(
+            endpoint, json=payload, headers=headers, timeout=15
+        )
         response.raise_for_status()
         data = response.json()
         people = self._extract_people(data)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class JobScraperConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "job_scraper"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+import requests
+
+from .rate_limiter import async_throttle, url_domain
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+
+def async_engine_available() -> bool:
+    return aiohttp is not None
+
+
+class AsyncResponse:
+    """The subset of ``requests.Response`` the HTML scrapers rely on."""
+
+    def __init__(
+        self, url: str, status_code: int, content: bytes, encoding: Optional[str]
+    ) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def raise_for_status(self) -> None:
+        if 400 <= self.status_code < 600:
+            raise requests.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+
+class AsyncFetchEngine:
+    """Shared aiohttp session with a per-host concurrency cap.
+
+    Rate-limit waits are awaited while holding the host slot, so pacing
+    towards one host matches the blocking scraper while other hosts keep
+    fetching.
+    """
+
+    def __init__(
+        self,
+        headers: Dict[str, str],
+        per_host_limit: Optional[int] = None,
+        max_connections: Optional[int] = None,
+    ) -> None:
+        self.headers = dict(headers)
+        self.per_host_limit = per_host_limit or settings.REQUEST_ASYNC_PER_HOST_LIMIT
+        self.max_connections = max_connections or settings.REQUEST_ASYNC_MAX_CONNECTIONS
+        self._session = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "AsyncFetchEngine":
+        self._session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(limit=self.max_connections),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._session.close()
+        self._session = None
+
+    async def fetch(
+        self, url: str, timeout: float, rate_per_minute: Optional[float] = None
+    ) -> AsyncResponse:
+        async with self._host_slot(url):
+            await async_throttle(url, rate_per_minute)
+            async with self._session.get(
+                url, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                content = await response.read()
+                return AsyncResponse(
+                    str(response.url), response.status, content, response.charset
+                )
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = url_domain(url)
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_slots[host]
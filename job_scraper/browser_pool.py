@@ -0,0 +1,149 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_active_pool = None
+
+
+def install_browser_pool(pool: Optional["BrowserPool"]) -> None:
+    """Make ``pool`` the process-wide pool used by ``StealthScraper``."""
+    global _active_pool
+    _active_pool = pool
+
+
+def get_browser_pool() -> Optional["BrowserPool"]:
+    return _active_pool
+
+
+class PooledBrowser:
+    """A started SeleniumBase session plus the bookkeeping the pool needs."""
+
+    def __init__(self, manager: Any, driver: Any) -> None:
+        self.manager = manager
+        self.driver = driver
+        self.pages = 0
+        self.warmed = False
+        self.started_at = time.monotonic()
+
+
+class BrowserPool:
+    """Long-lived UC browsers that stealth scrapes lease and hand back.
+
+    ``factory`` returns an un-entered ``SB(...)`` context manager. Browsers
+    are started lazily up to ``size``, health-checked on every lease and
+    recycled after ``max_pages`` page loads, after ``max_age_seconds`` or
+    when a scrape reports an invalid session.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        max_age_seconds: Optional[int] = None,
+    ) -> None:
+        self.factory = factory
+        self.size = max(1, size or settings.STEALTH_POOL_SIZE)
+        self.max_pages = max_pages or settings.STEALTH_POOL_MAX_PAGES
+        self.max_age_seconds = max_age_seconds or settings.STEALTH_POOL_MAX_AGE_SECONDS
+        self._idle: List[PooledBrowser] = []
+        self._started = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def lease(self) -> PooledBrowser:
+        while True:
+            with self._condition:
+                while not self._idle and self._started >= self.size:
+                    if self._closed:
+                        raise RuntimeError("Browser pool is closed")
+                    self._condition.wait()
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                browser = self._idle.pop() if self._idle else None
+                if browser is None:
+                    self._started += 1
+
+            if browser is None:
+                return self._start_browser()
+            if self._is_healthy(browser):
+                logger.info(
+                    "browser_pool_lease pages=%s age_s=%s",
+                    browser.pages,
+                    int(time.monotonic() - browser.started_at),
+                )
+                return browser
+            self._discard(browser, reason="unhealthy")
+
+    def release(
+        self, browser: PooledBrowser, pages: int = 0, broken: bool = False
+    ) -> None:
+        browser.pages += pages
+        reason = ""
+        if broken:
+            reason = "invalid_session"
+        elif browser.pages >= self.max_pages:
+            reason = "max_pages"
+        elif time.monotonic() - browser.started_at >= self.max_age_seconds:
+            reason = "max_age"
+
+        if reason or self._closed:
+            self._discard(browser, reason=reason or "pool_closed")
+            return
+
+        with self._condition:
+            self._idle.append(browser)
+            self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for browser in idle:
+            self._discard(browser, reason="pool_closed")
+
+    def _start_browser(self) -> PooledBrowser:
+        manager = self.factory()
+        try:
+            driver = manager.__enter__()
+        except Exception:
+            with self._condition:
+                self._started -= 1
+                self._condition.notify()
+            raise
+        logger.info("browser_pool_started started=%s size=%s", self._started, self.size)
+        return PooledBrowser(manager, driver)
+
+    def _is_healthy(self, browser: PooledBrowser) -> bool:
+        try:
+            handles = browser.driver.driver.window_handles
+            # Leftover detail tabs from a failed scrape are closed before reuse.
+            for handle in handles[1:]:
+                browser.driver.driver.switch_to.window(handle)
+                browser.driver.driver.close()
+            browser.driver.switch_to_default_window()
+            return True
+        except Exception:
+            logger.debug("browser_pool_health_check_failed", exc_info=True)
+            return False
+
+    def _discard(self, browser: PooledBrowser, reason: str) -> None:
+        logger.info(
+            "browser_pool_recycle reason=%s pages=%s age_s=%s",
+            reason,
+            browser.pages,
+            int(time.monotonic() - browser.started_at),
+        )
+        try:
+            browser.manager.__exit__(None, None, None)
+        except Exception:
+            logger.debug("browser_pool_quit_failed", exc_info=True)
+        with self._condition:
+            self._started -= 1
+            self._condition.notify()
@@ -0,0 +1,270 @@
+"""Heuristic enrichment of scraped jobs from their description text.
+
+Every vocabulary (job types, experience levels, industries, requirement and
+section headers, expertise tags) is compiled into one automaton at import,
+and the salary patterns are compiled once. Enriching a description is a
+single scan of its lowercased text plus the salary search, so adding a
+category only adds terms to the automaton, not another pass.
+"""
+
+import bisect
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .keyword_matcher import KeywordMatcher
+from .utils import parse_location_components
+
+JOB_TYPES = (
+    "full-time",
+    "part-time",
+    "contract",
+    "temporary",
+    "internship",
+    "freelance",
+)
+EXPERIENCE_LEVELS = {
+    "entry-level": ("entry level", "junior", "0-2 years", "1-2 years"),
+    "mid-level": ("mid level", "intermediate", "3-5 years", "2-5 years"),
+    "senior": ("senior", "lead", "5+ years", "7+ years", "experienced"),
+    "executive": ("executive", "director", "manager", "head of", "chief"),
+}
+INDUSTRIES = (
+    "technology",
+    "healthcare",
+    "finance",
+    "education",
+    "retail",
+    "manufacturing",
+    "consulting",
+    "marketing",
+    "sales",
+    "engineering",
+    "software",
+    "logistics",
+)
+REQUIREMENT_HEADERS = (
+    "requirements",
+    "qualifications",
+    "skills",
+    "experience",
+    "must have",
+    "should have",
+    "preferred",
+    "minimum",
+    "what you need",
+    "what you'll bring",
+    "what we are looking for",
+    "what we're looking for",
+    "your profile",
+    "who you are",
+)
+SECTION_STOPS = ("benefits", "what we offer", "perks", "equal opportunity")
+# Term -> tag stored in Job.expertise_tags. Only whole-word occurrences
+# count, so "java" in "javascript" or "react" in "reactive" do not.
+EXPERTISE_TAGS = {
+    "python": "Python",
+    "django": "Django",
+    "flask": "Flask",
+    "fastapi": "FastAPI",
+    "javascript": "JavaScript",
+    "typescript": "TypeScript",
+    "react": "React",
+    "vue": "Vue",
+    "angular": "Angular",
+    "node.js": "Node.js",
+    "nodejs": "Node.js",
+    "java": "Java",
+    "kotlin": "Kotlin",
+    "swift": "Swift",
+    "flutter": "Flutter",
+    "c#": "C#",
+    "c++": "C++",
+    ".net": ".NET",
+    "asp.net": ".NET",
+    "golang": "Go",
+    "rust": "Rust",
+    "ruby": "Ruby",
+    "rails": "Rails",
+    "php": "PHP",
+    "laravel": "Laravel",
+    "sql": "SQL",
+    "postgresql": "PostgreSQL",
+    "mysql": "MySQL",
+    "mongodb": "MongoDB",
+    "redis": "Redis",
+    "graphql": "GraphQL",
+    "aws": "AWS",
+    "azure": "Azure",
+    "gcp": "GCP",
+    "docker": "Docker",
+    "kubernetes": "Kubernetes",
+    "terraform": "Terraform",
+    "linux": "Linux",
+    "machine learning": "Machine Learning",
+    "data science": "Data Science",
+    "pandas": "Pandas",
+    "spark": "Spark",
+    "tableau": "Tableau",
+    "salesforce": "Salesforce",
+    "figma": "Figma",
+}
+
+SALARY_PATTERNS = (
+    re.compile(
+        r"(\$[\d,]+(?:\.\d{2})?(?:\s*(?:-|to)\s*\$[\d,]+(?:\.\d{2})?)?(?:\s*(?:a|per|/)\s*(?:year|yr|month|mo|hour|hr|week|wk|annually|k))?)",
+        re.IGNORECASE,
+    ),
+    # EUR/GBP only when no dollar amount is given.
+    re.compile(
+        r"((?:€|£)[\d,]+(?:\.\d{2})?(?:\s*(?:-|to)\s*(?:€|£)[\d,]+(?:\.\d{2})?)?(?:\s*(?:a|per|/)\s*(?:year|yr|month|mo|hour|hr|week|wk|annually|k))?)",
+        re.IGNORECASE,
+    ),
+)
+_NUMBERED_ITEM = re.compile(r"^\d+\.")
+_BULLETS = ("•", "-", "*", "·", "✓", "o ")
+# Categories whose line numbers matter (requirements section boundaries).
+_LINE_CATEGORIES = {"requirements", "section_stop"}
+
+DEFAULT_JOB_TYPE = "Full-time"
+DEFAULT_EXPERIENCE_LEVEL = "Mid-level"
+DEFAULT_INDUSTRY = "Technology"
+
+_EXPERTISE_TERMS: Dict[str, List[str]] = {}
+for _term, _tag in EXPERTISE_TAGS.items():
+    _EXPERTISE_TERMS.setdefault(_tag, []).append(_term)
+
+_MATCHER = KeywordMatcher(
+    {
+        **{("job_type", term): (term,) for term in JOB_TYPES},
+        **{("industry", term): (term,) for term in INDUSTRIES},
+        **{
+            ("experience_level", level): terms
+            for level, terms in EXPERIENCE_LEVELS.items()
+        },
+        ("requirements", None): REQUIREMENT_HEADERS,
+        ("section_stop", None): SECTION_STOPS,
+        **{("expertise", tag): terms for tag, terms in _EXPERTISE_TERMS.items()},
+    }
+)
+
+
+def enrich_description(description: str) -> Dict[str, str]:
+    """Requirements, salary, job type, experience, industry and expertise tags."""
+    description = description or ""
+    lowered = description.lower()
+    line_starts = [0]
+    position = lowered.find("\n")
+    while position != -1:
+        line_starts.append(position + 1)
+        position = lowered.find("\n", position + 1)
+
+    found: Set[Any] = set()
+    lines: Dict[str, Set[int]] = {category: set() for category in _LINE_CATEGORIES}
+    tags: Dict[str, int] = {}
+    for start, end, (category, value) in _MATCHER.iter_labelled(lowered):
+        if category == "expertise":
+            if _whole_word(lowered, start, end) and (
+                value not in tags or start < tags[value]
+            ):
+                tags[value] = start
+        elif category in _LINE_CATEGORIES:
+            lines[category].add(bisect.bisect_right(line_starts, start) - 1)
+        else:
+            found.add((category, value))
+
+    return {
+        "requirements": _requirements(description, lines),
+        "salary": extract_salary(description),
+        "job_type": _first_found(found, "job_type", JOB_TYPES, DEFAULT_JOB_TYPE),
+        "experience_level": _first_found(
+            found, "experience_level", EXPERIENCE_LEVELS, DEFAULT_EXPERIENCE_LEVEL
+        ),
+        "industry": _first_found(found, "industry", INDUSTRIES, DEFAULT_INDUSTRY),
+        "expertise_tags": ", ".join(sorted(tags, key=tags.__getitem__)),
+    }
+
+
+def enrich_descriptions(descriptions: Iterable[str]) -> List[Dict[str, str]]:
+    """``enrich_description`` for each description; repeats are scanned once."""
+    seen: Dict[str, Dict[str, str]] = {}
+    results = []
+    for description in descriptions:
+        description = description or ""
+        if description not in seen:
+            seen[description] = enrich_description(description)
+        results.append(dict(seen[description]))
+    return results
+
+
+def enrich_job_data(
+    job_data: Dict[str, Any],
+    description: str,
+    heuristics: Optional[Dict[str, str]] = None,
+    geo: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Fill location parts and heuristic fields of a scraped job in place.
+
+    Scraped requirements, salary and expertise tags are kept. ``heuristics``
+    and ``geo`` are precomputed ``enrich_description`` and
+    ``parse_location_components`` results (from the batch APIs).
+    """
+    if geo is None:
+        geo = parse_location_components(job_data.get("location", ""))
+    job_data["city"] = geo["city"]
+    job_data["country"] = geo["country"]
+    job_data["continent"] = geo["continent"]
+
+    if heuristics is None:
+        heuristics = enrich_description(description)
+    for field in ("requirements", "salary", "expertise_tags"):
+        if not job_data.get(field) and description:
+            job_data[field] = heuristics[field]
+    for field in ("job_type", "experience_level", "industry"):
+        job_data[field] = heuristics[field]
+    return job_data
+
+
+def extract_salary(description: str) -> str:
+    """First salary figure such as ``$100,000 - $120,000`` in the text."""
+    for pattern in SALARY_PATTERNS:
+        match = pattern.search(description)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def _requirements(description: str, lines: Dict[str, Set[int]]) -> str:
+    header_lines = lines["requirements"]
+    stop_lines = lines["section_stop"]
+    if not header_lines:
+        return ""
+
+    requirements_lines = []
+    in_requirements = False
+    for line_number, line in enumerate(description.split("\n")):
+        # Stop if we hit benefits or other sections
+        if line_number in stop_lines:
+            in_requirements = False
+        if line_number in header_lines:
+            in_requirements = True
+            continue  # Skip the header line itself
+        line = line.strip()
+        if in_requirements and line:
+            if line.startswith(_BULLETS) or _NUMBERED_ITEM.match(line):
+                requirements_lines.append(line)
+    return "\n".join(requirements_lines)
+
+
+def _first_found(
+    found: Set[Any], category: str, order: Iterable[str], default: str
+) -> str:
+    for value in order:
+        if (category, value) in found:
+            return value.title()
+    return default
+
+
+def _whole_word(lowered: str, start: int, end: int) -> bool:
+    return not (start > 0 and lowered[start - 1].isalnum()) and not (
+        end < len(lowered) and lowered[end].isalnum()
+    )
@@ -0,0 +1,119 @@
+"""Offline city and region gazetteer for location normalization.
+
+The bundled ``data/cities.txt`` table is loaded once, on first use, into
+parallel arrays (canonical city name and country id per row) plus one dict
+from every normalized spelling to its row, so a lookup is a single hash
+probe and a few hundred cities cost well under a megabyte.
+"""
+
+import functools
+import re
+import unicodedata
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CITIES_PATH = Path(__file__).resolve().parent / "data" / "cities.txt"
+
+# Normalized region name -> continent.
+REGION_SYNONYMS = {
+    "europe": "Europe",
+    "eu": "Europe",
+    "eea": "Europe",
+    "emea": "Europe",
+    "dach": "Europe",
+    "benelux": "Europe",
+    "nordics": "Europe",
+    "scandinavia": "Europe",
+    "baltics": "Europe",
+    "western europe": "Europe",
+    "central europe": "Europe",
+    "eastern europe": "Europe",
+    "northern europe": "Europe",
+    "southern europe": "Europe",
+    "cee": "Europe",
+    "uk&i": "Europe",
+    "north america": "North America",
+    "noram": "North America",
+    "us & canada": "North America",
+    "usa & canada": "North America",
+    "latam": "South America",
+    "latin america": "South America",
+    "south america": "South America",
+    "apac": "Asia",
+    "asia": "Asia",
+    "asia pacific": "Asia",
+    "southeast asia": "Asia",
+    "middle east": "Asia",
+    "mena": "Asia",
+    "africa": "Africa",
+    "sub-saharan africa": "Africa",
+    "oceania": "Oceania",
+    "anz": "Oceania",
+}
+
+# Work-arrangement words that carry no place information.
+_ARRANGEMENT_RE = re.compile(
+    r"\b(?:fully\s+remote|remote|hybrid|on-?site|in-?office|anywhere|worldwide)\b",
+    re.IGNORECASE,
+)
+# Commas, slashes, pipes, brackets and spaced dashes separate place names;
+# "Winston-Salem" or "Aix-en-Provence" stay whole.
+_PART_SPLIT_RE = re.compile(r"[,;/|()\[\]]|\s[-–—]\s?|[-–—]\s")
+_PART_STRIP = " \t-–—:.*"
+# Filler left in front of a place once the arrangement word is gone:
+# "Anywhere in the US", "Remote within Germany". A capitalised "The" is part
+# of the name ("in The Hague").
+_LEADING_FILLER_RE = re.compile(r"^(?i:in|within|across)\s+(?:the\s+)?")
+
+
+def normalize_place(text: str) -> str:
+    """Casefolded, accent- and dot-free, single-spaced form used as a key."""
+    decomposed = unicodedata.normalize("NFKD", text.replace(".", ""))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def location_parts(location_text: str) -> List[str]:
+    """Place names in a location string, without remote/hybrid markers."""
+    cleaned = _ARRANGEMENT_RE.sub(" ", location_text or "")
+    parts = (part.strip(_PART_STRIP) for part in _PART_SPLIT_RE.split(cleaned))
+    parts = (_LEADING_FILLER_RE.sub("", part) for part in parts)
+    return [part for part in parts if part]
+
+
+def region_continent(key: str) -> Optional[str]:
+    """Continent for a normalized region synonym such as ``emea``."""
+    return REGION_SYNONYMS.get(key)
+
+
+def lookup_city(key: str) -> Optional[Tuple[str, str]]:
+    """``(canonical city, alpha-2 country)`` for a normalized city name."""
+    names, country_ids, country_codes, index = _cities()
+    row = index.get(key)
+    if row is None:
+        return None
+    return names[row], country_codes[country_ids[row]]
+
+
+@functools.lru_cache(maxsize=1)
+def _cities() -> Tuple[Tuple[str, ...], array, Tuple[str, ...], Dict[str, int]]:
+    names: List[str] = []
+    country_ids = array("B")
+    country_codes: List[str] = []
+    index: Dict[str, int] = {}
+    with CITIES_PATH.open(encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            code, _, entries = line.partition(" ")
+            country_codes.append(code)
+            for entry in entries.split("|"):
+                spellings = [spelling.strip() for spelling in entry.split("=")]
+                row = len(names)
+                names.append(spellings[0])
+                country_ids.append(len(country_codes) - 1)
+                for spelling in spellings:
+                    index.setdefault(normalize_place(spelling), row)
+    return tuple(names), country_ids, tuple(country_codes), index
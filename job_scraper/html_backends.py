@@ -0,0 +1,176 @@
+"""Interchangeable HTML parser backends behind one small node API.
+
+``parse_html`` returns a node with ``select``, ``select_one``, ``text`` and
+``attr``, whichever tree builder produced it:
+
+- ``html.parser``: BeautifulSoup with the stdlib parser (always available).
+- ``lxml``: BeautifulSoup on the lxml tree builder. Builds the tree faster
+  and copes better with broken markup, but selectors still run in soupsieve.
+- ``selectolax``: the lexbor engine, which both builds and matches in C
+  (roughly 10x faster on large result pages), but it only understands
+  standard CSS, so soupsieve extensions such as ``:-soup-contains`` fail.
+
+A backend whose package is not installed falls back to ``html.parser``.
+Selectors may be plain strings or patterns from ``compile_selector``.
+"""
+
+import logging
+from typing import Any, List, Optional, Union
+
+import soupsieve
+from bs4 import BeautifulSoup, UnicodeDammit
+
+try:
+    import lxml  # noqa: F401 - BeautifulSoup's "lxml" tree builder needs it
+except ImportError:  # pragma: no cover - optional dependency
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
+
+logger = logging.getLogger(__name__)
+
+PARSER_HTML = "html.parser"
+PARSER_LXML = "lxml"
+PARSER_SELECTOLAX = "selectolax"
+PARSER_CHOICES = (
+    (PARSER_HTML, "html.parser (stdlib)"),
+    (PARSER_LXML, "lxml"),
+    (PARSER_SELECTOLAX, "selectolax (lexbor)"),
+)
+
+_warned_unavailable = set()
+
+
+def parser_available(parser: str) -> bool:
+    if parser == PARSER_HTML:
+        return True
+    if parser == PARSER_LXML:
+        return lxml is not None
+    if parser == PARSER_SELECTOLAX:
+        return LexborHTMLParser is not None
+    return False
+
+
+def resolve_parser(parser: str) -> str:
+    """``parser`` if it can be used here, otherwise ``html.parser``."""
+    parser = (parser or PARSER_HTML).strip().lower()
+    if parser_available(parser):
+        return parser
+    if parser not in _warned_unavailable:
+        _warned_unavailable.add(parser)
+        logger.warning(
+            "html_parser_unavailable parser=%s fallback=%s", parser, PARSER_HTML
+        )
+    return PARSER_HTML
+
+
+def compile_selector(selector: str, parser: str = PARSER_HTML) -> Any:
+    """``selector`` precompiled for ``parser`` where the backend supports it.
+
+    soupsieve patterns are compiled here once; selectolax takes plain
+    strings. An invalid selector is returned unchanged so it still fails per
+    card, as an uncompiled one would.
+    """
+    if not selector or resolve_parser(parser) == PARSER_SELECTOLAX:
+        return selector
+    try:
+        return soupsieve.compile(selector)
+    except soupsieve.SelectorSyntaxError:
+        return selector
+
+
+def parse_html(
+    content: Union[bytes, str], parser: str = PARSER_HTML, parse_only: Any = None
+) -> Any:
+    """Parse ``content`` into the root node of the chosen backend.
+
+    ``parse_only`` is a ``SoupStrainer`` limiting which subtrees BeautifulSoup
+    builds; selectolax always builds the whole (cheap) tree and ignores it.
+    """
+    parser = resolve_parser(parser)
+    if parser == PARSER_SELECTOLAX:
+        if isinstance(content, bytes):
+            # Same encoding sniffing (BOM, <meta charset>) BeautifulSoup does.
+            content = UnicodeDammit(content, is_html=True).unicode_markup or ""
+        tree = LexborHTMLParser(content)
+        # BeautifulSoup leaves script and style text out of get_text().
+        tree.strip_tags(["script", "style"])
+        return LexborNode(tree.root) if tree.root is not None else EmptyNode()
+    return SoupNode(BeautifulSoup(content, parser, parse_only=parse_only))
+
+
+class SoupNode:
+    __slots__ = ("_tag",)
+
+    def __init__(self, tag: Any) -> None:
+        self._tag = tag
+
+    def select(self, selector: Any) -> List["SoupNode"]:
+        return [SoupNode(tag) for tag in self._tag.select(selector)]
+
+    def select_one(self, selector: Any) -> Optional["SoupNode"]:
+        tag = self._tag.select_one(selector)
+        return SoupNode(tag) if tag is not None else None
+
+    def text(self, strip: bool = False) -> str:
+        return self._tag.get_text(strip=strip)
+
+    def attr(self, name: str) -> Optional[str]:
+        value = self._tag.get(name)
+        return " ".join(value) if isinstance(value, list) else value
+
+    def text_with_breaks(self) -> str:
+        """Text with ``<br>`` and paragraph ends kept as newlines."""
+        for br in self._tag.find_all("br"):
+            br.replace_with("\n")
+        for p in self._tag.find_all("p"):
+            p.append("\n")
+        return self._tag.get_text()
+
+
+class LexborNode:
+    __slots__ = ("_node",)
+
+    def __init__(self, node: Any) -> None:
+        self._node = node
+
+    def select(self, selector: Any) -> List["LexborNode"]:
+        return [LexborNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector: Any) -> Optional["LexborNode"]:
+        node = self._node.css_first(selector)
+        return LexborNode(node) if node is not None else None
+
+    def text(self, strip: bool = False) -> str:
+        return self._node.text(strip=strip)
+
+    def attr(self, name: str) -> Optional[str]:
+        return self._node.attributes.get(name)
+
+    def text_with_breaks(self) -> str:
+        # Only the description subtree is re-parsed, which stays cheap.
+        return SoupNode(
+            BeautifulSoup(self._node.html or "", PARSER_HTML)
+        ).text_with_breaks()
+
+
+class EmptyNode:
+    """Root of a document with nothing to parse."""
+
+    def select(self, selector: Any) -> list:
+        return []
+
+    def select_one(self, selector: Any) -> None:
+        return None
+
+    def text(self, strip: bool = False) -> str:
+        return ""
+
+    def attr(self, name: str) -> None:
+        return None
+
+    def text_with_breaks(self) -> str:
+        return ""
@@ -0,0 +1,93 @@
+"""Process-wide HTTP sessions sharing one set of keep-alive connection pools.
+
+Every named session mounts the same ``HTTPAdapter``, so the request scraper,
+the API scraper and the Apollo client reuse a TCP+TLS connection per host
+instead of handshaking on every call, while each keeps its own headers.
+Connect errors are retried with backoff; read errors and HTTP statuses are
+left to the callers (and the adaptive pacing) to handle.
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+from django.conf import settings
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import brotli  # noqa: F401 - urllib3 decodes "br" when it is importable
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+_sessions: Dict[str, requests.Session] = {}
+_adapter: Optional[HTTPAdapter] = None
+_owner_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def accept_encoding() -> str:
+    return "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+
+def get_session(
+    name: str = "default", headers: Optional[Dict[str, str]] = None
+) -> requests.Session:
+    """Shared session for ``name``; ``headers`` apply when it is first created.
+
+    Sessions are rebuilt after a fork, since pooled sockets must not be
+    shared between processes.
+    """
+    global _adapter, _owner_pid
+    with _lock:
+        if _owner_pid != os.getpid():
+            _sessions.clear()
+            _adapter = None
+            _owner_pid = os.getpid()
+        if _adapter is None:
+            _adapter = _build_adapter()
+        session = _sessions.get(name)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", _adapter)
+            session.mount("http://", _adapter)
+            session.headers["Accept-Encoding"] = accept_encoding()
+            session.headers.update(headers or {})
+            _sessions[name] = session
+            logger.debug("http_session_created name=%s", name)
+        return session
+
+
+def close_sessions() -> None:
+    global _adapter
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+        adapter, _adapter = _adapter, None
+    for session in sessions:
+        session.close()
+    if adapter is not None:
+        adapter.close()
+
+
+def _build_adapter() -> HTTPAdapter:
+    retry = Retry(
+        total=settings.HTTP_CONNECT_RETRIES,
+        connect=settings.HTTP_CONNECT_RETRIES,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=settings.HTTP_RETRY_BACKOFF_SECONDS,
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=settings.HTTP_POOL_HOSTS,
+        pool_maxsize=settings.HTTP_POOL_CONNECTIONS_PER_HOST,
+        max_retries=retry,
+    )
@@ -0,0 +1,105 @@
+"""Conditional GETs backed by stored ETag / Last-Modified validators.
+
+``conditional_get`` sends ``If-None-Match`` / ``If-Modified-Since`` when a
+URL has validators on record. Callers check ``is_not_modified`` and skip
+parsing and saving on a 304; the stored body is put back on the response
+for the rare caller that still needs the content. Validators are only
+recorded through ``remember_validators`` once the caller has accepted the
+page, so a challenge page is never pinned as "unchanged".
+
+Validators are keyed on the URL plus an optional ``scope``: callers whose
+result depends on more than the body (an API feed matched against a phrase
+set) pass one, so a 304 only skips work that was done for the same scope.
+"""
+
+import hashlib
+import logging
+import zlib
+from typing import Any
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import HttpValidatorCache
+
+logger = logging.getLogger(__name__)
+
+
+def conditional_get(client: Any, url: str, scope: str = "", **kwargs: Any) -> Any:
+    """``client.get(url, **kwargs)`` with validators added when we have them.
+
+    ``client`` is anything with a requests-style ``get``: a ``Session`` or
+    the ``requests`` module itself.
+    """
+    if not settings.HTTP_CONDITIONAL_REQUESTS_ENABLED:
+        return client.get(url, **kwargs)
+
+    entry = HttpValidatorCache.objects.filter(url_hash=_url_hash(url, scope)).first()
+    if entry is not None:
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        kwargs["headers"] = headers
+
+    response = client.get(url, **kwargs)
+    if entry is not None and is_not_modified(response):
+        HttpValidatorCache.objects.filter(pk=entry.pk).update(
+            not_modified_count=F("not_modified_count") + 1,
+            checked_at=timezone.now(),
+        )
+        if entry.body:
+            response._content = zlib.decompress(bytes(entry.body))
+            response.encoding = entry.encoding or None
+        logger.info("http_not_modified url=%s", url)
+    return response
+
+
+def is_not_modified(response: Any) -> bool:
+    return getattr(response, "status_code", None) == 304
+
+
+def remember_validators(
+    url: str, response: Any, store_body: bool = True, scope: str = ""
+) -> bool:
+    """Store the response's validators and body for the next conditional GET.
+
+    Pass ``store_body=False`` for streamed responses, whose body is gone, and
+    the same ``scope`` that was given to ``conditional_get``.
+    """
+    if not settings.HTTP_CONDITIONAL_REQUESTS_ENABLED:
+        return False
+    if getattr(response, "status_code", None) != 200:
+        return False
+    etag = response.headers.get("ETag", "")
+    last_modified = response.headers.get("Last-Modified", "")
+    if not isinstance(etag, str) or not isinstance(last_modified, str):
+        return False
+    if not etag and not last_modified:
+        return False
+
+    body = b""
+    content = (response.content or b"") if store_body else b""
+    if content and len(content) <= settings.HTTP_VALIDATOR_CACHE_MAX_BODY_BYTES:
+        body = zlib.compress(content)
+    now = timezone.now()
+    HttpValidatorCache.objects.update_or_create(
+        url_hash=_url_hash(url, scope),
+        defaults={
+            "url": url,
+            "etag": etag[:512],
+            "last_modified": last_modified[:128],
+            "body": body,
+            "encoding": response.encoding or "",
+            "fetched_at": now,
+            "checked_at": now,
+        },
+    )
+    return True
+
+
+def _url_hash(url: str, scope: str = "") -> str:
+    key = f"{url}\n{scope}" if scope else url
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
@@ -0,0 +1,93 @@
+"""Batched persistence of scraped jobs.
+
+``upsert_jobs`` replaces a loop of ``Job.objects.update_or_create`` calls
+(a SELECT plus an INSERT or UPDATE per job, each in its own autocommit
+transaction) with one existence query, one ``bulk_create`` and one
+``bulk_update`` inside a single transaction. Jobs are matched on
+``Job.source_key``, the uniquely indexed hash of the canonical source URL,
+so tracking parameters or host spellings do not create duplicates.
+
+Scrapers running in other threads or processes can insert the same posting
+between the lookup and the insert; the unique key then rejects the batch
+and it is retried, finding the new rows as existing jobs.
+"""
+
+from typing import Any, Dict, Iterable, List
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import Job
+from .url_keys import url_key
+
+# Attempts before a batch that keeps colliding with concurrent inserts fails.
+UPSERT_ATTEMPTS = 3
+
+
+def upsert_jobs(job_entries: Iterable[Dict[str, Any]]) -> List[Job]:
+    """Create or update jobs by canonical source URL; return the created ones.
+
+    Each entry is ``{"source_url": ..., "defaults": {...}}``, as for
+    ``update_or_create``; entries without a URL are skipped since they cannot
+    be de-duplicated. When a URL repeats in the batch the later defaults win,
+    and the job is reported as created at most once. Created jobs come back
+    in the order their URL first appeared.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    source_urls: Dict[str, str] = {}
+    for entry in job_entries:
+        source_key = url_key(entry["source_url"])
+        if source_key is None:
+            continue
+        source_urls.setdefault(source_key, entry["source_url"])
+        merged.setdefault(source_key, {}).update(entry["defaults"])
+    if not merged:
+        return []
+
+    for attempt in range(1, UPSERT_ATTEMPTS + 1):
+        try:
+            created = _upsert_batch(merged, source_urls)
+            break
+        except IntegrityError:
+            if attempt == UPSERT_ATTEMPTS:
+                raise
+
+    if any(job.pk is None for job in created):
+        # Backends that cannot return ids from a bulk insert (e.g. MySQL).
+        created_keys = [job.source_key for job in created]
+        by_key = Job.objects.in_bulk(created_keys, field_name="source_key")
+        created = [by_key[source_key] for source_key in created_keys]
+    return created
+
+
+def _upsert_batch(
+    merged: Dict[str, Dict[str, Any]], source_urls: Dict[str, str]
+) -> List[Job]:
+    with transaction.atomic():
+        existing = Job.objects.in_bulk(list(merged), field_name="source_key")
+
+        to_create = []
+        to_update = []
+        update_fields = {"updated_at"}
+        now = timezone.now()
+        for source_key, defaults in merged.items():
+            job = existing.get(source_key)
+            if job is None:
+                to_create.append(
+                    Job(
+                        source_url=source_urls[source_key],
+                        source_key=source_key,
+                        **defaults,
+                    )
+                )
+                continue
+            update_fields.update(defaults)
+            for field, value in defaults.items():
+                setattr(job, field, value)
+            job.updated_at = now
+            to_update.append(job)
+
+        created = Job.objects.bulk_create(to_create)
+        if to_update:
+            Job.objects.bulk_update(to_update, sorted(update_fields))
+    return created
@@ -0,0 +1,98 @@
+"""Compiled accessors for the JSON field mappings on API websites.
+
+A mapping such as ``api_title_key`` is parsed once into a chain of steps
+instead of being re-split for every item. Supported syntax:
+
+- ``a.b.c``: nested keys.
+- ``items.0.name`` (or ``items[0].name``): list index; negative counts from
+  the end.
+- ``tags[]`` / ``offices[].city``: every element of a list; nested lists are
+  flattened and text fields join the values with ", ".
+- ``title|name``: fallbacks; the first alternative with a non-empty value
+  wins.
+"""
+
+import functools
+import re
+from typing import Any, Callable, List, Sequence, Tuple
+
+_INDEX = re.compile(r"\[(-?\d+)\]")
+_EACH = object()
+_EMPTY = (None, "", [], {})
+
+
+def is_streamable_path(expr: str) -> bool:
+    """Whether an ijson prefix can express ``expr`` (keys and ``[]`` only)."""
+    return "|" not in expr and not any(
+        isinstance(step, int) for step in _compile_steps(expr)
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def compile_accessor(expr: str) -> Callable[[Any], Any]:
+    """Raw value at ``expr``; an empty expression returns the data itself."""
+    alternatives = [
+        _compile_steps(alternative) for alternative in (expr or "").split("|")
+    ]
+
+    def access(data: Any) -> Any:
+        value = None
+        for steps in alternatives:
+            value = _walk(data, steps)
+            if value not in _EMPTY:
+                return value
+        return value
+
+    return access
+
+
+@functools.lru_cache(maxsize=128)
+def compile_extractor(exprs: Tuple[str, ...]) -> Callable[[Any], Tuple[str, ...]]:
+    """One text value per expression for each item; blank expressions give ""."""
+    accessors = [compile_accessor(expr) if expr else None for expr in exprs]
+
+    def extract(item: Any) -> Tuple[str, ...]:
+        return tuple(_as_text(access(item)) if access else "" for access in accessors)
+
+    return extract
+
+
+def _compile_steps(expr: str) -> Tuple[Any, ...]:
+    steps: List[Any] = []
+    for part in _INDEX.sub(r".\1", expr.strip()).split("."):
+        each = part.endswith("[]")
+        key = part[:-2] if each else part
+        if key:
+            steps.append(int(key) if key.lstrip("-").isdigit() else key)
+        if each:
+            steps.append(_EACH)
+    return tuple(steps)
+
+
+def _walk(data: Any, steps: Sequence[Any]) -> Any:
+    for position, step in enumerate(steps):
+        if step is _EACH:
+            if not isinstance(data, list):
+                return None
+            rest = steps[position + 1 :]
+            values = []
+            for element in data:
+                value = _walk(element, rest)
+                if isinstance(value, list):
+                    values.extend(value)
+                elif value not in _EMPTY:
+                    values.append(value)
+            return values
+        if isinstance(data, dict):
+            data = data.get(step if isinstance(step, str) else str(step))
+        elif isinstance(data, list) and isinstance(step, int):
+            data = data[step] if -len(data) <= step < len(data) else None
+        else:
+            return None
+    return data
+
+
+def _as_text(value: Any) -> str:
+    if isinstance(value, list):
+        return ", ".join(_as_text(element) for element in value if element)
+    return str(value or "")
@@ -0,0 +1,63 @@
+"""Incremental JSON reading for large API payloads.
+
+``iter_json_items`` yields the elements of the array at a dotted path while
+the body is still downloading, and copies every byte it reads into a sink
+(the gzip artifact), so neither the raw text nor the full decoded tree is
+ever held in memory.
+"""
+
+from typing import Any, BinaryIO, Iterable, Iterator
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+
+def json_streaming_available() -> bool:
+    return ijson is not None
+
+
+def items_prefix(path: str) -> str:
+    """ijson prefix for the elements of the array at dotted ``path``.
+
+    ``results[].jobs`` walks every element of ``results``, as ijson's
+    ``item`` does.
+    """
+    parts = []
+    for key in (path or "").split("."):
+        each = key.endswith("[]")
+        key = key[:-2] if each else key
+        parts.extend(([key] if key else []) + (["item"] if each else []))
+    return ".".join(parts + ["item"])
+
+
+def iter_json_items(
+    chunks: Iterable[bytes], path: str, sink: BinaryIO
+) -> Iterator[Any]:
+    reader = _TeeReader(iter(chunks), sink)
+    yield from ijson.items(reader, items_prefix(path), use_float=True)
+    # Keep whatever trails the array in the artifact too.
+    reader.drain()
+
+
+class _TeeReader:
+    """File-like view of ``chunks`` that copies every byte read into ``sink``."""
+
+    def __init__(self, chunks: Iterator[bytes], sink: BinaryIO) -> None:
+        self._chunks = chunks
+        self._sink = sink
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to tell bytes from text.
+        if size == 0:
+            return b""
+        for chunk in self._chunks:
+            if chunk:
+                self._sink.write(chunk)
+                return chunk
+        return b""
+
+    def drain(self) -> None:
+        while self.read():
+            pass
@@ -0,0 +1,145 @@
+"""One-pass multi-keyword matching (Aho-Corasick) shared by the scrapers.
+
+Every term of every vocabulary is compiled into a single automaton, and one
+scan of the lowercased text reports all occurrences (overlapping ones
+included). The cost depends on the text length and the number of hits, not
+on how many phrases or vocabulary terms there are. Matching is by substring,
+as the ``term in text`` checks it replaces were.
+
+The C automaton from ``pyahocorasick`` (a pinned requirement) is used when
+it is installed. Without it the fallback is one regular-expression sweep: a
+lookahead alternation, longest term first, reports the longest term starting
+at each position, and the shorter terms that are its prefixes are added from
+a table built once, so overlapping matches are still all reported.
+"""
+
+import bisect
+import re
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+RFP_MARKERS = ("contract", "rfp")
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over labelled vocabularies."""
+
+    def __init__(self, vocabularies: Mapping[Hashable, Iterable[str]]) -> None:
+        labels: Dict[str, List[Hashable]] = {}
+        for label, words in vocabularies.items():
+            for word in words:
+                term = word.lower()
+                if term and label not in labels.setdefault(term, []):
+                    labels[term].append(label)
+        self._labels = {term: tuple(owners) for term, owners in labels.items()}
+        self._automaton = None
+        self._pattern = None
+        if not self._labels:
+            return
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for term in self._labels:
+                automaton.add_word(term, term)
+            automaton.make_automaton()
+            self._automaton = automaton
+            return
+        terms = sorted(self._labels, key=len, reverse=True)
+        self._pattern = re.compile(
+            "(?=(%s))" % "|".join(re.escape(term) for term in terms)
+        )
+        # Every term matching where a longer one does is a prefix of it.
+        self._prefix_terms = {
+            term: [other for other in terms if term.startswith(other)] for term in terms
+        }
+
+    def iter_matches(self, lowered: str) -> Iterator[Tuple[int, str]]:
+        """``(end_index, term)`` for every occurrence in already lowercased text.
+
+        Occurrences come in text order (by end from the automaton, by start
+        from the fallback).
+        """
+        if self._automaton is not None:
+            yield from self._automaton.iter(lowered)
+            return
+        if self._pattern is None:
+            return
+        for match in self._pattern.finditer(lowered):
+            start = match.start()
+            for term in self._prefix_terms[match.group(1)]:
+                yield start + len(term) - 1, term
+
+    def iter_labelled(self, lowered: str) -> Iterator[Tuple[int, int, Hashable]]:
+        """``(start, end, label)`` per occurrence of a term in lowercased text."""
+        for last, term in self.iter_matches(lowered):
+            for label in self._labels[term]:
+                yield last - len(term) + 1, last + 1, label
+
+    def scan(self, text: str) -> Dict[Hashable, Set[str]]:
+        """Terms found in ``text``, grouped by vocabulary label."""
+        found: Dict[Hashable, Set[str]] = {}
+        for _, term in self.iter_matches(text.lower()):
+            for label in self._labels[term]:
+                found.setdefault(label, set()).add(term)
+        return found
+
+    def scan_lines(self, text: str) -> Dict[Hashable, Set[int]]:
+        """Line numbers (of ``text.split("\\n")``) holding a term, per label."""
+        lowered = text.lower()
+        line_starts = [0]
+        position = lowered.find("\n")
+        while position != -1:
+            line_starts.append(position + 1)
+            position = lowered.find("\n", position + 1)
+        lines: Dict[Hashable, Set[int]] = {}
+        for end, term in self.iter_matches(lowered):
+            line = bisect.bisect_right(line_starts, end) - 1
+            for label in self._labels[term]:
+                lines.setdefault(label, set()).add(line)
+        return lines
+
+
+class PhraseMatcher:
+    """Which keyword phrases a text satisfies (every term of the phrase present).
+
+    A phrase without terms matches every text.
+    """
+
+    def __init__(self, phrase_terms: Sequence[Sequence[str]]) -> None:
+        self.phrase_terms = [list(terms) for terms in phrase_terms]
+        self._required = [len(set(terms)) for terms in self.phrase_terms]
+        self._always = [
+            index for index, count in enumerate(self._required) if not count
+        ]
+        self._matcher = KeywordMatcher(dict(enumerate(self.phrase_terms)))
+
+    def matches(self, text: str) -> List[int]:
+        """Indexes of the matched phrases, in phrase order."""
+        found = self._matcher.scan(text)
+        matched = [
+            index
+            for index, terms in found.items()
+            if len(terms) == self._required[index]
+        ]
+        return sorted(self._always + matched)
+
+
+def is_rfp_query(keywords: str) -> bool:
+    """True when the search keywords ask for contracts or RFPs."""
+    return bool(_RFP_MATCHER.scan(keywords or ""))
+
+
+_RFP_MATCHER = KeywordMatcher({"rfp": RFP_MARKERS})
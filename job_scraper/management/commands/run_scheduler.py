@@ -10,9 +10,14 @@ from django_apscheduler import util
 from django_apscheduler.jobstores import DjangoJobStore
 from django_apscheduler.models import DjangoJobExecution
 
-from job_scraper.emailing import send_scheduled_scrape_summary
+from job_scraper.api_scraper import api_fetches_once
+from job_scraper.browser_pool import BrowserPool, install_browser_pool
+from job_scraper.http_sessions import close_sessions
 from job_scraper.management.commands.run_scraper import execute_scrape_run
-from job_scraper.models import ScheduledScrape, ScheduledScrapeRun
+from job_scraper.models import ScheduledScrape, ScheduledScrapeRun, ScrapeWorkUnit
+from job_scraper.parsing import shutdown_parse_pool
+from job_scraper.scheduling import finish_scheduled_run, split_keyword_phrases
+from job_scraper.stealth_scraper import build_session_manager
 from job_scraper.utils import resolve_scrape_location
 
 logger = logging.getLogger(__name__)
@@ -45,33 +50,7 @@ def run_scheduled_scrape(schedule_id):
             max_pages=schedule.max_pages,
             website_ids=website_ids,
         )
-        run.jobs_new = len(new_jobs)
-        run.contacts_found = contacts_found
-        try:
-            run.emails_sent = send_scheduled_scrape_summary(
-                schedule,
-                run,
-                new_jobs,
-                site_domain=settings.SITE_DOMAIN,
-            )
-        except Exception as exc:
-            run.email_error = str(exc)
-            logger.exception(
-                "scheduled_scrape_email_failed schedule_id=%s run_id=%s",
-                schedule.id,
-                run.id,
-            )
-
-        run.completed_at = timezone.now()
-        run.save(
-            update_fields=[
-                "jobs_new",
-                "contacts_found",
-                "emails_sent",
-                "email_error",
-                "completed_at",
-            ]
-        )
+        finish_scheduled_run(schedule, run, new_jobs, contacts_found)
     except Exception:
         if run is not None:
             run.email_error = (
@@ -82,6 +61,50 @@ def run_scheduled_scrape(schedule_id):
         logger.exception("scheduled_scraper_task_failed schedule_id=%s", schedule_id)
 
 
+def enqueue_scheduled_scrape(schedule_id):
+    """Queue one work unit per website x phrase for ``run_workers``."""
+    try:
+        schedule = ScheduledScrape.objects.get(id=schedule_id, is_active=True)
+        location = resolve_scrape_location(
+            countries=schedule.countries,
+            continents=schedule.continents,
+            fallback_location=schedule.location,
+        )
+        phrases = split_keyword_phrases(schedule.keywords)
+        run = ScheduledScrapeRun.objects.create(schedule=schedule)
+
+        units = []
+        for website in schedule.websites.filter(is_active=True):
+            website_phrases = phrases
+            if phrases and api_fetches_once(website):
+                # Fetch-once APIs get a single unit carrying every phrase.
+                website_phrases = [", ".join(phrases)]
+            units.extend(
+                ScrapeWorkUnit(
+                    run=run,
+                    website=website,
+                    phrase=phrase,
+                    location=location,
+                    max_pages=schedule.max_pages,
+                    max_attempts=settings.WORK_QUEUE_MAX_ATTEMPTS,
+                )
+                for phrase in website_phrases
+            )
+        ScrapeWorkUnit.objects.bulk_create(units)
+        logger.info(
+            "scheduled_scrape_enqueued schedule_id=%s run_id=%s units=%s",
+            schedule.id,
+            run.id,
+            len(units),
+        )
+        if not units:
+            finish_scheduled_run(schedule, run, [], 0)
+        return run
+    except Exception:
+        logger.exception("scheduled_scrape_enqueue_failed schedule_id=%s", schedule_id)
+        return None
+
+
 def register_scheduled_scrapes(scheduler):
     for schedule in ScheduledScrape.objects.filter(is_active=True).prefetch_related(
         "websites"
@@ -95,7 +118,11 @@ def register_scheduled_scrapes(scheduler):
             continue
 
         scheduler.add_job(
-            run_scheduled_scrape,
+            (
+                enqueue_scheduled_scrape
+                if settings.SCHEDULER_ENQUEUE_ONLY
+                else run_scheduled_scrape
+            ),
             trigger=CronTrigger.from_crontab(
                 schedule.cron_expression, timezone=schedule.timezone
             ),
@@ -136,6 +163,12 @@ class Command(BaseCommand):
             replace_existing=True,
         )
 
+        browser_pool = None
+        # In enqueue-only mode the workers own the browsers.
+        if settings.STEALTH_POOL_SIZE > 0 and not settings.SCHEDULER_ENQUEUE_ONLY:
+            browser_pool = BrowserPool(build_session_manager)
+            install_browser_pool(browser_pool)
+
         try:
             logger.info("Starting scheduler...")
             scheduler.start()
@@ -143,3 +176,9 @@ class Command(BaseCommand):
             logger.info("Stopping scheduler...")
             scheduler.shutdown()
             logger.info("Scheduler shut down successfully!")
+        finally:
+            shutdown_parse_pool()
+            close_sessions()
+            if browser_pool is not None:
+                install_browser_pool(None)
+                browser_pool.close()
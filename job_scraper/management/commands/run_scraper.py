@@ -4,16 +4,12 @@ import time
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
-from job_scraper.apollo_client import ApolloClient
 from job_scraper.request_scraper import JobScraper
+from job_scraper.scheduling import enrich_new_jobs, split_keyword_phrases
 
 logger = logging.getLogger(__name__)
 
 
-def _split_keyword_phrases(keywords: str) -> list[str]:
-    return [phrase.strip() for phrase in keywords.split(",") if phrase.strip()]
-
-
 def execute_scrape_run(
     *,
     keywords: str,
@@ -29,7 +25,7 @@ def execute_scrape_run(
     website_ids = website_ids or [None]
     limit = settings.DEFAULT_ENRICHMENT_LIMIT if limit is None else limit
     max_pages = settings.DEFAULT_SCRAPE_MAX_PAGES if max_pages is None else max_pages
-    phrases = _split_keyword_phrases(keywords)
+    phrases = split_keyword_phrases(keywords)
 
     logger.info(
         "run_scraper_start keywords=%s phrases=%d location=%s limit=%s max_pages=%s website_ids=%s",
@@ -41,27 +37,29 @@ def execute_scrape_run(
         website_ids,
     )
 
+    # API sources that ignore the keyword are downloaded once for all phrases.
+    api_jobs, planned_ids = scraper.get_api_jobs_once(location, phrases, website_ids)
+    for job in api_jobs:
+        if job.source_url not in seen_urls:
+            seen_urls.add(job.source_url)
+            all_new_jobs.append(job)
+
     for phrase in phrases:
         for website_id in website_ids:
+            if website_id in planned_ids:
+                continue
             for job in scraper.get_recent_jobs(
                 location,
                 phrase,
                 max_pages=max_pages,
                 website_id=website_id,
+                exclude_website_ids=planned_ids,
             ):
                 if job.source_url not in seen_urls:
                     seen_urls.add(job.source_url)
                     all_new_jobs.append(job)
 
-    apollo = ApolloClient()
-    enriched_count = 0
-    for job in all_new_jobs[:limit]:
-        try:
-            enriched_count += apollo.enrich_job_contacts(job)
-        except Exception:
-            logger.exception(
-                "apollo_enrichment_failed job_id=%s company=%s", job.id, job.company
-            )
+    enriched_count = enrich_new_jobs(all_new_jobs, limit)
 
     logger.info(
         "run_scraper_done jobs_new=%s contacts_found=%s duration_ms=%s",
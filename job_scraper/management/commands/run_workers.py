@@ -0,0 +1,114 @@
+import logging
+import multiprocessing
+import os
+import socket
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+def run_worker(worker_id, poll_seconds=None, exit_when_idle=False):
+    """Claim and execute queued work units until stopped.
+
+    Returns the number of units processed; only returns on its own when
+    ``exit_when_idle`` is set and the queue has nothing claimable.
+    """
+    from job_scraper.request_scraper import JobScraper
+    from job_scraper.work_queue import claim_work_unit, process_work_unit
+
+    poll_seconds = (
+        settings.WORK_QUEUE_POLL_SECONDS if poll_seconds is None else poll_seconds
+    )
+    scraper = JobScraper(raise_errors=True)
+    processed = 0
+    logger.info("work_queue_worker_start worker=%s", worker_id)
+    while True:
+        unit = claim_work_unit(worker_id)
+        if unit is None:
+            if exit_when_idle:
+                return processed
+            time.sleep(poll_seconds)
+            continue
+        process_work_unit(unit, scraper)
+        processed += 1
+
+
+def _worker_process_main(index, exit_when_idle):
+    # Children may be spawned rather than forked, so Django is set up here.
+    import django
+
+    django.setup()
+
+    from job_scraper.browser_pool import BrowserPool, install_browser_pool
+    from job_scraper.http_sessions import close_sessions
+    from job_scraper.parsing import shutdown_parse_pool
+    from job_scraper.stealth_scraper import build_session_manager
+
+    browser_pool = None
+    if settings.STEALTH_POOL_SIZE > 0:
+        browser_pool = BrowserPool(build_session_manager)
+        install_browser_pool(browser_pool)
+    try:
+        run_worker(
+            f"{socket.gethostname()}-{os.getpid()}-{index}",
+            exit_when_idle=exit_when_idle,
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shutdown_parse_pool()
+        close_sessions()
+        if browser_pool is not None:
+            install_browser_pool(None)
+            browser_pool.close()
+
+
+class Command(BaseCommand):
+    help = "Starts worker processes that claim and run queued scrape work units."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes", type=int, default=settings.WORK_QUEUE_WORKERS
+        )
+        parser.add_argument(
+            "--exit-when-idle",
+            action="store_true",
+            help="Stop each worker once no work unit can be claimed.",
+        )
+
+    def handle(self, *args, **options):
+        processes = max(1, options["processes"])
+        exit_when_idle = options["exit_when_idle"]
+        self.stdout.write(
+            self.style.SUCCESS(f"Starting {processes} scrape worker(s)...")
+        )
+
+        if processes == 1:
+            _worker_process_main(0, exit_when_idle)
+            return
+
+        # Connections must not be shared with forked children.
+        connections.close_all()
+        workers = [
+            multiprocessing.Process(
+                target=_worker_process_main,
+                args=(index, exit_when_idle),
+                name=f"scrape-worker-{index}",
+            )
+            for index in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            logger.info("Stopping scrape workers...")
+            for worker in workers:
+                worker.terminate()
+            for worker in workers:
+                worker.join()
@@ -53,6 +53,7 @@ DEFAULT_WEBSITES = [
         "location_selector": "N/A",
         "job_link_selector": "N/A",
         "is_api": True,
+        "api_fetch_once": True,
         "api_jobs_path": "data",
         "api_title_key": "title",
         "api_company_key": "company_name",
@@ -70,6 +71,7 @@ DEFAULT_WEBSITES = [
         "location_selector": "N/A",
         "job_link_selector": "N/A",
         "is_api": True,
+        "api_fetch_once": True,
         "api_jobs_path": "jobs",
         "api_title_key": "title",
         "api_company_key": "company_name",
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_scraper", "0013_scheduledscrape_email_subscribers_and_runs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customwebsite",
+            name="use_async_engine",
+            field=models.BooleanField(
+                default=False,
+                help_text="Fetch search and detail pages with the asyncio HTTP engine (requests mode only)",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_scraper", "0014_customwebsite_use_async_engine"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customwebsite",
+            name="api_fetch_once",
+            field=models.BooleanField(
+                default=False,
+                help_text="Download the API once per run and match every keyword phrase locally",
+            ),
+        ),
+    ]
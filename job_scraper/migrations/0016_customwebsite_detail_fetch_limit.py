@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_scraper", "0015_customwebsite_api_fetch_once"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customwebsite",
+            name="detail_fetch_limit",
+            field=models.PositiveIntegerField(
+                default=3,
+                help_text="Job detail pages fetched per scrape (0 disables)",
+            ),
+        ),
+    ]
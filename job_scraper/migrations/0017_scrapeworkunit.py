@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:29
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_scraper", "0016_customwebsite_detail_fetch_limit"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScrapeWorkUnit",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "phrase",
+                    models.TextField(
+                        help_text="Keyword phrase, or every phrase comma-separated for fetch-once APIs"
+                    ),
+                ),
+                ("location", models.CharField(max_length=100)),
+                ("max_pages", models.PositiveSmallIntegerField(default=1)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("max_attempts", models.PositiveSmallIntegerField(default=3)),
+                (
+                    "available_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("lease_expires_at", models.DateTimeField(blank=True, null=True)),
+                ("worker_id", models.CharField(blank=True, max_length=100)),
+                ("job_ids", models.JSONField(blank=True, default=list)),
+                ("last_error", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="work_units",
+                        to="job_scraper.scheduledscraperun",
+                    ),
+                ),
+                (
+                    "website",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="work_units",
+                        to="job_scraper.customwebsite",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["available_at", "id"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "available_at"],
+                        name="job_scraper_status_89ab7a_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_scraper", "0017_scrapeworkunit"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customwebsite",
+            name="pacing_rate_per_minute",
+            field=models.FloatField(
+                blank=True,
+                help_text="Learned requests per minute; raised on clean pages and cut on blocks (blank uses the default)",
+                null=True,
+            ),
+        ),
+    ]
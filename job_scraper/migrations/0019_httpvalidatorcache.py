@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:39
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_scraper", "0018_customwebsite_pacing_rate_per_minute"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HttpValidatorCache",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("url_hash", models.CharField(max_length=64, unique=True)),
+                ("url", models.TextField()),
+                ("etag", models.CharField(blank=True, max_length=512)),
+                ("last_modified", models.CharField(blank=True, max_length=128)),
+                ("body", models.BinaryField(blank=True, default=b"")),
+                ("encoding", models.CharField(blank=True, max_length=64)),
+                ("not_modified_count", models.PositiveIntegerField(default=0)),
+                ("fetched_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("checked_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "verbose_name": "HTTP validator cache entry",
+                "verbose_name_plural": "HTTP validator cache",
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_scraper", "0019_httpvalidatorcache"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customwebsite",
+            name="html_parser",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("html.parser", "html.parser (stdlib)"),
+                    ("lxml", "lxml"),
+                    ("selectolax", "selectolax (lexbor)"),
+                ],
+                help_text="HTML parser backend for this site (blank uses SCRAPER_HTML_PARSER); selectolax only supports standard CSS selectors",
+                max_length=20,
+            ),
+        ),
+    ]
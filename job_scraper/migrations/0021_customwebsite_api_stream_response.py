@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_scraper", "0020_customwebsite_html_parser"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customwebsite",
+            name="api_stream_response",
+            field=models.BooleanField(
+                default=False,
+                help_text="Stream the JSON payload and match items as they download (for very large feeds)",
+            ),
+        ),
+    ]
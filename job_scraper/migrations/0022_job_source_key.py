@@ -0,0 +1,160 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:07
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from django.db import migrations, models
+
+# Fields a merged duplicate never overwrites on the surviving row.
+KEEP_FIELDS = {"id", "created_at", "source_url", "source_key"}
+
+# A frozen copy of job_scraper.url_keys as it was when this migration was
+# written, so later changes to the live rules cannot change what it does.
+TRACKING_PARAMS = frozenset(
+    {
+        "gclid",
+        "gclsrc",
+        "dclid",
+        "fbclid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "_ga",
+        "_gl",
+        "mc_cid",
+        "mc_eid",
+        "ref_src",
+        "referrer",
+        "trk",
+        "trkinfo",
+        "trackingid",
+        "lipi",
+        "ebp",
+    }
+)
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_")
+SESSION_PARAMS = frozenset(
+    {
+        "jsessionid",
+        "phpsessid",
+        "aspsessionid",
+        "sessionid",
+        "session_id",
+        "cfid",
+        "cftoken",
+    }
+)
+PATH_SESSION_RE = re.compile(
+    r";(?:%s)=[^/?#;]*" % "|".join(sorted(SESSION_PARAMS)), re.IGNORECASE
+)
+
+
+def is_noise_param(name):
+    name = name.lower()
+    return (
+        name in TRACKING_PARAMS
+        or name in SESSION_PARAMS
+        or name.startswith(TRACKING_PREFIXES)
+    )
+
+
+def url_key(url):
+    url = (url or "").strip()
+    if not url:
+        return None
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if host and scheme in ("http", "https", ""):
+        scheme = "https"
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if host and port is not None and str(port) not in {"80", "443"}:
+        host = f"{host}:{port}"
+
+    path = PATH_SESSION_RE.sub("", parts.path)
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not is_noise_param(name)
+        )
+    )
+    if host:
+        path = path or "/"
+    canonical = urlunsplit((scheme, host, path, query, ""))
+    if not canonical:
+        return None
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def backfill_source_keys(apps, schema_editor):
+    """Key every job by canonical URL, merging rows that share a key.
+
+    The oldest row of each group survives (keeping its id, contacts and
+    created_at); non-empty values from newer duplicates overwrite its
+    fields in scrape order, their contacts move to it, and they are deleted.
+    """
+    Job = apps.get_model("job_scraper", "Job")
+    Contact = apps.get_model("job_scraper", "Contact")
+
+    groups = {}
+    rows = Job.objects.order_by("created_at", "pk").values_list("pk", "source_url")
+    for pk, source_url in rows.iterator():
+        key = url_key(source_url)
+        if key:
+            groups.setdefault(key, []).append(pk)
+
+    merge_fields = [
+        field.name
+        for field in Job._meta.concrete_fields
+        if field.name not in KEEP_FIELDS
+    ]
+    keyed = []
+    for key, pks in groups.items():
+        if len(pks) > 1:
+            survivor = Job.objects.get(pk=pks[0])
+            for duplicate in Job.objects.filter(pk__in=pks[1:]).order_by(
+                "created_at", "pk"
+            ):
+                for field in merge_fields:
+                    value = getattr(duplicate, field)
+                    if value not in (None, ""):
+                        setattr(survivor, field, value)
+            survivor.save(update_fields=merge_fields)
+            Contact.objects.filter(job_id__in=pks[1:]).update(job_id=pks[0])
+            Job.objects.filter(pk__in=pks[1:]).delete()
+        keyed.append(Job(pk=pks[0], source_key=key))
+    Job.objects.bulk_update(keyed, ["source_key"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_scraper", "0021_customwebsite_api_stream_response"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="source_key",
+            field=models.CharField(
+                blank=True, editable=False, max_length=40, null=True
+            ),
+        ),
+        migrations.RunPython(backfill_source_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="job",
+            name="source_key",
+            field=models.CharField(
+                blank=True, editable=False, max_length=40, null=True, unique=True
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_scraper", "0022_job_source_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RateLimitBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("domain", models.CharField(max_length=255, unique=True)),
+                ("next_free", models.FloatField(default=0.0)),
+            ],
+        ),
+    ]
@@ -2,9 +2,13 @@ from zoneinfo import available_timezones
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 from apscheduler.triggers.cron import CronTrigger
 
+from .html_backends import PARSER_CHOICES
+from .url_keys import url_key
+
 # Create your models here.
 
 
@@ -30,6 +34,10 @@ class Job(models.Model):
         max_length=100
     )  # indeed, linkedin, custom website, etc.
     source_url = models.URLField(blank=True)
+    # Hash of the canonical source URL; the de-duplication key for upserts.
+    source_key = models.CharField(
+        max_length=40, unique=True, null=True, blank=True, editable=False
+    )
     continent = models.CharField(max_length=100, blank=True)
     expertise_tags = models.TextField(
         blank=True, help_text="Comma-separated expertise/skills"
@@ -47,6 +55,13 @@ class Job(models.Model):
     def __str__(self) -> str:
         return f"{self.title} at {self.company}"
 
+    def save(self, *args, **kwargs) -> None:
+        self.source_key = url_key(self.source_url)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "source_url" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "source_key"}
+        super().save(*args, **kwargs)
+
 
 class CustomWebsite(models.Model):
     """Model to store custom websites added by users"""
@@ -82,10 +97,37 @@ class CustomWebsite(models.Model):
         default=False,
         help_text="Use high-protection stealth browser (SeleniumBase UC mode) for this site",
     )
+    detail_fetch_limit = models.PositiveIntegerField(
+        default=3,
+        help_text="Job detail pages fetched per scrape (0 disables)",
+    )
+    use_async_engine = models.BooleanField(
+        default=False,
+        help_text="Fetch search and detail pages with the asyncio HTTP engine (requests mode only)",
+    )
+    html_parser = models.CharField(
+        max_length=20,
+        blank=True,
+        choices=PARSER_CHOICES,
+        help_text="HTML parser backend for this site (blank uses SCRAPER_HTML_PARSER); selectolax only supports standard CSS selectors",
+    )
+    pacing_rate_per_minute = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Learned requests per minute; raised on clean pages and cut on blocks (blank uses the default)",
+    )
     # API Support
     is_api = models.BooleanField(
         default=False, help_text="Set to true if this is a JSON API endpoint"
     )
+    api_fetch_once = models.BooleanField(
+        default=False,
+        help_text="Download the API once per run and match every keyword phrase locally",
+    )
+    api_stream_response = models.BooleanField(
+        default=False,
+        help_text="Stream the JSON payload and match items as they download (for very large feeds)",
+    )
     api_jobs_path = models.CharField(
         max_length=255,
         blank=True,
@@ -249,3 +291,82 @@ class ScheduledScrapeRun(models.Model):
 
     def __str__(self) -> str:
         return f"{self.schedule.name} @ {self.started_at:%Y-%m-%d %H:%M}"
+
+
+class ScrapeWorkUnit(models.Model):
+    """One schedule x website x phrase slice of a queued scheduled run."""
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    run = models.ForeignKey(
+        ScheduledScrapeRun, on_delete=models.CASCADE, related_name="work_units"
+    )
+    website = models.ForeignKey(
+        CustomWebsite, on_delete=models.CASCADE, related_name="work_units"
+    )
+    # Text, not CharField: re-joining a schedule's phrases with ", " can make
+    # the fetch-once unit longer than the schedule's 255-character keywords.
+    phrase = models.TextField(
+        help_text="Keyword phrase, or every phrase comma-separated for fetch-once APIs",
+    )
+    location = models.CharField(max_length=100)
+    max_pages = models.PositiveSmallIntegerField(default=1)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    available_at = models.DateTimeField(default=timezone.now)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    worker_id = models.CharField(max_length=100, blank=True)
+    job_ids = models.JSONField(default=list, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["available_at", "id"]
+        indexes = [models.Index(fields=["status", "available_at"])]
+
+    def __str__(self) -> str:
+        return f"{self.website.name} / {self.phrase} [{self.status}]"
+
+
+class HttpValidatorCache(models.Model):
+    """ETag / Last-Modified validators for a URL, with its last body (zlib)."""
+
+    url_hash = models.CharField(max_length=64, unique=True)
+    url = models.TextField()
+    etag = models.CharField(max_length=512, blank=True)
+    last_modified = models.CharField(max_length=128, blank=True)
+    body = models.BinaryField(blank=True, default=b"")
+    encoding = models.CharField(max_length=64, blank=True)
+    not_modified_count = models.PositiveIntegerField(default=0)
+    fetched_at = models.DateTimeField(default=timezone.now)
+    checked_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "HTTP validator cache entry"
+        verbose_name_plural = "HTTP validator cache"
+
+    def __str__(self) -> str:
+        return self.url
+
+
+class RateLimitBucket(models.Model):
+    """A domain's token bucket: its next free send time (Unix seconds)."""
+
+    domain = models.CharField(max_length=255, unique=True)
+    next_free = models.FloatField(default=0.0)
+
+    def __str__(self) -> str:
+        return self.domain
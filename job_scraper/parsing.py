@@ -0,0 +1,413 @@
+"""CPU-bound HTML parsing, runnable in a separate process.
+
+Everything here works on raw page content plus a plain selector dict (see
+``website_selectors``) and returns plain dicts, so calls can be shipped to
+the process pool behind ``run_parser``. Trees are built by the backend
+``html_parser_for`` picks (see ``html_backends``). Nothing here touches the ORM.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from django.conf import settings
+
+from bs4 import SoupStrainer
+
+from .html_backends import (
+    PARSER_HTML,
+    PARSER_SELECTOLAX,
+    compile_selector,
+    parse_html,
+    resolve_parser,
+)
+
+logger = logging.getLogger(__name__)
+
+SELECTOR_FIELDS = (
+    "job_list_selector",
+    "title_selector",
+    "company_selector",
+    "location_selector",
+    "salary_selector",
+    "date_selector",
+    "job_link_selector",
+    "apply_link_selector",
+    "description_selector",
+    "requirements_selector",
+)
+CARD_FIELDS = ("title", "company", "location", "job_link", "salary", "date")
+DETAIL_FIELDS = ("description", "requirements", "apply_link")
+# The leading compound of a list selector that can be turned into a strainer.
+_SIMPLE_COMPOUND = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*)?(?P<id>#[\w-]+)?(?P<classes>(?:\.[\w-]+)*)$"
+)
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+_plans: Dict[Tuple[Any, str], "ExtractionPlan"] = {}
+_plans_lock = threading.Lock()
+
+
+def website_selectors(website: Any) -> Dict[str, Any]:
+    """Picklable snapshot of the website fields the parsers need."""
+    selectors = {field: getattr(website, field) or "" for field in SELECTOR_FIELDS}
+    selectors.update(
+        {
+            "pk": website.pk,
+            "name": website.name,
+            "base_url": website.base_url,
+            "parser": html_parser_for(website),
+        }
+    )
+    selectors["fingerprint"] = _selectors_fingerprint(selectors)
+    return selectors
+
+
+def html_parser_for(website: Any) -> str:
+    """The website's parser backend, else ``SCRAPER_HTML_PARSER``."""
+    return resolve_parser(
+        getattr(website, "html_parser", "") or settings.SCRAPER_HTML_PARSER
+    )
+
+
+def run_parser(func: Callable[..., Any], *args: Any) -> Any:
+    """Run ``func(*args)`` in the parse pool, or inline when it is disabled."""
+    pool = _get_parse_pool()
+    if pool is None:
+        return func(*args)
+    try:
+        return pool.submit(func, *args).result()
+    except BrokenProcessPool:
+        logger.warning("parse_pool_broken func=%s fallback=inline", func.__name__)
+        _reset_parse_pool()
+        return func(*args)
+
+
+async def run_parser_async(func: Callable[..., Any], *args: Any) -> Any:
+    pool = _get_parse_pool()
+    if pool is None:
+        return func(*args)
+    try:
+        return await asyncio.wrap_future(pool.submit(func, *args))
+    except BrokenProcessPool:
+        logger.warning("parse_pool_broken func=%s fallback=inline", func.__name__)
+        _reset_parse_pool()
+        return func(*args)
+
+
+def shutdown_parse_pool() -> None:
+    _reset_parse_pool()
+
+
+def _get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    global _parse_pool
+    if settings.SCRAPER_PARSE_WORKERS <= 0:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # Spawned, not forked: the scrapers fork from a multi-threaded
+            # process, and a forked child can inherit held locks.
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=settings.SCRAPER_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _parse_pool
+
+
+def _reset_parse_pool() -> None:
+    global _parse_pool
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ExtractionPlan:
+    """How to pull cards out of one website's pages, selectors compiled once.
+
+    Only the subtrees that can hold a card are built (see ``_list_strainer``),
+    and each field selector runs once per card; the matched nodes feed both
+    the card dicts and the selector coverage stats.
+    """
+
+    def __init__(self, selectors: Dict[str, Any]) -> None:
+        self.parser = selectors["parser"]
+        self.list_selector = compile_selector(
+            selectors["job_list_selector"], self.parser
+        )
+        self.field_selectors = {
+            field: compile_selector(selectors[f"{field}_selector"], self.parser)
+            for field in CARD_FIELDS
+        }
+        self.detail_selectors = {
+            field: compile_selector(selectors[f"{field}_selector"], self.parser)
+            for field in DETAIL_FIELDS
+        }
+        self.parse_only = None
+        if self.parser != PARSER_SELECTOLAX:
+            self.parse_only = _list_strainer(selectors["job_list_selector"])
+
+    def extract(
+        self, content: Any
+    ) -> Tuple[List[Optional[Dict[str, Any]]], Dict[str, Any]]:
+        """Matched field nodes per card (None if a selector failed), plus coverage."""
+        root = parse_html(content, self.parser, parse_only=self.parse_only)
+        cards = root.select(self.list_selector)
+        hits = dict.fromkeys(self.field_selectors, 0)
+        matches = []
+        for card_number, card in enumerate(cards, start=1):
+            found = {}
+            try:
+                for field, selector in self.field_selectors.items():
+                    found[field] = card.select_one(selector) if selector else None
+            except Exception:
+                logger.exception(
+                    "card_select_failed field=%s selector=%s card=%s",
+                    field,
+                    getattr(selector, "pattern", selector),
+                    card_number,
+                )
+                matches.append(None)
+                continue
+            for field, node in found.items():
+                if node is not None:
+                    hits[field] += 1
+            matches.append(found)
+        coverage = {
+            field: {"hits": hits[field], "total": len(cards)}
+            for field in self.field_selectors
+        }
+        return matches, coverage
+
+
+def extraction_plan(selectors: Dict[str, Any]) -> ExtractionPlan:
+    """The website's plan, built once per website and selector configuration.
+
+    Keying on the selector fingerprint as well as the id means a parse worker
+    that never hears about an edit still can't serve a stale plan.
+    """
+    key = (selectors["pk"], selectors["fingerprint"])
+    plan = _plans.get(key)
+    if plan is None:
+        plan = ExtractionPlan(selectors)
+        with _plans_lock:
+            _plans[key] = plan
+    return plan
+
+
+def invalidate_extraction_plans(website_id: Any) -> None:
+    """Drop a website's compiled plans after its row is saved or deleted."""
+    with _plans_lock:
+        for key in [key for key in _plans if key[0] == website_id]:
+            del _plans[key]
+
+
+def _selectors_fingerprint(selectors: Dict[str, Any]) -> str:
+    values = [selectors["parser"]] + [selectors[field] for field in SELECTOR_FIELDS]
+    return hashlib.sha1("\0".join(values).encode("utf-8")).hexdigest()
+
+
+def _list_strainer(list_selector: str) -> Optional[SoupStrainer]:
+    """Strainer keeping only elements that match the selector's first compound.
+
+    With descendant and child combinators every card sits inside (or is) an
+    element matching that compound, so nothing outside it is needed. Selector
+    lists, sibling combinators, pseudo-classes and attribute selectors keep
+    the full tree.
+    """
+    selector = (list_selector or "").strip()
+    if not selector or any(char in selector for char in ",+~:[]()*|\\\"'"):
+        return None
+    compound = _SIMPLE_COMPOUND.match(re.split(r"[\s>]+", selector, maxsplit=1)[0])
+    if not compound or not any(compound.groupdict().values()):
+        return None
+
+    attrs = {}
+    if compound["id"]:
+        attrs["id"] = compound["id"][1:]
+    classes = {name for name in compound["classes"].split(".") if name}
+    if classes:
+        attrs["class"] = lambda value: (
+            value is not None and classes <= set(value.split())
+        )
+    name = compound["tag"].lower() if compound["tag"] else None
+    return SoupStrainer(name, attrs=attrs)
+
+
+def parse_search_page(
+    content: bytes, selectors: Dict[str, Any], page_number: int
+) -> Dict[str, Any]:
+    """Parse a results page into ``(card_number, job_data)`` pairs."""
+    matches, coverage = extraction_plan(selectors).extract(content)
+    cards = []
+    for card_number, found in enumerate(matches, start=1):
+        job_data = _parse_card(found, selectors, page_number, card_number)
+        if job_data:
+            cards.append((card_number, job_data))
+    return {
+        "cards": cards,
+        "card_count": len(matches),
+        "selector_metrics": _summarize_coverage(coverage),
+    }
+
+
+def parse_stealth_search_page(
+    html_content: str, selectors: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Parse a browser-rendered results page into card dicts."""
+    matches, coverage = extraction_plan(selectors).extract(html_content)
+    cards = []
+    card_failures = 0
+    for found in matches:
+        try:
+            card = _stealth_card(found, selectors)
+        except Exception:
+            card_failures += 1
+            logger.exception("stealth_card_parse_failed website=%s", selectors["name"])
+            continue
+        if card["job_url"] and card["title"]:
+            cards.append(card)
+    return {
+        "cards": cards,
+        "card_count": len(matches),
+        "card_failures": card_failures,
+        "selector_metrics": _summarize_coverage(coverage),
+    }
+
+
+def parse_detail_page(
+    content: bytes, job_url: str, selectors: Dict[str, Any]
+) -> Dict[str, str]:
+    plan = extraction_plan(selectors)
+    soup = parse_html(content, plan.parser)
+
+    description = ""
+    if plan.detail_selectors["description"]:
+        desc_elem = soup.select_one(plan.detail_selectors["description"])
+        description = clean_text(desc_elem.text()) if desc_elem else ""
+
+    requirements = ""
+    if plan.detail_selectors["requirements"]:
+        req_elem = soup.select_one(plan.detail_selectors["requirements"])
+        requirements = clean_text(req_elem.text()) if req_elem else ""
+
+    application_link = ""
+    if plan.detail_selectors["apply_link"]:
+        apply_elem = soup.select_one(plan.detail_selectors["apply_link"])
+        if apply_elem:
+            application_link = apply_elem.attr("href")
+            if application_link and not application_link.startswith("http"):
+                application_link = urljoin(selectors["base_url"], application_link)
+
+    return {
+        "description": description,
+        "requirements": requirements,
+        "application_link": application_link or job_url,
+    }
+
+
+def extract_description(
+    html_content: str, selector: str, parser: str = PARSER_HTML
+) -> str:
+    """Description text with line breaks kept, as the stealth scraper stores it."""
+    desc_elem = parse_html(html_content, parser).select_one(selector)
+    if not desc_elem:
+        return ""
+    return desc_elem.text_with_breaks().strip()
+
+
+def clean_text(text: str) -> str:
+    """Clean and normalize text"""
+    if not text:
+        return ""
+    return re.sub(r"\s+", " ", text.strip())
+
+
+def _summarize_coverage(coverage: Dict[str, Any]) -> str:
+    # Imported here: anti_bot reads Django settings at import time, which a
+    # spawned parse worker never configures.
+    from .anti_bot import summarize_selector_coverage
+
+    return summarize_selector_coverage(coverage)
+
+
+def _parse_card(
+    found: Optional[Dict[str, Any]],
+    selectors: Dict[str, Any],
+    page_number: int,
+    card_number: int,
+) -> Optional[Dict[str, Any]]:
+    """Build job data from the nodes the extraction plan matched in a card"""
+    if found is None:
+        return None
+    try:
+        title = _node_text(found["title"])
+        company = _node_text(found["company"])
+        location = _node_text(found["location"])
+
+        # Extract job link
+        job_url = ""
+        if found["job_link"]:
+            job_url = found["job_link"].attr("href")
+            if job_url and not job_url.startswith("http"):
+                job_url = urljoin(selectors["base_url"], job_url)
+
+        # Optional fields only match when their selectors are set
+        salary = _node_text(found["salary"])
+        posted_date = _node_text(found["date"])
+
+        return {
+            "id": f"custom-{selectors['pk']}-{page_number}-{card_number}",
+            "title": title,
+            "company": company,
+            "location": location,
+            "salary": salary,
+            "posted_date": posted_date,
+            "source_website": selectors["name"],
+            "source_url": job_url,
+            "job_url": job_url,
+        }
+
+    except Exception:
+        logger.exception(
+            "card_parse_exception website_id=%s website=%s page=%s card=%s",
+            selectors["pk"],
+            selectors["name"],
+            page_number,
+            card_number,
+        )
+        return None
+
+
+def _stealth_card(
+    found: Optional[Dict[str, Any]], selectors: Dict[str, Any]
+) -> Dict[str, str]:
+    if found is None:
+        raise ValueError("card selectors failed to run")
+    title = ""
+    if found["title"]:
+        title = found["title"].attr("title") or found["title"].text(strip=True)
+    job_url = ""
+    if found["job_link"] and found["job_link"].attr("href"):
+        job_url = urljoin(selectors["base_url"], found["job_link"].attr("href"))
+    return {
+        "title": title,
+        "company": _node_text(found["company"], strip=True),
+        "location": _node_text(found["location"], strip=True),
+        "job_url": job_url,
+        "salary": _node_text(found["salary"], strip=True),
+    }
+
+
+def _node_text(node: Any, strip: bool = False) -> str:
+    if node is None:
+        return ""
+    return node.text(strip=True) if strip else clean_text(node.text())
@@ -0,0 +1,204 @@
+"""Per-domain request pacing shared by every scraper.
+
+Each domain is a token bucket stored as its next free send time (the GCRA
+form of a token bucket) in a ``RateLimitBucket`` row. A reservation is one
+conditional UPDATE, so threads and separate processes draw from the same
+budget without a lock. A request only waits when the domain's bucket is
+empty.
+
+Each website also learns its own rate (AIMD): clean pages raise it by a
+fixed step, blocks, 429s and 503s cut it by a factor. The learned rate is
+stored on ``CustomWebsite.pacing_rate_per_minute`` so it survives restarts.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db import OperationalError, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Greatest, Least
+
+from asgiref.sync import sync_to_async
+
+from .models import CustomWebsite, RateLimitBucket
+
+logger = logging.getLogger(__name__)
+
+# How long a reservation keeps retrying a busy database before the request
+# goes out unpaced.
+RESERVE_WAIT_SECONDS = 2.0
+RESERVE_RETRY_SECONDS = 0.05
+
+_local_lock = threading.Lock()
+
+
+def url_domain(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def domain_rate_per_minute(domain: str) -> float:
+    """Configured requests per minute for ``domain`` (0 means unlimited)."""
+    return _domain_overrides().get(domain, settings.SCRAPER_RATE_LIMIT_PER_MINUTE)
+
+
+def reserve_slot(domain: str, rate_per_minute: Optional[float] = None) -> float:
+    """Take a token for ``domain`` and return how long to wait before sending.
+
+    ``rate_per_minute`` overrides the configured rate, e.g. with a website's
+    learned rate from ``website_rate``.
+    """
+    rate = domain_rate_per_minute(domain)
+    if rate > 0 and rate_per_minute:
+        rate = rate_per_minute
+    if rate <= 0 or not domain:
+        return 0.0
+
+    interval = 60.0 / rate
+    burst_allowance = interval * (max(1, settings.SCRAPER_RATE_LIMIT_BURST) - 1)
+    jitter = min(max(settings.SCRAPER_RATE_LIMIT_JITTER, 0.0), 0.9)
+    spacing = interval * random.uniform(1 - jitter, 1 + jitter)
+    deadline = time.monotonic() + RESERVE_WAIT_SECONDS
+    delay = RESERVE_RETRY_SECONDS
+    while True:
+        try:
+            with _local_lock:
+                return _take_token(domain, spacing, burst_allowance)
+        except OperationalError as exc:
+            # e.g. SQLite's "database is locked" while jobs are being saved.
+            if time.monotonic() + delay > deadline:
+                # Pacing one request slightly off beats failing the fetch.
+                logger.warning("rate_limit_unavailable domain=%s error=%s", domain, exc)
+                return 0.0
+            time.sleep(delay)
+            delay *= 2
+
+
+def throttle(url: str, rate_per_minute: Optional[float] = None) -> float:
+    """Block until ``url``'s domain has a token; returns the time waited."""
+    domain = url_domain(url)
+    wait = reserve_slot(domain, rate_per_minute)
+    if wait > 0:
+        logger.debug("rate_limit_wait domain=%s wait_s=%.2f", domain, wait)
+        time.sleep(wait)
+    return wait
+
+
+async def async_throttle(url: str, rate_per_minute: Optional[float] = None) -> float:
+    """``throttle`` for coroutines.
+
+    The reservation is a blocking database round trip, so it runs
+    in a thread; only the wait itself is awaited on the event loop.
+    """
+    domain = url_domain(url)
+    wait = await sync_to_async(reserve_slot)(domain, rate_per_minute)
+    if wait > 0:
+        logger.debug("rate_limit_wait domain=%s wait_s=%.2f", domain, wait)
+        await asyncio.sleep(wait)
+    return wait
+
+
+def reset_domain(domain: str) -> None:
+    RateLimitBucket.objects.filter(domain=domain).delete()
+
+
+def website_rate(website: CustomWebsite) -> float:
+    """Requests per minute to use for ``website`` (0 when pacing is off)."""
+    domain = url_domain(website.search_url or website.base_url)
+    default_rate = domain_rate_per_minute(domain)
+    if default_rate <= 0:
+        return 0.0
+    return website.pacing_rate_per_minute or default_rate
+
+
+def record_pacing_success(website: CustomWebsite) -> float:
+    """Additive increase after a clean response; returns the new rate."""
+    return _adjust_rate(
+        website,
+        lambda rate, bounds: Least(
+            rate + settings.SCRAPER_PACING_INCREASE_PER_MINUTE, bounds[1]
+        ),
+    )
+
+
+def record_pacing_backoff(website: CustomWebsite) -> float:
+    """Multiplicative decrease after a block, 429 or 503; returns the new rate."""
+    rate = _adjust_rate(
+        website,
+        lambda rate, bounds: Greatest(
+            rate * settings.SCRAPER_PACING_DECREASE_FACTOR, bounds[0]
+        ),
+    )
+    logger.info(
+        "pacing_backoff website_id=%s website=%s rate_per_minute=%.1f",
+        website.id,
+        website.name,
+        rate,
+    )
+    return rate
+
+
+def _take_token(domain: str, spacing: float, burst_allowance: float) -> float:
+    """Advance ``domain``'s bucket by ``spacing``; return the wait for this send."""
+    with transaction.atomic():
+        now = time.time()
+        advanced = Greatest(F("next_free"), Value(now)) + Value(spacing)
+        if not RateLimitBucket.objects.filter(domain=domain).update(next_free=advanced):
+            _, created = RateLimitBucket.objects.get_or_create(
+                domain=domain, defaults={"next_free": now + spacing}
+            )
+            if created:
+                return 0.0
+            RateLimitBucket.objects.filter(domain=domain).update(next_free=advanced)
+        # Read inside the same transaction: the row is still ours.
+        next_free = (
+            RateLimitBucket.objects.filter(domain=domain)
+            .values_list("next_free", flat=True)
+            .get()
+        )
+    return max(0.0, next_free - spacing - burst_allowance - now)
+
+
+def _adjust_rate(website: CustomWebsite, step: Any) -> float:
+    """Apply ``step`` in one UPDATE so concurrent scrapers don't lose steps."""
+    domain = url_domain(website.search_url or website.base_url)
+    default_rate = domain_rate_per_minute(domain)
+    if default_rate <= 0:
+        return 0.0
+    # An explicit per-domain override is treated as a ceiling.
+    ceiling = (
+        default_rate
+        if domain in _domain_overrides()
+        else settings.SCRAPER_PACING_MAX_PER_MINUTE
+    )
+    bounds = (
+        Value(float(settings.SCRAPER_PACING_MIN_PER_MINUTE)),
+        Value(float(ceiling)),
+    )
+    current = Coalesce(F("pacing_rate_per_minute"), Value(float(default_rate)))
+    CustomWebsite.objects.filter(pk=website.pk).update(
+        pacing_rate_per_minute=step(current, bounds)
+    )
+    website.pacing_rate_per_minute = (
+        CustomWebsite.objects.filter(pk=website.pk)
+        .values_list("pacing_rate_per_minute", flat=True)
+        .get()
+    )
+    return website.pacing_rate_per_minute
+
+
+def _domain_overrides() -> Dict[str, float]:
+    overrides = {}
+    for entry in settings.SCRAPER_DOMAIN_RATE_LIMITS:
+        domain, _, rate = entry.partition("=")
+        try:
+            overrides[url_domain(f"//{domain.strip()}")] = float(rate)
+        except ValueError:
+            logger.warning("rate_limit_override_invalid entry=%s", entry)
+    return overrides
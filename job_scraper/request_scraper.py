@@ -1,47 +1,103 @@
+import asyncio
 import logging
 import random
-import re
 import time
 import uuid
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from django.conf import settings
 from django.core.files.base import ContentFile
+from django.db import connections
 
-import requests
-from bs4 import BeautifulSoup
+from asgiref.sync import async_to_sync, sync_to_async
 
 from .anti_bot import (
+    BLOCK_STATUS_CODES,
+    ScrapeFailed,
     classify_anti_bot_response,
     clear_block_state,
-    compute_selector_coverage,
     get_cooldown_remaining,
-    jitter_sleep,
     record_block_event,
-    summarize_selector_coverage,
 )
+from .async_engine import AsyncFetchEngine, async_engine_available
+from .enrichment import enrich_descriptions, enrich_job_data
+from .http_sessions import get_session
+from .http_validators import conditional_get, is_not_modified, remember_validators
+from .job_store import upsert_jobs
+from .keyword_matcher import is_rfp_query
 from .models import CustomWebsite, Job
-from .utils import parse_location_components
+from .parsing import (
+    parse_detail_page,
+    parse_search_page,
+    run_parser,
+    run_parser_async,
+    website_selectors,
+)
+from .rate_limiter import (
+    record_pacing_backoff,
+    record_pacing_success,
+    throttle,
+    url_domain,
+    website_rate,
+)
+from .response_cache import (
+    cached_client,
+    is_cached,
+    is_cached_response,
+    remember_response,
+)
+from .url_keys import url_key
+from .utils import parse_locations
 
 logger = logging.getLogger(__name__)
 
+SCRAPER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+
+def website_domain(website: CustomWebsite) -> str:
+    return url_domain(website.search_url or website.base_url)
+
+
+def group_websites_by_domain(
+    websites: List[CustomWebsite],
+) -> List[List[CustomWebsite]]:
+    """Group websites by host, keeping the original website order."""
+    groups: Dict[str, List[CustomWebsite]] = {}
+    for website in websites:
+        groups.setdefault(website_domain(website), []).append(website)
+    return list(groups.values())
+
+
+def page_is_known(job_urls: List[str]) -> bool:
+    """True when enough of a results page is already stored to stop paginating.
+
+    Listings are newest first, so once a page is (mostly) jobs we already
+    have, the pages after it rarely hold anything new.
+    """
+    stop_ratio = settings.SCRAPER_INCREMENTAL_STOP_RATIO
+    job_keys = {url_key(job_url) for job_url in job_urls if job_url} - {None}
+    if stop_ratio <= 0 or not job_keys:
+        return False
+    known = Job.objects.filter(source_key__in=job_keys).count()
+    return known / len(job_keys) >= stop_ratio
+
 
 class JobScraper:
     """Enhanced scraper that can handle multiple websites and extract detailed job information"""
 
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Cache-Control": "no-cache",
-                "Pragma": "no-cache",
-                "Upgrade-Insecure-Requests": "1",
-            }
-        )
+    def __init__(self, raise_errors: bool = False) -> None:
+        self.session = cached_client(get_session("scraper", SCRAPER_HEADERS))
+        # Work-queue workers retry failed units, so they need a failed
+        # website to raise ``ScrapeFailed`` instead of coming back empty.
+        self.raise_errors = raise_errors
 
     def get_recent_jobs(
         self,
@@ -49,112 +105,335 @@ class JobScraper:
         keywords: Optional[str] = None,
         max_pages: int = 2,
         website_id: Optional[int] = None,
+        exclude_website_ids: Optional[Iterable[int]] = None,
     ) -> List[Job]:
-        """Get recent job postings from active custom websites"""
+        """Get recent job postings from active custom websites.
+
+        Websites on different domains are scraped concurrently by a bounded
+        worker pool; websites sharing a domain run one after another in the
+        same worker so per-domain pacing is preserved. Plain-HTML websites
+        using the asyncio engine all share a single worker and event loop.
+        """
         run_id = uuid.uuid4().hex[:8]
         start_time = time.monotonic()
-        all_new_jobs = []
         active_websites = CustomWebsite.objects.filter(is_active=True)
         if website_id:
             active_websites = active_websites.filter(id=website_id)
+        if exclude_website_ids:
+            active_websites = active_websites.exclude(id__in=exclude_website_ids)
+        active_websites = list(active_websites)
+        async_websites = [
+            website for website in active_websites if self._uses_async_engine(website)
+        ]
+        domain_groups = group_websites_by_domain(
+            [website for website in active_websites if website not in async_websites]
+        )
+        tasks = [(self._scrape_website_group, websites) for websites in domain_groups]
+        if async_websites:
+            tasks.append((self._scrape_async_websites, async_websites))
+        max_workers = max(1, min(settings.SCRAPE_MAX_WORKERS, len(tasks)))
 
         logger.info(
-            "scrape_run_start run_id=%s websites=%s country=%s max_pages=%s website_id=%s",
+            "scrape_run_start run_id=%s websites=%s domains=%s async_websites=%s workers=%s country=%s max_pages=%s website_id=%s",
             run_id,
-            active_websites.count(),
+            len(active_websites),
+            len(domain_groups),
+            len(async_websites),
+            max_workers,
             country,
             max_pages,
             website_id,
         )
 
-        for website in active_websites:
-            try:
-                cooldown_remaining = get_cooldown_remaining(website.id)
-                if cooldown_remaining > 0:
-                    logger.warning(
-                        "scrape_website_skipped_cooldown run_id=%s website_id=%s website=%s remaining_s=%s",
+        if max_workers == 1:
+            group_results = [
+                task(run_id, websites, country, keywords, max_pages)
+                for task, websites in tasks
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"scrape-{run_id}"
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._run_in_worker,
+                        task,
                         run_id,
-                        website.id,
-                        website.name,
-                        cooldown_remaining,
-                    )
-                    from .models import ScraperExecutionLog
-
-                    ScraperExecutionLog.objects.create(
-                        website=website,
-                        scraper_type=(
-                            "api"
-                            if website.is_api
-                            else ("seleniumbase" if website.use_stealth else "requests")
-                        ),
-                        jobs_found=0,
-                        error_message=(
-                            "Skipped due to anti-bot cooldown. "
-                            f"Retry in ~{cooldown_remaining}s."
-                        ),
+                        websites,
+                        country,
+                        keywords,
+                        max_pages,
                     )
+                    for task, websites in tasks
+                ]
+                group_results = [future.result() for future in futures]
+
+        all_new_jobs = []
+        seen_urls: set[str] = set()
+        for jobs in group_results:
+            for job in jobs:
+                if job.source_url and job.source_url in seen_urls:
                     continue
+                seen_urls.add(job.source_url)
+                all_new_jobs.append(job)
 
-                if website.name.lower() == "indeed" and not website.use_stealth:
-                    logger.warning(
-                        "high_friction_source_requests_mode run_id=%s website_id=%s website=%s",
-                        run_id,
-                        website.id,
-                        website.name,
-                    )
+        logger.info(
+            "scrape_run_done run_id=%s total_jobs_new=%s duration_ms=%s",
+            run_id,
+            len(all_new_jobs),
+            int((time.monotonic() - start_time) * 1000),
+        )
 
-                if website.is_api:
-                    from .api_scraper import ApiScraper
-
-                    scraper = ApiScraper()
-                    jobs = scraper.scrape(website, keywords, country)
-                    all_new_jobs.extend(jobs)
-                elif website.use_stealth:
-                    from .stealth_scraper import StealthScraper
-
-                    scraper = StealthScraper(headless=True)
-                    jobs = scraper.scrape(website, keywords, country, max_pages)
-                    all_new_jobs.extend(jobs)
-                else:
-                    jobs = self._scrape_custom_website(
-                        website, country, keywords, max_pages
-                    )
-                    all_new_jobs.extend(jobs)
+        return all_new_jobs
 
-                logger.info(
-                    "scrape_website_done run_id=%s website_id=%s website=%s jobs_new=%s scraper=%s",
+    def get_api_jobs_once(
+        self,
+        country: str,
+        phrases: List[str],
+        website_ids: Optional[Iterable[Optional[int]]] = None,
+    ) -> Tuple[List[Job], List[int]]:
+        """Scrape fetch-once API websites a single time for all phrases.
+
+        Returns the new jobs and the ids of the websites that were planned,
+        so callers can leave them out of the per-phrase loop.
+        """
+        from .api_scraper import ApiScraper, api_fetches_once
+
+        run_id = uuid.uuid4().hex[:8]
+        websites = CustomWebsite.objects.filter(is_active=True, is_api=True)
+        selected_ids = [website_id for website_id in website_ids or [] if website_id]
+        if selected_ids:
+            websites = websites.filter(id__in=selected_ids)
+        websites = [website for website in websites if api_fetches_once(website)]
+        if not websites or not phrases:
+            return [], []
+
+        logger.info(
+            "api_fetch_plan run_id=%s websites=%s phrases=%s",
+            run_id,
+            len(websites),
+            len(phrases),
+        )
+
+        responses: Dict[str, Any] = {}
+        jobs = []
+        for website in websites:
+            if self._skip_for_cooldown(run_id, website):
+                continue
+            try:
+                jobs.extend(
+                    ApiScraper(
+                        run_id=run_id, raise_errors=self.raise_errors
+                    ).scrape_phrases(website, phrases, country, responses)
+                )
+            except Exception:
+                logger.exception(
+                    "scrape_website_failed run_id=%s website_id=%s website=%s",
                     run_id,
                     website.id,
                     website.name,
-                    len(jobs),
-                    (
-                        "api"
-                        if website.is_api
-                        else (
-                            "seleniumbase_stealth"
-                            if website.use_stealth
-                            else "requests"
-                        )
-                    ),
                 )
+                if self.raise_errors:
+                    raise
+        return jobs, [website.id for website in websites]
+
+    def _uses_async_engine(self, website: CustomWebsite) -> bool:
+        if website.is_api or website.use_stealth:
+            return False
+        if not (website.use_async_engine or settings.REQUEST_ASYNC_ENGINE_ENABLED):
+            return False
+        if not async_engine_available():
+            logger.warning(
+                "async_engine_unavailable website_id=%s website=%s fallback=requests",
+                website.id,
+                website.name,
+            )
+            return False
+        return True
 
-            except Exception:
-                logger.exception(
-                    "scrape_website_failed run_id=%s website_id=%s website=%s",
+    def _run_in_worker(self, task, *args: Any) -> Any:
+        try:
+            return task(*args)
+        finally:
+            # Worker threads open their own DB connections; release them
+            # before the thread goes back to the pool.
+            connections.close_all()
+
+    def _scrape_website_group(
+        self,
+        run_id: str,
+        websites: List[CustomWebsite],
+        country: str,
+        keywords: Optional[str],
+        max_pages: int,
+    ) -> List[Job]:
+        jobs = []
+        for website in websites:
+            jobs.extend(
+                self._scrape_website(run_id, website, country, keywords, max_pages)
+            )
+        return jobs
+
+    def _scrape_website(
+        self,
+        run_id: str,
+        website: CustomWebsite,
+        country: str,
+        keywords: Optional[str],
+        max_pages: int,
+    ) -> List[Job]:
+        try:
+            if self._skip_for_cooldown(run_id, website):
+                return []
+
+            if website.name.lower() == "indeed" and not website.use_stealth:
+                logger.warning(
+                    "high_friction_source_requests_mode run_id=%s website_id=%s website=%s",
                     run_id,
                     website.id,
                     website.name,
                 )
-                continue
 
-        logger.info(
-            "scrape_run_done run_id=%s total_jobs_new=%s duration_ms=%s",
+            if website.is_api:
+                from .api_scraper import ApiScraper
+
+                scraper = ApiScraper(raise_errors=self.raise_errors)
+                jobs = scraper.scrape(website, keywords, country)
+            elif website.use_stealth:
+                from .stealth_scraper import StealthScraper
+
+                scraper = StealthScraper(headless=True, raise_errors=self.raise_errors)
+                jobs = scraper.scrape(website, keywords, country, max_pages)
+            else:
+                jobs = self._scrape_custom_website(
+                    website, country, keywords, max_pages
+                )
+
+            logger.info(
+                "scrape_website_done run_id=%s website_id=%s website=%s jobs_new=%s scraper=%s",
+                run_id,
+                website.id,
+                website.name,
+                len(jobs),
+                (
+                    "api"
+                    if website.is_api
+                    else (
+                        "seleniumbase_stealth" if website.use_stealth else "requests"
+                    )
+                ),
+            )
+            return jobs
+
+        except Exception:
+            logger.exception(
+                "scrape_website_failed run_id=%s website_id=%s website=%s",
+                run_id,
+                website.id,
+                website.name,
+            )
+            if self.raise_errors:
+                raise
+            return []
+
+    def _skip_for_cooldown(self, run_id: str, website: CustomWebsite) -> bool:
+        cooldown_remaining = get_cooldown_remaining(website.id)
+        if cooldown_remaining <= 0:
+            return False
+
+        logger.warning(
+            "scrape_website_skipped_cooldown run_id=%s website_id=%s website=%s remaining_s=%s",
             run_id,
-            len(all_new_jobs),
-            int((time.monotonic() - start_time) * 1000),
+            website.id,
+            website.name,
+            cooldown_remaining,
         )
+        from .models import ScraperExecutionLog
 
-        return all_new_jobs
+        ScraperExecutionLog.objects.create(
+            website=website,
+            scraper_type=(
+                "api"
+                if website.is_api
+                else ("seleniumbase" if website.use_stealth else "requests")
+            ),
+            jobs_found=0,
+            error_message=(
+                "Skipped due to anti-bot cooldown. "
+                f"Retry in ~{cooldown_remaining}s."
+            ),
+        )
+        if self.raise_errors:
+            raise ScrapeFailed(f"Anti-bot cooldown, retry in ~{cooldown_remaining}s.")
+        return True
+
+    def _scrape_async_websites(
+        self,
+        run_id: str,
+        websites: List[CustomWebsite],
+        country: str,
+        keywords: Optional[str],
+        max_pages: int,
+    ) -> List[Job]:
+        # async_to_sync runs thread-sensitive ORM calls back on this thread.
+        results = async_to_sync(self._gather_async_websites)(
+            run_id, websites, country, keywords, max_pages
+        )
+        return [job for jobs in results for job in jobs]
+
+    async def _gather_async_websites(
+        self,
+        run_id: str,
+        websites: List[CustomWebsite],
+        country: str,
+        keywords: Optional[str],
+        max_pages: int,
+    ) -> List[List[Job]]:
+        async with AsyncFetchEngine(dict(self.session.headers)) as engine:
+            return await asyncio.gather(
+                *(
+                    self._scrape_website_async(
+                        engine, run_id, website, country, keywords, max_pages
+                    )
+                    for website in websites
+                )
+            )
+
+    async def _scrape_website_async(
+        self,
+        engine: AsyncFetchEngine,
+        run_id: str,
+        website: CustomWebsite,
+        country: str,
+        keywords: Optional[str],
+        max_pages: int,
+    ) -> List[Job]:
+        try:
+            if await sync_to_async(self._skip_for_cooldown)(run_id, website):
+                return []
+
+            jobs = await self._scrape_custom_website_async(
+                engine, website, country, keywords, max_pages
+            )
+            logger.info(
+                "scrape_website_done run_id=%s website_id=%s website=%s jobs_new=%s scraper=%s",
+                run_id,
+                website.id,
+                website.name,
+                len(jobs),
+                "requests_async",
+            )
+            return jobs
+        except Exception:
+            logger.exception(
+                "scrape_website_failed run_id=%s website_id=%s website=%s",
+                run_id,
+                website.id,
+                website.name,
+            )
+            if self.raise_errors:
+                raise
+            return []
 
     def _scrape_custom_website(
         self,
@@ -165,166 +444,97 @@ class JobScraper:
     ) -> List[Job]:
         """Scrape custom website using stored selectors (Requests version)"""
         started_at = time.monotonic()
-        jobs = []
-        error_msg = ""
-        html_content = ""
-        parsed_jobs_count = 0
-        detail_fetch_count = 0
-        detail_fetch_limit = 3
-        selector_metrics = ""
+        state = self._new_scrape_state(website)
 
         for page in range(max_pages):
             try:
-                jitter_sleep(
-                    settings.REQUEST_PAGE_JITTER_MIN_SECONDS,
-                    settings.REQUEST_PAGE_JITTER_MAX_SECONDS,
+                url = self._build_search_url(website, country, keywords, page + 1)
+                if not is_cached(url):
+                    throttle(url, website_rate(website))
+                response = conditional_get(
+                    self.session, url, timeout=settings.REQUEST_SCRAPER_TIMEOUT_SECONDS
                 )
-
-                # Build search URL
-                search_url = website.search_url
-                if "{keywords}" in search_url and keywords:
-                    search_url = search_url.replace("{keywords}", keywords)
-                if "{location}" in search_url:
-                    search_url = search_url.replace("{location}", country)
-                if "{page}" in search_url:
-                    search_url = search_url.replace("{page}", str(page + 1))
-
-                response = self.session.get(
-                    search_url, timeout=settings.REQUEST_SCRAPER_TIMEOUT_SECONDS
-                )
-                html_content = response.text if hasattr(response, "text") else ""
-                soup = BeautifulSoup(response.content, "html.parser")
-                job_cards = soup.select(website.job_list_selector)
-                coverage = compute_selector_coverage(
-                    job_cards,
-                    {
-                        "title": website.title_selector,
-                        "company": website.company_selector,
-                        "location": website.location_selector,
-                        "job_link": website.job_link_selector,
-                        "salary": website.salary_selector,
-                        "date": website.date_selector,
-                    },
-                )
-                selector_metrics = summarize_selector_coverage(coverage)
-
-                anti_bot_result = classify_anti_bot_response(
-                    response.status_code,
-                    html_content,
-                    len(job_cards),
-                )
-                if anti_bot_result["blocked"]:
-                    outcome = record_block_event(website.id)
-                    error_msg = (
-                        "Anti-bot challenge detected. "
-                        f"{anti_bot_result['reason']} failures={outcome['failures']}"
-                    )
-                    logger.warning(
-                        "requests_antibot_detected website_id=%s website=%s page=%s reason=%s failures=%s",
+                if is_not_modified(response):
+                    # Unchanged since the last accepted fetch, so every card
+                    # on it (and most likely after it) is already stored.
+                    logger.info(
+                        "requests_page_not_modified website_id=%s website=%s page=%s",
                         website.id,
                         website.name,
                         page + 1,
-                        anti_bot_result["reason"],
-                        outcome["failures"],
                     )
                     break
-
-                try:
-                    response.raise_for_status()
-                except Exception as e:
-                    error_msg = f"HTTP Error: {e}"
+                job_cards = self._parse_search_page(website, page + 1, response, state)
+                if job_cards is None:
                     break
+                remember_response(url, response)
 
-                if not job_cards:
-                    error_msg = f"No job cards found matching selector: {website.job_list_selector}"
+                page_known = page_is_known(
+                    [job_data["job_url"] for _, job_data in job_cards]
+                )
+                if self._save_page_with_details(
+                    website, page + 1, job_cards, keywords, state
+                ):
+                    # Only once the jobs are stored: the next run's 304
+                    # skips the page.
+                    remember_validators(url, response)
+                if page_known:
+                    self._log_incremental_stop(website, page + 1, max_pages)
                     break
 
-                clear_block_state(website.id)
-                logger.info(
-                    "requests_selector_coverage website_id=%s website=%s page=%s metrics=%s",
+            except Exception as e:
+                logger.exception(
+                    "page_scrape_failed website_id=%s website=%s page=%s",
                     website.id,
                     website.name,
                     page + 1,
-                    selector_metrics,
                 )
+                state["error_msg"] = str(e)
+                state["failed"] = True
+                break
+
+        return self._finish_custom_website(website, state, started_at)
 
-                for card_number, card in enumerate(job_cards, start=1):
-                    try:
-                        job_data = self._parse_custom_card(
-                            card,
-                            website,
-                            page + 1,
-                            card_number,
-                        )
-                        if job_data:
-                            # If we have a detail link and description selector, fetch details
-                            if (
-                                job_data.get("job_url")
-                                and website.description_selector
-                                and detail_fetch_count < detail_fetch_limit
-                            ):
-                                jitter_sleep(
-                                    settings.REQUEST_DETAIL_JITTER_MIN_SECONDS,
-                                    settings.REQUEST_DETAIL_JITTER_MAX_SECONDS,
-                                )
-                                detail_data = self._get_custom_details(
-                                    job_data["job_url"], website
-                                )
-                                job_data.update(detail_data)
-                                detail_fetch_count += 1
-
-                            # Apply heuristic parsing
-                            description = job_data.get("description", "")
-                            job_data = self._enrich_job_data(
-                                job_data, description, keywords
-                            )
-
-                            # Create/Update the Job model instance
-                            job, created = Job.objects.update_or_create(
-                                source_url=job_data["job_url"],
-                                defaults={
-                                    "title": job_data["title"],
-                                    "company": job_data["company"],
-                                    "location": job_data["location"],
-                                    "city": job_data.get("city", ""),
-                                    "country": job_data.get("country", ""),
-                                    "continent": job_data.get("continent", ""),
-                                    "salary": job_data.get("salary", ""),
-                                    "job_type": job_data.get("job_type", ""),
-                                    "experience_level": job_data.get(
-                                        "experience_level", ""
-                                    ),
-                                    "industry": job_data.get("industry", ""),
-                                    "posted_date": None,  # Parsing dates generically is hard, we'll use created_at
-                                    "source_website": website.name,
-                                    "description": description,
-                                    "requirements": job_data.get("requirements", ""),
-                                    "application_link": job_data.get(
-                                        "application_link", ""
-                                    ),
-                                    "is_rfp": (
-                                        "contract" in (keywords or "").lower()
-                                        or "rfp" in (keywords or "").lower()
-                                    ),
-                                },
-                            )
-                            parsed_jobs_count += 1
-                            if created:
-                                jobs.append(job)
-                    except Exception:
-                        logger.exception(
-                            "card_parse_failed website_id=%s website=%s page=%s card=%s",
-                            website.id,
-                            website.name,
-                            page + 1,
-                            card_number,
-                        )
-                        continue
-
-                jitter_sleep(
-                    settings.REQUEST_BETWEEN_PAGES_JITTER_MIN_SECONDS,
-                    settings.REQUEST_BETWEEN_PAGES_JITTER_MAX_SECONDS,
+    async def _scrape_custom_website_async(
+        self,
+        engine: AsyncFetchEngine,
+        website: CustomWebsite,
+        country: str,
+        keywords: Optional[str],
+        max_pages: int,
+    ) -> List[Job]:
+        """Scrape custom website using stored selectors (asyncio version)"""
+        started_at = time.monotonic()
+        state = self._new_scrape_state(website)
+
+        for page in range(max_pages):
+            try:
+                response = await engine.fetch(
+                    self._build_search_url(website, country, keywords, page + 1),
+                    timeout=settings.REQUEST_SCRAPER_TIMEOUT_SECONDS,
+                    rate_per_minute=website_rate(website),
+                )
+                parsed = await run_parser_async(
+                    parse_search_page,
+                    response.content,
+                    website_selectors(website),
+                    page + 1,
+                )
+                job_cards = await sync_to_async(self._check_search_page)(
+                    website, page + 1, response, parsed, state
+                )
+                if job_cards is None:
+                    break
+
+                page_known = await sync_to_async(page_is_known)(
+                    [job_data["job_url"] for _, job_data in job_cards]
                 )
+                await self._save_page_with_details_async(
+                    engine, website, page + 1, job_cards, keywords, state
+                )
+                if page_known:
+                    self._log_incremental_stop(website, page + 1, max_pages)
+                    break
 
             except Exception as e:
                 logger.exception(
@@ -333,43 +543,394 @@ class JobScraper:
                     website.name,
                     page + 1,
                 )
-                error_msg = str(e)
+                state["error_msg"] = str(e)
+                state["failed"] = True
                 break
 
+        return await sync_to_async(self._finish_custom_website)(
+            website, state, started_at
+        )
+
+    def _new_scrape_state(self, website: CustomWebsite) -> dict[str, Any]:
+        return {
+            "jobs": [],
+            "error_msg": "",
+            "failed": False,
+            "html_content": "",
+            "parsed_jobs_count": 0,
+            "detail_fetch_count": 0,
+            "detail_fetch_limit": website.detail_fetch_limit,
+            "detail_fetch_known": 0,
+            "selector_metrics": "",
+        }
+
+    def _build_search_url(
+        self,
+        website: CustomWebsite,
+        country: str,
+        keywords: Optional[str],
+        page_number: int,
+    ) -> str:
+        search_url = website.search_url
+        if "{keywords}" in search_url and keywords:
+            search_url = search_url.replace("{keywords}", keywords)
+        if "{location}" in search_url:
+            search_url = search_url.replace("{location}", country)
+        if "{page}" in search_url:
+            search_url = search_url.replace("{page}", str(page_number))
+        return search_url
+
+    def _parse_search_page(
+        self,
+        website: CustomWebsite,
+        page_number: int,
+        response: Any,
+        state: dict[str, Any],
+    ) -> Optional[List[tuple[int, dict[str, Any]]]]:
+        """Parse one search results page into ``(card_number, job_data)`` pairs.
+
+        Returns ``None`` when pagination should stop (block, HTTP error or
+        no cards), recording the reason in ``state["error_msg"]``.
+        """
+        parsed = run_parser(
+            parse_search_page, response.content, website_selectors(website), page_number
+        )
+        return self._check_search_page(website, page_number, response, parsed, state)
+
+    def _log_incremental_stop(
+        self, website: CustomWebsite, page_number: int, max_pages: int
+    ) -> None:
+        logger.info(
+            "requests_incremental_stop website_id=%s website=%s page=%s max_pages=%s",
+            website.id,
+            website.name,
+            page_number,
+            max_pages,
+        )
+
+    def _check_search_page(
+        self,
+        website: CustomWebsite,
+        page_number: int,
+        response: Any,
+        parsed: dict[str, Any],
+        state: dict[str, Any],
+    ) -> Optional[List[tuple[int, dict[str, Any]]]]:
+        html_content = response.text if hasattr(response, "text") else ""
+        state["html_content"] = html_content
+        state["selector_metrics"] = parsed["selector_metrics"]
+
+        anti_bot_result = classify_anti_bot_response(
+            response.status_code,
+            html_content,
+            parsed["card_count"],
+        )
+        # A replayed page says nothing about how the site treats us now.
+        live = not is_cached_response(response)
+        if anti_bot_result["blocked"]:
+            failures = "replayed"
+            if live:
+                failures = record_block_event(website.id)["failures"]
+                record_pacing_backoff(website)
+            state["error_msg"] = (
+                "Anti-bot challenge detected. "
+                f"{anti_bot_result['reason']} failures={failures}"
+            )
+            state["failed"] = True
+            logger.warning(
+                "requests_antibot_detected website_id=%s website=%s page=%s reason=%s failures=%s",
+                website.id,
+                website.name,
+                page_number,
+                anti_bot_result["reason"],
+                failures,
+            )
+            return None
+
+        try:
+            response.raise_for_status()
+        except Exception as e:
+            state["error_msg"] = f"HTTP Error: {e}"
+            state["failed"] = True
+            return None
+
+        if not parsed["card_count"]:
+            state["error_msg"] = (
+                f"No job cards found matching selector: {website.job_list_selector}"
+            )
+            return None
+
+        if live:
+            clear_block_state(website.id)
+            record_pacing_success(website)
+        logger.info(
+            "requests_selector_coverage website_id=%s website=%s page=%s metrics=%s",
+            website.id,
+            website.name,
+            page_number,
+            state["selector_metrics"],
+        )
+        return parsed["cards"]
+
+    def _select_detail_targets(
+        self,
+        website: CustomWebsite,
+        job_cards: List[tuple[int, dict[str, Any]]],
+        state: dict[str, Any],
+    ) -> List[tuple[int, dict[str, Any]]]:
+        """Pick the cards whose detail pages fit in the remaining budget.
+
+        Cards already stored with a description reuse it instead of being
+        fetched again, and do not count towards the budget.
+        """
+        if not website.description_selector:
+            return []
+
+        job_keys = {
+            card_number: url_key(job_data["job_url"])
+            for card_number, job_data in job_cards
+            if job_data["job_url"]
+        }
+        known_details = {
+            source_key: {
+                "description": description,
+                "requirements": requirements,
+                "application_link": application_link,
+            }
+            for source_key, description, requirements, application_link in (
+                Job.objects.filter(source_key__in=set(job_keys.values()))
+                .exclude(description="")
+                .values_list(
+                    "source_key", "description", "requirements", "application_link"
+                )
+            )
+        }
+
+        targets = []
+        for card_number, job_data in job_cards:
+            if not job_data["job_url"]:
+                continue
+            if job_keys[card_number] in known_details:
+                job_data.update(known_details[job_keys[card_number]])
+                state["detail_fetch_known"] += 1
+                continue
+            if state["detail_fetch_count"] >= state["detail_fetch_limit"]:
+                continue
+            targets.append((card_number, job_data))
+            state["detail_fetch_count"] += 1
+        return targets
+
+    def _save_page_with_details(
+        self,
+        website: CustomWebsite,
+        page_number: int,
+        job_cards: List[tuple[int, dict[str, Any]]],
+        keywords: Optional[str],
+        state: dict[str, Any],
+    ) -> bool:
+        """Save a page of cards, fetching budgeted detail pages concurrently.
+
+        Cards without a detail fetch are saved first; the others are saved
+        one by one as their detail page comes back. Returns whether every
+        save succeeded.
+        """
+        targets = self._select_detail_targets(website, job_cards, state)
+        target_numbers = {card_number for card_number, _ in targets}
+        saved = self._save_page_jobs(
+            website,
+            page_number,
+            [card for card in job_cards if card[0] not in target_numbers],
+            keywords,
+            state,
+        )
+        if not targets:
+            return saved
+
+        with ThreadPoolExecutor(
+            max_workers=min(settings.REQUEST_DETAIL_CONCURRENCY, len(targets)),
+            thread_name_prefix=f"detail-{website.id}",
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._run_in_worker,
+                    self._get_paced_custom_details,
+                    job_data["job_url"],
+                    website,
+                ): (card_number, job_data)
+                for card_number, job_data in targets
+            }
+            for future in as_completed(futures):
+                card_number, job_data = futures[future]
+                job_data.update(future.result())
+                if not self._save_page_jobs(
+                    website, page_number, [(card_number, job_data)], keywords, state
+                ):
+                    saved = False
+        return saved
+
+    async def _save_page_with_details_async(
+        self,
+        engine: AsyncFetchEngine,
+        website: CustomWebsite,
+        page_number: int,
+        job_cards: List[tuple[int, dict[str, Any]]],
+        keywords: Optional[str],
+        state: dict[str, Any],
+    ) -> None:
+        """Save a page of cards, fetching detail pages on the event loop."""
+        targets = await sync_to_async(self._select_detail_targets)(
+            website, job_cards, state
+        )
+        target_numbers = {card_number for card_number, _ in targets}
+        await sync_to_async(self._save_page_jobs)(
+            website,
+            page_number,
+            [card for card in job_cards if card[0] not in target_numbers],
+            keywords,
+            state,
+        )
+
+        async def fetch_details(card_number, job_data):
+            job_data.update(
+                await self._get_custom_details_async(
+                    engine, job_data["job_url"], website
+                )
+            )
+            return card_number, job_data
+
+        for next_done in asyncio.as_completed(
+            [fetch_details(card_number, job_data) for card_number, job_data in targets]
+        ):
+            card = await next_done
+            await sync_to_async(self._save_page_jobs)(
+                website, page_number, [card], keywords, state
+            )
+
+    def _save_page_jobs(
+        self,
+        website: CustomWebsite,
+        page_number: int,
+        job_cards: List[tuple[int, dict[str, Any]]],
+        keywords: Optional[str],
+        state: dict[str, Any],
+    ) -> bool:
+        # Heuristics and locations for the whole page in one batch
+        heuristics = enrich_descriptions(
+            job_data.get("description", "") for _, job_data in job_cards
+        )
+        locations = parse_locations(
+            job_data.get("location", "") for _, job_data in job_cards
+        )
+        job_entries = []
+        for (card_number, job_data), found, geo in zip(
+            job_cards, heuristics, locations
+        ):
+            try:
+                # Apply heuristic parsing
+                description = job_data.get("description", "")
+                job_data = enrich_job_data(job_data, description, found, geo)
+
+                job_entries.append(
+                    {
+                        "source_url": job_data["job_url"],
+                        "defaults": {
+                            "title": job_data["title"],
+                            "company": job_data["company"],
+                            "location": job_data["location"],
+                            "city": job_data.get("city", ""),
+                            "country": job_data.get("country", ""),
+                            "continent": job_data.get("continent", ""),
+                            "salary": job_data.get("salary", ""),
+                            "job_type": job_data.get("job_type", ""),
+                            "experience_level": job_data.get("experience_level", ""),
+                            "industry": job_data.get("industry", ""),
+                            "expertise_tags": job_data.get("expertise_tags", ""),
+                            # Parsing dates generically is hard, we'll use created_at
+                            "posted_date": None,
+                            "source_website": website.name,
+                            "description": description,
+                            "requirements": job_data.get("requirements", ""),
+                            "application_link": job_data.get("application_link", ""),
+                            "is_rfp": is_rfp_query(keywords),
+                        },
+                    }
+                )
+            except Exception:
+                logger.exception(
+                    "card_parse_failed website_id=%s website=%s page=%s card=%s",
+                    website.id,
+                    website.name,
+                    page_number,
+                    card_number,
+                )
+                continue
+
+        # Create/Update the page's Job rows in one transaction
+        try:
+            created_jobs = upsert_jobs(job_entries)
+        except Exception:
+            logger.exception(
+                "page_save_failed website_id=%s website=%s page=%s jobs=%s",
+                website.id,
+                website.name,
+                page_number,
+                len(job_entries),
+            )
+            return False
+        state["parsed_jobs_count"] += len(job_entries)
+        state["jobs"].extend(created_jobs)
+        return True
+
+    def _finish_custom_website(
+        self, website: CustomWebsite, state: dict[str, Any], started_at: float
+    ) -> List[Job]:
         from datetime import datetime
 
         from .models import ScraperExecutionLog
 
+        error_msg = state["error_msg"]
         # Check for silent failures
-        if parsed_jobs_count == 0 and not error_msg:
+        if state["parsed_jobs_count"] == 0 and not error_msg:
             error_msg = "No jobs found. CSS selectors may be outdated or the site is blocking silently."
 
         log = ScraperExecutionLog.objects.create(
             website=website,
             scraper_type="requests",
-            jobs_found=parsed_jobs_count,
+            jobs_found=state["parsed_jobs_count"],
             error_message=error_msg,
         )
-        if html_content:
+        if state["html_content"]:
             timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
             log.html_dump.save(
                 f"{website.name}_error_{timestamp_str}.html",
-                ContentFile(html_content.encode("utf-8")),
+                ContentFile(state["html_content"].encode("utf-8")),
                 save=True,
             )
 
         logger.info(
-            "requests_scrape_done website_id=%s website=%s jobs_new=%s duration_ms=%s has_error=%s selector_metrics=%s detail_fetches=%s",
+            "requests_scrape_done website_id=%s website=%s jobs_new=%s duration_ms=%s has_error=%s selector_metrics=%s detail_fetches=%s detail_known=%s",
             website.id,
             website.name,
-            len(jobs),
+            len(state["jobs"]),
             int((time.monotonic() - started_at) * 1000),
             bool(error_msg),
-            selector_metrics or "n/a",
-            detail_fetch_count,
+            state["selector_metrics"] or "n/a",
+            state["detail_fetch_count"],
+            state["detail_fetch_known"],
         )
 
-        return jobs
+        # Jobs saved from earlier pages still count; only a scrape that
+        # failed before saving anything is worth retrying.
+        if self.raise_errors and state["failed"] and not state["jobs"]:
+            raise ScrapeFailed(error_msg)
+        return state["jobs"]
+
+    def _get_paced_custom_details(
+        self, job_url: str, website: CustomWebsite
+    ) -> dict[str, Any]:
+        if not is_cached(job_url):
+            throttle(job_url, website_rate(website))
+        return self._get_custom_details(job_url, website)
 
     def _get_custom_details(self, job_url: str, website: CustomWebsite) -> dict[str, Any]:
         """Fetch job detail page using custom selectors"""
@@ -377,34 +938,17 @@ class JobScraper:
             response = self.session.get(
                 job_url, timeout=settings.REQUEST_DETAIL_TIMEOUT_SECONDS
             )
+            replayed = is_cached_response(response)
+            if response.status_code in BLOCK_STATUS_CODES and not replayed:
+                record_pacing_backoff(website)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            description = ""
-            if website.description_selector:
-                desc_elem = soup.select_one(website.description_selector)
-                description = (
-                    self._clean_text(desc_elem.get_text()) if desc_elem else ""
-                )
-
-            requirements = ""
-            if website.requirements_selector:
-                req_elem = soup.select_one(website.requirements_selector)
-                requirements = self._clean_text(req_elem.get_text()) if req_elem else ""
-
-            application_link = ""
-            if website.apply_link_selector:
-                apply_elem = soup.select_one(website.apply_link_selector)
-                if apply_elem:
-                    application_link = apply_elem.get("href")
-                    if application_link and not application_link.startswith("http"):
-                        application_link = urljoin(website.base_url, application_link)
-
-            return {
-                "description": description,
-                "requirements": requirements,
-                "application_link": application_link or job_url,
-            }
+            details = run_parser(
+                parse_detail_page, response.content, job_url, website_selectors(website)
+            )
+            # Only a page the description selector matched is worth replaying.
+            if details.get("description"):
+                remember_response(job_url, response)
+            return details
         except Exception:
             logger.exception(
                 "detail_fetch_failed website_id=%s website=%s job_url=%s",
@@ -414,218 +958,27 @@ class JobScraper:
             )
             return {}
 
-    def _parse_custom_card(
-        self,
-        card,
-        custom_website: CustomWebsite,
-        page_number: int,
-        card_number: int,
-    ) -> Optional[dict[str, Any]]:
-        """Parse job card using custom selectors"""
+    async def _get_custom_details_async(
+        self, engine: AsyncFetchEngine, job_url: str, website: CustomWebsite
+    ) -> dict[str, Any]:
+        """Fetch job detail page using custom selectors (asyncio version)"""
         try:
-            # Extract basic information using custom selectors
-            title_elem = card.select_one(custom_website.title_selector)
-            title = self._clean_text(title_elem.get_text()) if title_elem else ""
-
-            company_elem = card.select_one(custom_website.company_selector)
-            company = self._clean_text(company_elem.get_text()) if company_elem else ""
-
-            location_elem = card.select_one(custom_website.location_selector)
-            location = (
-                self._clean_text(location_elem.get_text()) if location_elem else ""
+            response = await engine.fetch(
+                job_url,
+                timeout=settings.REQUEST_DETAIL_TIMEOUT_SECONDS,
+                rate_per_minute=website_rate(website),
+            )
+            if response.status_code in BLOCK_STATUS_CODES:
+                await sync_to_async(record_pacing_backoff)(website)
+            response.raise_for_status()
+            return await run_parser_async(
+                parse_detail_page, response.content, job_url, website_selectors(website)
             )
-
-            # Extract job link
-            job_link_elem = card.select_one(custom_website.job_link_selector)
-            job_url = ""
-            if job_link_elem:
-                job_url = job_link_elem.get("href")
-                if job_url and not job_url.startswith("http"):
-                    job_url = urljoin(custom_website.base_url, job_url)
-
-            # Extract additional information if selectors are provided
-            salary = ""
-            if custom_website.salary_selector:
-                salary_elem = card.select_one(custom_website.salary_selector)
-                salary = self._clean_text(salary_elem.get_text()) if salary_elem else ""
-
-            posted_date = ""
-            if custom_website.date_selector:
-                date_elem = card.select_one(custom_website.date_selector)
-                posted_date = (
-                    self._clean_text(date_elem.get_text()) if date_elem else ""
-                )
-
-            return {
-                "id": f"custom-{custom_website.pk}-{page_number}-{card_number}",
-                "title": title,
-                "company": company,
-                "location": location,
-                "salary": salary,
-                "posted_date": posted_date,
-                "source_website": custom_website.name,
-                "source_url": job_url,
-                "job_url": job_url,
-            }
-
         except Exception:
             logger.exception(
-                "card_parse_exception website_id=%s website=%s page=%s card=%s",
-                custom_website.id,
-                custom_website.name,
-                page_number,
-                card_number,
+                "detail_fetch_failed website_id=%s website=%s job_url=%s",
+                website.id,
+                website.name,
+                job_url,
             )
-            return None
-
-    def _enrich_job_data(self, job_data: dict[str, Any], description: str, keywords: str) -> dict[str, Any]:
-        """Apply heuristic parsing to fill in missing fields."""
-
-        # 1. Location parsing (City, Country, Continent)
-        geo = parse_location_components(job_data.get("location", ""))
-        city = geo["city"]
-        country = geo["country"]
-        continent = geo["continent"]
-
-        job_data["city"] = city
-        job_data["country"] = country
-        job_data["continent"] = continent
-
-        # 2. Requirements fallback
-        if not job_data.get("requirements") and description:
-            job_data["requirements"] = self._extract_requirements(description)
-
-        # 3. Salary fallback
-        if not job_data.get("salary") and description:
-            job_data["salary"] = self._extract_salary_fallback(description)
-
-        # 4. Job type & experience
-        job_data["job_type"] = self._extract_job_type(description)
-        job_data["experience_level"] = self._extract_experience_level(description)
-        job_data["industry"] = self._extract_industry(description)
-
-        return job_data
-
-    def _extract_salary_fallback(self, description: str) -> str:
-        """Find salary patterns in text like $100,000 - $120,000"""
-        salary_pattern = re.compile(
-            r"(\$[\d,]+(?:\.\d{2})?(?:\s*(?:-|to)\s*\$[\d,]+(?:\.\d{2})?)?(?:\s*(?:a|per|/)\s*(?:year|yr|month|mo|hour|hr|week|wk|annually|k))?)",
-            re.IGNORECASE,
-        )
-        match = salary_pattern.search(description)
-        if match:
-            return match.group(1)
-
-        # Look for EUR/GBP as well
-        alt_pattern = re.compile(
-            r"((?:€|£)[\d,]+(?:\.\d{2})?(?:\s*(?:-|to)\s*(?:€|£)[\d,]+(?:\.\d{2})?)?(?:\s*(?:a|per|/)\s*(?:year|yr|month|mo|hour|hr|week|wk|annually|k))?)",
-            re.IGNORECASE,
-        )
-        alt_match = alt_pattern.search(description)
-        if alt_match:
-            return alt_match.group(1)
-
-        return ""
-
-    def _extract_requirements(self, description: str) -> str:
-        """Extract requirements from job description"""
-        requirements_keywords = [
-            "requirements",
-            "qualifications",
-            "skills",
-            "experience",
-            "must have",
-            "should have",
-            "preferred",
-            "minimum",
-            "what you need",
-            "what you'll bring",
-            "what we are looking for",
-            "what we're looking for",
-            "your profile",
-            "who you are",
-        ]
-
-        lines = description.split("\n")
-        requirements_lines = []
-        in_requirements = False
-
-        for line in lines:
-            line_lower = line.lower()
-
-            # Stop if we hit benefits or other sections
-            if any(
-                k in line_lower
-                for k in ["benefits", "what we offer", "perks", "equal opportunity"]
-            ):
-                in_requirements = False
-
-            if any(keyword in line_lower for keyword in requirements_keywords):
-                in_requirements = True
-                continue  # Skip the header line itself
-
-            if in_requirements and line.strip():
-                if line.strip().startswith(("•", "-", "*", "·", "✓", "o ")):
-                    requirements_lines.append(line.strip())
-                elif re.match(r"^\d+\.", line.strip()):
-                    requirements_lines.append(line.strip())
-
-        return "\n".join(requirements_lines) if requirements_lines else ""
-
-    def _extract_job_type(self, description: str) -> str:
-        """Extract job type from description"""
-        job_types = [
-            "full-time",
-            "part-time",
-            "contract",
-            "temporary",
-            "internship",
-            "freelance",
-        ]
-        description_lower = description.lower()
-        for job_type in job_types:
-            if job_type in description_lower:
-                return job_type.title()
-        return "Full-time"
-
-    def _extract_experience_level(self, description: str) -> str:
-        """Extract experience level from description"""
-        levels = {
-            "entry-level": ["entry level", "junior", "0-2 years", "1-2 years"],
-            "mid-level": ["mid level", "intermediate", "3-5 years", "2-5 years"],
-            "senior": ["senior", "lead", "5+ years", "7+ years", "experienced"],
-            "executive": ["executive", "director", "manager", "head of", "chief"],
-        }
-        description_lower = description.lower()
-        for level, keywords in levels.items():
-            if any(keyword in description_lower for keyword in keywords):
-                return level.title()
-        return "Mid-level"
-
-    def _extract_industry(self, description: str) -> str:
-        """Extract industry from description"""
-        industries = [
-            "technology",
-            "healthcare",
-            "finance",
-            "education",
-            "retail",
-            "manufacturing",
-            "consulting",
-            "marketing",
-            "sales",
-            "engineering",
-            "software",
-            "logistics",
-        ]
-        description_lower = description.lower()
-        for industry in industries:
-            if industry in description_lower:
-                return industry.title()
-        return "Technology"
-
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize text"""
-        if not text:
-            return ""
-        return re.sub(r"\s+", " ", text.strip())
+            return {}
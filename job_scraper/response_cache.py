@@ -0,0 +1,283 @@
+"""On-disk HTTP response cache with record and replay modes.
+
+Bodies are stored once per content hash under ``objects/`` (gzip), and each
+URL gets a small JSON entry under ``index/`` pointing at its body, so the
+same page fetched under several URLs costs one file.
+
+``HTTP_RESPONSE_CACHE_MODE`` is one of:
+
+- ``off``: every request goes to the network.
+- ``record``: fresh entries (younger than the TTL) are served from disk,
+  everything else is fetched and stored.
+- ``replay``: only the cache is used, whatever its age; a miss raises
+  ``ResponseCacheMiss`` instead of touching the network.
+
+``CachingClient`` never stores what it fetches. Scrapers call
+``remember_response`` once a page passed their checks (HTTP status, anti-bot
+markers, parsing), so errors and challenge pages served with a 200 are never
+replayed.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+EVICTION_CHECK_EVERY = 50
+
+_stores_since_eviction = 0
+_eviction_lock = threading.Lock()
+
+
+class ResponseCacheMiss(Exception):
+    """Raised in replay mode when a URL was never recorded."""
+
+
+def cache_mode() -> str:
+    mode = (settings.HTTP_RESPONSE_CACHE_MODE or MODE_OFF).lower()
+    return mode if mode in (MODE_RECORD, MODE_REPLAY) else MODE_OFF
+
+
+def cache_dir() -> Path:
+    return Path(
+        settings.HTTP_RESPONSE_CACHE_DIR or Path(settings.MEDIA_ROOT) / "response_cache"
+    )
+
+
+class CachingClient:
+    """Wraps a requests-style client so ``get`` goes through the cache.
+
+    Everything else (``headers``, ``post``, ...) is passed straight through.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        mode = cache_mode()
+        if mode == MODE_OFF:
+            return self._client.get(url, **kwargs)
+
+        cached = load_response(url, _max_age(mode))
+        if cached is not None:
+            return cached
+        if mode == MODE_REPLAY:
+            raise ResponseCacheMiss(f"No recorded response for {url}")
+
+        return self._client.get(url, **kwargs)
+
+
+def is_cached(url: str) -> bool:
+    """True when a ``CachingClient`` would answer ``url`` without the network.
+
+    Callers use it to skip rate limiting for requests that never leave disk.
+    """
+    mode = cache_mode()
+    if mode == MODE_OFF:
+        return False
+    entry = _read_entry(url)
+    max_age = _max_age(mode)
+    return entry is not None and (
+        max_age is None or time.time() - entry["stored_at"] <= max_age
+    )
+
+
+def is_cached_response(response: Any) -> bool:
+    return getattr(response, "from_cache", False) is True
+
+
+def remember_response(url: str, response: Any) -> bool:
+    """Record an accepted live 200 ``response`` for ``url`` in record mode."""
+    if cache_mode() != MODE_RECORD or is_cached_response(response):
+        return False
+    if getattr(response, "status_code", None) != 200:
+        return False
+    store_response(url, response)
+    return True
+
+
+def cached_client(client: Any) -> Any:
+    """``client`` wrapped in a ``CachingClient`` unless the cache is off."""
+    if cache_mode() == MODE_OFF:
+        return client
+    return CachingClient(client)
+
+
+def load_response(
+    url: str, max_age: Optional[float] = None
+) -> Optional[requests.Response]:
+    entry = _read_entry(url)
+    if entry is None:
+        return None
+    if max_age is not None and time.time() - entry["stored_at"] > max_age:
+        return None
+    try:
+        with gzip.open(_object_path(entry["body_hash"]), "rb") as handle:
+            content = handle.read()
+    except OSError:
+        return None
+
+    response = requests.Response()
+    response.status_code = entry["status_code"]
+    response.url = entry["url"]
+    response.encoding = entry["encoding"] or None
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response._content = content
+    response._content_consumed = True
+    response.from_cache = True
+    logger.debug("response_cache_hit url=%s", url)
+    return response
+
+
+def store_response(url: str, response: Any) -> None:
+    headers = getattr(response, "headers", {}) or {}
+    store_content(
+        url,
+        response.content or b"",
+        status_code=response.status_code,
+        encoding=getattr(response, "encoding", None) or "",
+        headers={
+            name: headers[name]
+            for name in ("Content-Type", "ETag", "Last-Modified")
+            if isinstance(headers.get(name), str)
+        },
+    )
+
+
+def store_content(
+    url: str,
+    content: bytes,
+    status_code: int = 200,
+    encoding: str = "",
+    headers: Optional[Dict[str, str]] = None,
+) -> None:
+    """Record ``content`` as the response for ``url``."""
+    body_hash = hashlib.sha256(content).hexdigest()
+    object_path = _object_path(body_hash)
+    try:
+        if not object_path.exists():
+            _atomic_write(object_path, gzip.compress(content))
+        else:
+            os.utime(object_path)
+        entry = {
+            "url": url,
+            "status_code": status_code,
+            "encoding": encoding,
+            "headers": headers or {},
+            "body_hash": body_hash,
+            "stored_at": time.time(),
+        }
+        _atomic_write(_index_path(url), json.dumps(entry).encode("utf-8"))
+    except OSError:
+        logger.warning("response_cache_store_failed url=%s", url, exc_info=True)
+        return
+    _maybe_evict()
+
+
+def evict(max_bytes: Optional[int] = None) -> int:
+    """Drop expired entries, then the least recently stored bodies over budget.
+
+    Returns the number of files removed.
+    """
+    max_bytes = (
+        settings.HTTP_RESPONSE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    )
+    root = cache_dir()
+    removed = 0
+    expires_before = time.time() - settings.HTTP_RESPONSE_CACHE_TTL_SECONDS
+    live_hashes = set()
+    for index_path in (root / "index").glob("*/*.json"):
+        try:
+            entry = json.loads(index_path.read_bytes())
+        except (OSError, ValueError):
+            entry = None
+        # Replay mode ignores age, so expired entries are only pruned here.
+        if entry is None or (
+            cache_mode() != MODE_REPLAY and entry["stored_at"] < expires_before
+        ):
+            index_path.unlink(missing_ok=True)
+            removed += 1
+            continue
+        live_hashes.add(entry["body_hash"])
+
+    objects = []
+    for object_path in (root / "objects").glob("*/*.gz"):
+        if object_path.stem not in live_hashes:
+            object_path.unlink(missing_ok=True)
+            removed += 1
+            continue
+        stat = object_path.stat()
+        objects.append((stat.st_mtime, stat.st_size, object_path))
+
+    total = sum(size for _, size, _ in objects)
+    for _, size, object_path in sorted(objects):
+        if total <= max_bytes:
+            break
+        # Index entries left pointing at a removed body just miss on read.
+        object_path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    if removed:
+        logger.info("response_cache_evicted files=%s bytes=%s", removed, total)
+    return removed
+
+
+def record_rendered_page(url: str, html_content: str) -> None:
+    """Keep a browser-rendered page in record mode (stored apart from HTTP bodies)."""
+    if cache_mode() == MODE_RECORD:
+        store_content(f"rendered:{url}", html_content.encode("utf-8"), encoding="utf-8")
+
+
+def _max_age(mode: str) -> Optional[float]:
+    return None if mode == MODE_REPLAY else settings.HTTP_RESPONSE_CACHE_TTL_SECONDS
+
+
+def _maybe_evict() -> None:
+    global _stores_since_eviction
+    with _eviction_lock:
+        _stores_since_eviction += 1
+        if _stores_since_eviction < EVICTION_CHECK_EVERY:
+            return
+        _stores_since_eviction = 0
+    evict()
+
+
+def _read_entry(url: str) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(_index_path(url).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _index_path(url: str) -> Path:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return cache_dir() / "index" / key[:2] / f"{key}.json"
+
+
+def _object_path(body_hash: str) -> Path:
+    return cache_dir() / "objects" / body_hash[:2] / f"{body_hash}.gz"
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
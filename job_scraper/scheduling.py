@@ -0,0 +1,58 @@
+"""Scrape-run helpers shared by the management commands and the work queue."""
+
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+
+from .apollo_client import ApolloClient
+from .emailing import send_scheduled_scrape_summary
+
+logger = logging.getLogger(__name__)
+
+
+def split_keyword_phrases(keywords: str) -> list[str]:
+    return [phrase.strip() for phrase in keywords.split(",") if phrase.strip()]
+
+
+def enrich_new_jobs(jobs, limit: int) -> int:
+    apollo = ApolloClient()
+    enriched_count = 0
+    for job in jobs[:limit]:
+        try:
+            enriched_count += apollo.enrich_job_contacts(job)
+        except Exception:
+            logger.exception(
+                "apollo_enrichment_failed job_id=%s company=%s", job.id, job.company
+            )
+    return enriched_count
+
+
+def finish_scheduled_run(schedule, run, new_jobs, contacts_found):
+    run.jobs_new = len(new_jobs)
+    run.contacts_found = contacts_found
+    try:
+        run.emails_sent = send_scheduled_scrape_summary(
+            schedule,
+            run,
+            new_jobs,
+            site_domain=settings.SITE_DOMAIN,
+        )
+    except Exception as exc:
+        run.email_error = str(exc)
+        logger.exception(
+            "scheduled_scrape_email_failed schedule_id=%s run_id=%s",
+            schedule.id,
+            run.id,
+        )
+
+    run.completed_at = timezone.now()
+    run.save(
+        update_fields=[
+            "jobs_new",
+            "contacts_found",
+            "emails_sent",
+            "email_error",
+            "completed_at",
+        ]
+    )
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import CustomWebsite
+from .parsing import invalidate_extraction_plans
+
+
+@receiver(post_save, sender=CustomWebsite)
+@receiver(post_delete, sender=CustomWebsite)
+def drop_compiled_selectors(sender, instance, **kwargs):
+    """Selector edits from ``edit_website`` or the admin take effect at once."""
+    invalidate_extraction_plans(instance.pk)
@@ -1,6 +1,5 @@
 import logging
 import random
-import re
 import time
 import uuid
 from contextlib import contextmanager
@@ -11,19 +10,37 @@ from typing import Any, Generator
 from django.conf import settings
 from django.core.files.base import ContentFile
 
-from bs4 import BeautifulSoup
 from seleniumbase import SB
 
 from .anti_bot import (
+    ScrapeFailed,
     classify_anti_bot_response,
     clear_block_state,
-    compute_selector_coverage,
     jitter_sleep,
     record_block_event,
-    summarize_selector_coverage,
 )
+from .browser_pool import get_browser_pool
+from .enrichment import enrich_job_data
+from .html_backends import PARSER_HTML
+from .job_store import upsert_jobs
+from .keyword_matcher import is_rfp_query
 from .models import CustomWebsite, Job, ScraperExecutionLog
-from .utils import parse_location_components
+from .parsing import (
+    extract_description,
+    html_parser_for,
+    parse_stealth_search_page,
+    run_parser,
+    website_selectors,
+)
+from .rate_limiter import (
+    record_pacing_backoff,
+    record_pacing_success,
+    throttle,
+    website_rate,
+)
+from .request_scraper import page_is_known
+from .response_cache import record_rendered_page
+from .url_keys import url_key
 
 logger = logging.getLogger(__name__)
 USER_AGENTS = [
@@ -33,14 +50,48 @@ USER_AGENTS = [
 ]
 
 
+def build_session_manager(headless: bool = True) -> SB:
+    """Un-entered UC browser context with a randomised agent and window."""
+    width = random.randint(
+        settings.STEALTH_WINDOW_WIDTH_MIN,
+        settings.STEALTH_WINDOW_WIDTH_MAX,
+    )
+    height = random.randint(
+        settings.STEALTH_WINDOW_HEIGHT_MIN,
+        settings.STEALTH_WINDOW_HEIGHT_MAX,
+    )
+    return SB(
+        browser="chrome",
+        headless2=headless,
+        uc=True,
+        uc_subprocess=True,
+        agent=random.choice(USER_AGENTS),
+        locale_code="en-US",
+        window_size=f"{width},{height}",
+        chromium_arg="--disable-blink-features=AutomationControlled,--disable-dev-shm-usage",
+        test=True,
+    )
+
+
 class StealthScraper:
     """Generic stealth scraper powered by SeleniumBase UC mode."""
 
-    def __init__(self, headless: bool = True, run_id: str | None = None) -> None:
+    def __init__(
+        self,
+        headless: bool = True,
+        run_id: str | None = None,
+        raise_errors: bool = False,
+    ) -> None:
         self.headless = headless
         self._run_id = run_id
+        self._raise_errors = raise_errors
         self._driver = None
-        self._session_manager = self._build_session_manager()
+        self._pages_opened = 0
+        self._session_invalid = False
+        self._rate_per_minute = None
+        self._html_parser = PARSER_HTML
+        # Built on first use: a scrape on a pooled browser never needs one.
+        self._session_manager = None
 
     def scrape(
         self, website: CustomWebsite, keywords: str, location: str, max_pages: int = 1
@@ -51,6 +102,8 @@ class StealthScraper:
 
         self._ensure_run_id()
         self._log_scrape_start(website, max_pages)
+        self._rate_per_minute = website_rate(website)
+        self._html_parser = html_parser_for(website)
 
         state = {
             "all_new_jobs": [],
@@ -58,7 +111,7 @@ class StealthScraper:
             "screenshot_bytes": None,
             "html_content": "",
             "detail_fetch_count": 0,
-            "detail_fetch_limit": 3,
+            "detail_fetch_limit": website.detail_fetch_limit,
             "detail_fetch_disabled": False,
             "detail_fetch_session_failures": 0,
             "selector_metrics": "",
@@ -67,7 +120,6 @@ class StealthScraper:
 
         try:
             with self._driver_session():
-                self._warm_up_session()
                 self._scrape_pages(website, keywords, location, max_pages, state)
         except Exception as exc:
             state["error_msg"] = f"Driver Initialization/Execution Failed: {exc}"
@@ -78,7 +130,9 @@ class StealthScraper:
                 website.name,
             )
 
-        saved_jobs = self._save_jobs(state["all_new_jobs"])
+        saved_jobs = upsert_jobs(state["all_new_jobs"])
+        # Driver failures, blocks and timeouts; "no jobs" is not a failure.
+        failure = "" if saved_jobs else state["error_msg"]
         state["error_msg"] = self._finalize_error_message(
             state["error_msg"],
             len(state["all_new_jobs"]),
@@ -87,6 +141,8 @@ class StealthScraper:
         self._log_execution(website, state)
         self._log_scrape_done(website, started_at, saved_jobs, state)
         self._reset_run_state()
+        if failure and self._raise_errors:
+            raise ScrapeFailed(failure)
         return saved_jobs
 
     def _ensure_run_id(self) -> None:
@@ -104,35 +160,45 @@ class StealthScraper:
 
     @contextmanager
     def _driver_session(self) -> Generator[SB, None, None]:
+        pool = get_browser_pool()
+        if pool is not None:
+            with self._pooled_driver_session(pool) as driver:
+                yield driver
+            return
+
         manager = self._session_manager or self._build_session_manager()
         with manager as driver:
             self._driver = driver
             try:
+                self._warm_up_session()
                 yield driver
             finally:
                 self._driver = None
-                self._session_manager = self._build_session_manager()
+                self._session_manager = None
+
+    @contextmanager
+    def _pooled_driver_session(self, pool: Any) -> Generator[SB, None, None]:
+        browser = pool.lease()
+        self._driver = browser.driver
+        self._pages_opened = 0
+        self._session_invalid = False
+        try:
+            if not browser.warmed:
+                self._warm_up_session()
+                browser.warmed = True
+            yield browser.driver
+        except Exception as exc:
+            if self._is_invalid_session_error(exc):
+                self._session_invalid = True
+            raise
+        finally:
+            self._driver = None
+            pool.release(
+                browser, pages=self._pages_opened, broken=self._session_invalid
+            )
 
     def _build_session_manager(self) -> SB:
-        width = random.randint(
-            settings.STEALTH_WINDOW_WIDTH_MIN,
-            settings.STEALTH_WINDOW_WIDTH_MAX,
-        )
-        height = random.randint(
-            settings.STEALTH_WINDOW_HEIGHT_MIN,
-            settings.STEALTH_WINDOW_HEIGHT_MAX,
-        )
-        return SB(
-            browser="chrome",
-            headless2=self.headless,
-            uc=True,
-            uc_subprocess=True,
-            agent=random.choice(USER_AGENTS),
-            locale_code="en-US",
-            window_size=f"{width},{height}",
-            chromium_arg="--disable-blink-features=AutomationControlled,--disable-dev-shm-usage",
-            test=True,
-        )
+        return build_session_manager(self.headless)
 
     def _scrape_pages(self, website: CustomWebsite, keywords: str, location: str, max_pages: int, state: dict[str, Any]) -> None:
         # Visit the domain first to satisfy Selenium's cookie domain rules
@@ -265,10 +331,6 @@ class StealthScraper:
         )
 
         try:
-            jitter_sleep(
-                settings.STEALTH_PAGE_JITTER_MIN_SECONDS,
-                settings.STEALTH_PAGE_JITTER_MAX_SECONDS,
-            )
             self._open_url(url)
             jitter_sleep(
                 settings.STEALTH_POST_OPEN_JITTER_MIN_SECONDS,
@@ -282,22 +344,35 @@ class StealthScraper:
 
             html_content = self._get_page_source()
             state["html_content"] = html_content
-            soup = BeautifulSoup(html_content, "html.parser")
-            job_elements = soup.select(website.job_list_selector)
-
-            state["selector_metrics"] = self._selector_metrics(website, job_elements)
-            if self._handle_anti_bot(website, job_elements, html_content, state):
+            parsed = run_parser(
+                parse_stealth_search_page, html_content, website_selectors(website)
+            )
+            state["selector_metrics"] = parsed["selector_metrics"]
+            state["card_parse_failures"] += parsed["card_failures"]
+            if self._handle_anti_bot(
+                website, parsed["card_count"], html_content, state
+            ):
                 return False
+            record_rendered_page(url, html_content)
 
             logger.info(
                 "stealth_page_cards_found run_id=%s website_id=%s page=%s cards=%s selector_metrics=%s",
                 self._run_id,
                 website.id,
                 page_num,
-                len(job_elements),
+                parsed["card_count"],
                 state["selector_metrics"],
             )
-            self._collect_jobs_from_page(website, keywords, job_elements, state)
+            page_known = page_is_known([card["job_url"] for card in parsed["cards"]])
+            self._collect_jobs_from_page(website, keywords, parsed["cards"], state)
+            if page_known:
+                logger.info(
+                    "stealth_incremental_stop run_id=%s website_id=%s page=%s",
+                    self._run_id,
+                    website.id,
+                    page_num,
+                )
+                return False
             return True
         except Exception:
             logger.exception(
@@ -397,16 +472,18 @@ class StealthScraper:
             self._capture_artifacts(website, state)
             return False
 
-    def _handle_anti_bot(self, website: CustomWebsite, job_elements: Any, html_content: str, state: dict[str, Any]) -> bool:
+    def _handle_anti_bot(self, website: CustomWebsite, card_count: int, html_content: str, state: dict[str, Any]) -> bool:
         anti_bot_result = classify_anti_bot_response(
             html_content=html_content,
-            card_count=len(job_elements),
+            card_count=card_count,
         )
         if not anti_bot_result["blocked"]:
             clear_block_state(website.id)
+            self._rate_per_minute = record_pacing_success(website)
             return False
 
         outcome = record_block_event(website.id)
+        self._rate_per_minute = record_pacing_backoff(website)
         logger.error(
             "anti_bot_detected run_id=%s website_id=%s website=%s reason=%s failures=%s",
             self._run_id,
@@ -424,6 +501,7 @@ class StealthScraper:
 
     def _record_challenge_failure(self, website: CustomWebsite, state: dict[str, Any], anti_bot_result: dict[str, Any]) -> None:
         outcome = record_block_event(website.id)
+        self._rate_per_minute = record_pacing_backoff(website)
         logger.error(
             "captcha_challenge_persisted run_id=%s website_id=%s website=%s reason=%s failures=%s",
             self._run_id,
@@ -454,51 +532,80 @@ class StealthScraper:
                 exc_info=True,
             )
 
-    def _selector_metrics(self, website: CustomWebsite, job_elements: Any) -> str:
-        coverage = compute_selector_coverage(
-            job_elements,
-            {
-                "title": website.title_selector,
-                "company": website.company_selector,
-                "location": website.location_selector,
-                "job_link": website.job_link_selector,
-                "salary": website.salary_selector,
-                "date": website.date_selector,
-            },
-        )
-        return summarize_selector_coverage(coverage)
-
-    def _collect_jobs_from_page(self, website: CustomWebsite, keywords: str, job_elements: Any, state: dict[str, Any]) -> None:
-        for element in job_elements:
-            job_entry = self._parse_job_element(website, keywords, element, state)
+    def _collect_jobs_from_page(self, website: CustomWebsite, keywords: str, cards: list[dict[str, str]], state: dict[str, Any]) -> None:
+        descriptions = {}
+        if settings.STEALTH_DETAIL_TABS > 1:
+            descriptions = self._prefetch_descriptions(website, cards, state)
+        for card in cards:
+            job_entry = self._build_job_entry(
+                website, keywords, card, state, descriptions
+            )
             if job_entry is not None:
                 state["all_new_jobs"].append(job_entry)
 
-    def _parse_job_element(self, website: CustomWebsite, keywords: str, element: Any, state: dict[str, Any]) -> dict[str, Any] | None:
-        try:
-            title = self._select_text(
-                element, website.title_selector, prefer_title=True
-            )
-            company = self._select_text(element, website.company_selector)
-            loc_text = self._select_text(element, website.location_selector)
-            job_url = self._select_url(element, website)
-            salary = self._select_text(element, website.salary_selector)
-
-            if not job_url or not title:
-                return None
+    def _prefetch_descriptions(self, website: CustomWebsite, cards: list[dict[str, str]], state: dict[str, Any]) -> dict[str, str]:
+        """Fetch the page's budgeted descriptions in batches of parallel tabs."""
+        if not website.description_selector or state["detail_fetch_disabled"]:
+            return {}
+
+        job_urls = []
+        for card in cards:
+            if card["job_url"] not in job_urls:
+                job_urls.append(card["job_url"])
+        known_keys = set(
+            Job.objects.filter(source_key__in={url_key(url) for url in job_urls})
+            .exclude(description="")
+            .values_list("source_key", flat=True)
+        )
+        remaining = max(0, state["detail_fetch_limit"] - state["detail_fetch_count"])
+        targets = [url for url in job_urls if url_key(url) not in known_keys]
+        targets = targets[:remaining]
+
+        descriptions = {}
+        tabs = settings.STEALTH_DETAIL_TABS
+        for start in range(0, len(targets), tabs):
+            batch = targets[start : start + tabs]
+            try:
+                descriptions.update(
+                    self._get_descriptions_multi_tab(
+                        batch, website.description_selector
+                    )
+                )
+                state["detail_fetch_count"] += len(batch)
+            except Exception as exc:
+                if not self._is_invalid_session_error(exc):
+                    raise
+                state["detail_fetch_disabled"] = True
+                state["detail_fetch_session_failures"] += 1
+                self._session_invalid = True
+                logger.warning(
+                    "description_fetch_disabled_invalid_session run_id=%s website_id=%s website=%s job_urls=%s",
+                    self._run_id,
+                    website.id,
+                    website.name,
+                    len(batch),
+                )
+                break
+        return descriptions
 
-            description = self._maybe_fetch_description(
-                website, keywords, job_url, state
-            )
+    def _build_job_entry(self, website: CustomWebsite, keywords: str, card: dict[str, str], state: dict[str, Any], descriptions: dict[str, str] | None = None) -> dict[str, Any] | None:
+        try:
+            job_url = card["job_url"]
+            if descriptions and job_url in descriptions:
+                description = descriptions[job_url]
+            else:
+                description = self._maybe_fetch_description(
+                    website, keywords, job_url, state
+                )
             job_data = {
-                "title": title.strip(),
-                "company": company.strip(),
-                "location": loc_text.strip(),
+                "title": card["title"].strip(),
+                "company": card["company"].strip(),
+                "location": card["location"].strip(),
                 "job_url": job_url,
-                "salary": salary,
+                "salary": card["salary"],
                 "description": description,
             }
-            job_data = self._enrich_job_data(job_data, description, keywords)
+            job_data = enrich_job_data(job_data, description)
             return {
                 "source_url": job_url,
                 "defaults": {
@@ -512,11 +619,11 @@ class StealthScraper:
                     "job_type": job_data.get("job_type", ""),
                     "experience_level": job_data.get("experience_level", ""),
                     "industry": job_data.get("industry", ""),
+                    "expertise_tags": job_data.get("expertise_tags", ""),
                     "description": job_data.get("description", ""),
                     "requirements": job_data.get("requirements", ""),
                     "source_website": website.name,
-                    "is_rfp": "contract" in keywords.lower()
-                    or "rfp" in keywords.lower(),
+                    "is_rfp": is_rfp_query(keywords),
                 },
             }
         except Exception:
@@ -536,11 +643,14 @@ class StealthScraper:
             return ""
         if state["detail_fetch_disabled"]:
             return ""
-        if Job.objects.filter(source_url=job_url).exclude(description="").exists():
+        if (
+            Job.objects.filter(source_key=url_key(job_url))
+            .exclude(description="")
+            .exists()
+        ):
             return ""
 
         logger.info("Fetching description for %s", job_url)
-        jitter_sleep(0.8, 1.8)
         try:
             description = self._get_description_selenium(
                 job_url, website.description_selector
@@ -552,6 +662,7 @@ class StealthScraper:
                 raise
             state["detail_fetch_disabled"] = True
             state["detail_fetch_session_failures"] += 1
+            self._session_invalid = True
             logger.warning(
                 "description_fetch_disabled_invalid_session run_id=%s website_id=%s website=%s job_url=%s",
                 self._run_id,
@@ -561,17 +672,6 @@ class StealthScraper:
             )
             return ""
 
-    def _save_jobs(self, job_entries: list[dict[str, Any]]) -> list[Job]:
-        saved_jobs = []
-        for job_entry in job_entries:
-            job, created = Job.objects.update_or_create(
-                source_url=job_entry["source_url"],
-                defaults=job_entry["defaults"],
-            )
-            if created:
-                saved_jobs.append(job)
-        return saved_jobs
-
     def _finalize_error_message(self, error_msg: str, jobs_seen: int, card_parse_failures: int) -> str:
         if error_msg:
             return error_msg
@@ -624,27 +724,11 @@ class StealthScraper:
     def _reset_run_state(self) -> None:
         self._run_id = None
         self._driver = None
-        self._session_manager = self._build_session_manager()
-
-    def _select_text(self, element: Any, selector: str, prefer_title: bool = False) -> str:
-        if not selector:
-            return ""
-        selected = element.select_one(selector)
-        if not selected:
-            return ""
-        if prefer_title:
-            return selected.get("title") or selected.get_text(strip=True)
-        return selected.get_text(strip=True)
-
-    def _select_url(self, element: Any, website: CustomWebsite) -> str:
-        if not website.job_link_selector:
-            return ""
-        link_elem = element.select_one(website.job_link_selector)
-        if not link_elem or not link_elem.get("href"):
-            return ""
-        from urllib.parse import urljoin
-
-        return urljoin(website.base_url, link_elem.get("href"))
+        self._pages_opened = 0
+        self._session_invalid = False
+        self._rate_per_minute = None
+        self._html_parser = PARSER_HTML
+        self._session_manager = None
 
     def _simulate_browse(self) -> None:
         try:
@@ -690,6 +774,8 @@ class StealthScraper:
             )
 
     def _open_url(self, url: str) -> None:
+        throttle(url, self._rate_per_minute)
+        self._pages_opened += 1
         self._driver.activate_cdp_mode(url)
         self._apply_stealth_patches()
 
@@ -736,20 +822,12 @@ class StealthScraper:
                     exc_info=True,
                 )
 
-            soup = BeautifulSoup(self._get_page_source(), "html.parser")
-            desc_elem = soup.select_one(selector)
-
-            text = ""
-            if desc_elem:
-                for br in desc_elem.find_all("br"):
-                    br.replace_with("\n")
-                for p in desc_elem.find_all("p"):
-                    p.append("\n")
-                text = desc_elem.get_text()
-
+            text = run_parser(
+                extract_description, self._get_page_source(), selector, self._html_parser
+            )
             self._driver.driver.close()
             self._switch_to_default_window()
-            return text.strip()
+            return text
         except Exception as exc:
             logger.exception("description_fetch_failed job_url=%s", job_url)
             try:
@@ -766,120 +844,79 @@ class StealthScraper:
                 raise
             return ""
 
+    def _get_descriptions_multi_tab(self, job_urls: list[str], selector: str) -> dict[str, str]:
+        """Open one tab per URL, then harvest each as its selector appears.
+
+        Tabs that never show the selector are read as-is once the shared
+        wait runs out. Invalid-session errors propagate to the caller.
+        """
+        driver = self._driver.driver
+        main_handle = driver.current_window_handle
+        pending = {}
+        descriptions = {}
+        try:
+            for job_url in job_urls:
+                throttle(job_url, self._rate_per_minute)
+                known_handles = set(driver.window_handles)
+                driver.execute_script("window.open('about:blank', '_blank');")
+                handle = next(
+                    h for h in driver.window_handles if h not in known_handles
+                )
+                driver.switch_to.window(handle)
+                self._apply_stealth_patches()
+                # Assigning location returns immediately, so tabs load in parallel.
+                driver.execute_script("window.location.href = arguments[0];", job_url)
+                self._pages_opened += 1
+                pending[handle] = job_url
+
+            deadline = time.monotonic() + 10
+            while pending:
+                for handle, job_url in list(pending.items()):
+                    driver.switch_to.window(handle)
+                    ready = bool(driver.find_elements("css selector", selector))
+                    if not ready and time.monotonic() < deadline:
+                        continue
+                    descriptions[job_url] = run_parser(
+                        extract_description,
+                        self._get_page_source(),
+                        selector,
+                        self._html_parser,
+                    )
+                    driver.close()
+                    del pending[handle]
+                if pending:
+                    jitter_sleep(0.4, 0.9)
+            return descriptions
+        except Exception as exc:
+            logger.exception(
+                "description_multi_tab_failed run_id=%s job_urls=%s",
+                self._run_id,
+                len(job_urls),
+            )
+            try:
+                for handle in pending:
+                    driver.switch_to.window(handle)
+                    driver.close()
+            except Exception:
+                logger.debug(
+                    "description_tab_cleanup_failed run_id=%s",
+                    self._run_id,
+                    exc_info=True,
+                )
+            if self._is_invalid_session_error(exc):
+                raise
+            return descriptions
+        finally:
+            try:
+                driver.switch_to.window(main_handle)
+            except Exception:
+                logger.debug(
+                    "description_tab_switch_back_failed run_id=%s",
+                    self._run_id,
+                    exc_info=True,
+                )
+
     def _is_invalid_session_error(self, exc: Exception) -> bool:
         return exc.__class__.__name__ == "InvalidSessionIdException" or (
             "invalid session id" in str(exc).lower()
         )
-
-    def _enrich_job_data(self, job_data: dict[str, Any], description: str, keywords: str) -> dict[str, Any]:
-        geo = parse_location_components(job_data.get("location", ""))
-        job_data["city"] = geo["city"]
-        job_data["country"] = geo["country"]
-        job_data["continent"] = geo["continent"]
-
-        if not job_data.get("requirements") and description:
-            job_data["requirements"] = self._extract_requirements(description)
-        if not job_data.get("salary") and description:
-            job_data["salary"] = self._extract_salary_fallback(description)
-
-        job_data["job_type"] = self._extract_job_type(description)
-        job_data["experience_level"] = self._extract_experience_level(description)
-        job_data["industry"] = self._extract_industry(description)
-        return job_data
-
-    def _extract_salary_fallback(self, description: str) -> str:
-        salary_pattern = re.compile(
-            r"(\$[\d,]+(?:\.\d{2})?(?:\s*(?:-|to)\s*\$[\d,]+(?:\.\d{2})?)?(?:\s*(?:a|per|/)\s*(?:year|yr|month|mo|hour|hr|week|wk|annually|k))?)",
-            re.IGNORECASE,
-        )
-        match = salary_pattern.search(description)
-        if match:
-            return match.group(1)
-        alt_pattern = re.compile(
-            r"((?:€|£)[\d,]+(?:\.\d{2})?(?:\s*(?:-|to)\s*(?:€|£)[\d,]+(?:\.\d{2})?)?(?:\s*(?:a|per|/)\s*(?:year|yr|month|mo|hour|hr|week|wk|annually|k))?)",
-            re.IGNORECASE,
-        )
-        alt_match = alt_pattern.search(description)
-        if alt_match:
-            return alt_match.group(1)
-        return ""
-
-    def _extract_requirements(self, description: str) -> str:
-        requirements_keywords = [
-            "requirements",
-            "qualifications",
-            "skills",
-            "experience",
-            "must have",
-            "should have",
-            "preferred",
-            "minimum",
-        ]
-        lines = description.split("\n")
-        requirements_lines = []
-        in_requirements = False
-        for line in lines:
-            line_lower = line.lower()
-            if any(
-                k in line_lower
-                for k in ["benefits", "what we offer", "perks", "equal opportunity"]
-            ):
-                in_requirements = False
-            if any(keyword in line_lower for keyword in requirements_keywords):
-                in_requirements = True
-                continue
-            if in_requirements and line.strip():
-                if line.strip().startswith(("•", "-", "*", "·", "✓", "o ")):
-                    requirements_lines.append(line.strip())
-                elif re.match(r"^\d+\.", line.strip()):
-                    requirements_lines.append(line.strip())
-        return "\n".join(requirements_lines) if requirements_lines else ""
-
-    def _extract_job_type(self, description: str) -> str:
-        job_types = [
-            "full-time",
-            "part-time",
-            "contract",
-            "temporary",
-            "internship",
-            "freelance",
-        ]
-        description_lower = description.lower()
-        for job_type in job_types:
-            if job_type in description_lower:
-                return job_type.title()
-        return "Full-time"
-
-    def _extract_experience_level(self, description: str) -> str:
-        levels = {
-            "entry-level": ["entry level", "junior", "0-2 years", "1-2 years"],
-            "mid-level": ["mid level", "intermediate", "3-5 years", "2-5 years"],
-            "senior": ["senior", "lead", "5+ years", "7+ years", "experienced"],
-            "executive": ["executive", "director", "manager", "head of", "chief"],
-        }
-        description_lower = description.lower()
-        for level, keywords in levels.items():
-            if any(keyword in description_lower for keyword in keywords):
-                return level.title()
-        return "Mid-level"
-
-    def _extract_industry(self, description: str) -> str:
-        industries = [
-            "technology",
-            "healthcare",
-            "finance",
-            "education",
-            "retail",
-            "manufacturing",
-            "consulting",
-            "marketing",
-            "sales",
-            "engineering",
-            "software",
-            "logistics",
-        ]
-        description_lower = description.lower()
-        for industry in industries:
-            if industry in description_lower:
-                return industry.title()
-        return "Technology"
@@ -1,14 +1,31 @@
-from unittest.mock import Mock, patch
-
+import asyncio
+import gzip
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core import mail
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.db import DatabaseError, OperationalError, connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
 from django.test.utils import override_settings
 from django.urls import reverse
+from django.utils import timezone
 
 import requests
 
+from job_scraper import parsing, utils
 from job_scraper.anti_bot import (
     classify_anti_bot_response,
     clear_block_state,
@@ -18,20 +35,81 @@ from job_scraper.anti_bot import (
 )
 from job_scraper.api_scraper import ApiScraper
 from job_scraper.apollo_client import ApolloClient
+from job_scraper.async_engine import AsyncResponse
+from job_scraper.browser_pool import BrowserPool, install_browser_pool
+from job_scraper.enrichment import (
+    enrich_description,
+    enrich_descriptions,
+    enrich_job_data,
+)
+from job_scraper.html_backends import (
+    PARSER_HTML,
+    PARSER_LXML,
+    PARSER_SELECTOLAX,
+    SoupNode,
+    parse_html,
+    parser_available,
+    resolve_parser,
+)
+from job_scraper.http_sessions import close_sessions, get_session
+from job_scraper.job_store import upsert_jobs
+from job_scraper.json_paths import compile_accessor, compile_extractor
+from job_scraper.json_stream import items_prefix, json_streaming_available
+from job_scraper.keyword_matcher import KeywordMatcher, PhraseMatcher, is_rfp_query
 from job_scraper.management.commands.run_scheduler import (
+    enqueue_scheduled_scrape,
     register_scheduled_scrapes,
     run_scheduled_scrape,
 )
+from job_scraper.management.commands.run_scraper import execute_scrape_run
+from job_scraper.management.commands.run_workers import run_worker
 from job_scraper.models import (
     CustomWebsite,
+    HttpValidatorCache,
     Job,
     ScheduledScrape,
     ScheduledScrapeRun,
     ScraperExecutionLog,
+    ScrapeWorkUnit,
+)
+from job_scraper.parsing import (
+    _list_strainer,
+    extract_description,
+    extraction_plan,
+    parse_detail_page,
+    parse_search_page,
+    parse_stealth_search_page,
+    run_parser,
+    shutdown_parse_pool,
+    website_selectors,
 )
-from job_scraper.request_scraper import JobScraper
+from job_scraper.rate_limiter import (
+    RESERVE_WAIT_SECONDS,
+    async_throttle,
+    record_pacing_backoff,
+    record_pacing_success,
+    reserve_slot,
+    reset_domain,
+    website_rate,
+)
+from job_scraper.request_scraper import JobScraper, group_websites_by_domain
+from job_scraper.response_cache import (
+    ResponseCacheMiss,
+    cached_client,
+    evict,
+    is_cached_response,
+    remember_response,
+    store_content,
+)
+from job_scraper.scheduling import split_keyword_phrases
 from job_scraper.stealth_scraper import StealthScraper
-from job_scraper.utils import parse_location_components
+from job_scraper.url_keys import canonical_url, url_key
+from job_scraper.utils import (
+    get_continent_from_country,
+    parse_location_components,
+    parse_locations,
+)
+from job_scraper.work_queue import claim_work_unit, fail_work_unit
 
 
 class InvalidSessionIdException(Exception):
@@ -234,9 +312,7 @@ class ScheduledScrapeSchedulerTests(TestCase):
         DEFAULT_FROM_EMAIL="automoto@example.com",
     )
     @patch("job_scraper.management.commands.run_scheduler.execute_scrape_run")
-    @patch(
-        "job_scraper.management.commands.run_scheduler.send_scheduled_scrape_summary"
-    )
+    @patch("job_scraper.scheduling.send_scheduled_scrape_summary")
     def test_run_scheduled_scrape_records_email_errors(
         self, send_summary_mock, execute_mock
     ):
@@ -261,6 +337,162 @@ class ScheduledScrapeSchedulerTests(TestCase):
         self.assertEqual(run.email_error, "smtp down")
 
 
+class ScrapeWorkQueueTests(TestCase):
+    def setUp(self):
+        self.website = create_custom_website(name="Queued Board")
+        self.schedule = ScheduledScrape.objects.create(
+            name="Queued Run",
+            keywords="python, golang",
+            countries="germany",
+            location="us",
+            cron_expression="*/30 * * * *",
+            timezone="UTC",
+            max_pages=2,
+        )
+        self.schedule.websites.set([self.website])
+
+    def test_enqueue_creates_unit_per_phrase_and_one_for_fetch_once_api(self):
+        api_website = create_custom_website(
+            name="Loose API",
+            search_url="https://api.example.org/jobs",
+            is_api=True,
+        )
+        self.schedule.websites.add(api_website)
+
+        run = enqueue_scheduled_scrape(self.schedule.id)
+
+        units = sorted(
+            (unit.website.name, unit.phrase, unit.location, unit.max_pages)
+            for unit in run.work_units.all()
+        )
+        self.assertEqual(
+            units,
+            [
+                ("Loose API", "python, golang", "germany", 2),
+                ("Queued Board", "golang", "germany", 2),
+                ("Queued Board", "python", "germany", 2),
+            ],
+        )
+        self.assertIsNone(run.completed_at)
+
+    def test_fetch_once_unit_keeps_every_phrase_of_long_keywords(self):
+        api_website = create_custom_website(
+            name="Loose API",
+            search_url="https://api.example.org/jobs",
+            is_api=True,
+        )
+        phrases = [f"p{index:02d}" for index in range(60)]
+        self.schedule.keywords = ",".join(phrases)
+        self.schedule.save()
+        self.schedule.websites.set([api_website])
+
+        run = enqueue_scheduled_scrape(self.schedule.id)
+
+        unit = run.work_units.get()
+        unit.full_clean()
+        self.assertGreater(len(unit.phrase), 255)
+        self.assertEqual(split_keyword_phrases(unit.phrase), phrases)
+
+    def test_claim_is_exclusive_until_the_lease_expires(self):
+        run = ScheduledScrapeRun.objects.create(schedule=self.schedule)
+        unit = ScrapeWorkUnit.objects.create(
+            run=run, website=self.website, phrase="python", location="us"
+        )
+
+        first = claim_work_unit("worker-a")
+
+        self.assertEqual(first.id, unit.id)
+        self.assertEqual(first.attempts, 1)
+        self.assertIsNone(claim_work_unit("worker-b"))
+
+        ScrapeWorkUnit.objects.filter(id=unit.id).update(
+            lease_expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        second = claim_work_unit("worker-b")
+
+        self.assertEqual(second.id, unit.id)
+        self.assertEqual(second.worker_id, "worker-b")
+        self.assertEqual(second.attempts, 2)
+
+    def test_failed_unit_is_retried_after_delay_then_marked_failed(self):
+        run = ScheduledScrapeRun.objects.create(schedule=self.schedule)
+        ScrapeWorkUnit.objects.create(
+            run=run,
+            website=self.website,
+            phrase="python",
+            location="us",
+            max_attempts=2,
+        )
+
+        fail_work_unit(claim_work_unit("worker-a"), "boom")
+
+        self.assertIsNone(claim_work_unit("worker-a"))
+        unit = ScrapeWorkUnit.objects.get()
+        self.assertEqual(unit.status, ScrapeWorkUnit.STATUS_PENDING)
+        self.assertGreater(unit.available_at, timezone.now())
+
+        ScrapeWorkUnit.objects.update(available_at=timezone.now())
+        fail_work_unit(claim_work_unit("worker-a"), "boom again")
+
+        unit.refresh_from_db()
+        self.assertEqual(unit.status, ScrapeWorkUnit.STATUS_FAILED)
+        self.assertEqual(unit.last_error, "boom again")
+
+    @patch("job_scraper.request_scraper.conditional_get")
+    def test_unit_whose_scrape_fails_goes_back_to_pending(self, conditional_get_mock):
+        conditional_get_mock.side_effect = requests.ConnectionError("board down")
+        run = ScheduledScrapeRun.objects.create(schedule=self.schedule)
+        ScrapeWorkUnit.objects.create(
+            run=run, website=self.website, phrase="python", location="us"
+        )
+
+        processed = run_worker("worker-a", exit_when_idle=True)
+
+        self.assertEqual(processed, 1)
+        unit = ScrapeWorkUnit.objects.get()
+        self.assertEqual(unit.status, ScrapeWorkUnit.STATUS_PENDING)
+        self.assertEqual(unit.attempts, 1)
+        self.assertGreater(unit.available_at, timezone.now())
+        self.assertIn("board down", unit.last_error)
+        run.refresh_from_db()
+        self.assertIsNone(run.completed_at)
+
+    @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+    @patch("job_scraper.scheduling.ApolloClient")
+    @patch.object(JobScraper, "get_recent_jobs")
+    def test_worker_drains_queue_and_finalizes_run_once(
+        self, get_recent_jobs_mock, apollo_cls
+    ):
+        subscriber = get_user_model().objects.create_user(
+            email="sub@example.com", password="testpass123"
+        )
+        self.schedule.subscribers.set([subscriber])
+        job = Job.objects.create(
+            title="Go Developer",
+            company="Acme",
+            location="Remote",
+            description="desc",
+            source_website="Queued Board",
+            source_url="https://example.com/jobs/go",
+        )
+        get_recent_jobs_mock.return_value = [job]
+        apollo_cls.return_value.enrich_job_contacts.return_value = 2
+        run = enqueue_scheduled_scrape(self.schedule.id)
+
+        processed = run_worker("worker-a", exit_when_idle=True)
+
+        self.assertEqual(processed, 2)
+        run.refresh_from_db()
+        self.assertIsNotNone(run.completed_at)
+        self.assertEqual(run.jobs_new, 1)
+        self.assertEqual(run.contacts_found, 2)
+        self.assertEqual(run.emails_sent, 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(
+            run.work_units.exclude(status=ScrapeWorkUnit.STATUS_DONE).exists()
+        )
+
+
 class DashboardViewTests(TestCase):
     def setUp(self):
         login_test_user(self.client)
@@ -432,32 +664,288 @@ class JobDetailViewTests(TestCase):
         self.assertEqual(response.context["job"].id, job.id)
 
 
-class RequestScraperEnrichmentTests(TestCase):
+class EnrichmentTests(TestCase):
     def test_enrich_job_data_handles_country_without_unboundlocalerror(self):
-        scraper = JobScraper()
-
-        enriched = scraper._enrich_job_data(
+        enriched = enrich_job_data(
             {"location": "Germany", "title": "Engineer", "company": "Acme"},
             "",
-            "python",
         )
 
         self.assertEqual(enriched["country"], "Germany")
         self.assertTrue(enriched["continent"])
 
     def test_enrich_job_data_normalizes_us_state_location(self):
-        scraper = JobScraper()
-
-        enriched = scraper._enrich_job_data(
+        enriched = enrich_job_data(
             {"location": "Austin, TX", "title": "Engineer", "company": "Acme"},
             "",
-            "python",
         )
 
         self.assertEqual(enriched["city"], "Austin")
         self.assertEqual(enriched["country"], "United States")
         self.assertEqual(enriched["continent"], "North America")
 
+    def test_enrich_job_data_fills_heuristic_fields(self):
+        description = (
+            "Senior engineer for a healthcare platform, part-time.\n"
+            "What you'll bring:\n"
+            "- Python\n"
+            "1. Django\n"
+            "Benefits\n"
+            "- Free lunch"
+        )
+
+        enriched = enrich_job_data({"location": "", "title": "Engineer"}, description)
+
+        self.assertEqual(enriched["job_type"], "Part-Time")
+        self.assertEqual(enriched["experience_level"], "Senior")
+        self.assertEqual(enriched["industry"], "Healthcare")
+        self.assertEqual(enriched["requirements"], "- Python\n1. Django")
+
+    def test_expertise_tags_match_whole_words_in_text_order(self):
+        enriched = enrich_description(
+            "Reactive JavaScript team. Django and Python (C++ a plus), python again."
+        )
+
+        self.assertEqual(enriched["expertise_tags"], "JavaScript, Django, Python, C++")
+
+    def test_scraped_fields_win_over_heuristics(self):
+        enriched = enrich_job_data(
+            {"location": "", "salary": "Competitive", "expertise_tags": "Go"},
+            "Pays $90,000 - $110,000 per year for Rust work",
+        )
+
+        self.assertEqual(enriched["salary"], "Competitive")
+        self.assertEqual(enriched["expertise_tags"], "Go")
+        self.assertEqual(
+            enrich_description("Pays €50,000 or $90,000 a year")["salary"],
+            "$90,000 a year",
+        )
+
+    def test_enrich_descriptions_scans_repeated_descriptions_once(self):
+        with patch(
+            "job_scraper.enrichment.enrich_description",
+            wraps=enrich_description,
+        ) as single:
+            results = enrich_descriptions(
+                ["Senior Python role", None, "", "Senior Python role"]
+            )
+
+        self.assertEqual(single.call_count, 2)
+        self.assertEqual(results[0], results[3])
+        self.assertEqual(results[0]["experience_level"], "Senior")
+        self.assertEqual(results[1]["job_type"], "Full-time")
+
+
+class JobStoreTests(TestCase):
+    def entry(self, source_url, title):
+        return {
+            "source_url": source_url,
+            "defaults": {
+                "title": title,
+                "company": "Acme",
+                "location": "Remote",
+                "description": "",
+                "source_website": "Board",
+            },
+        }
+
+    def test_upsert_jobs_reports_only_created_jobs(self):
+        existing = Job.objects.create(
+            title="Old",
+            company="Acme",
+            location="Remote",
+            description="",
+            source_website="Board",
+            source_url="https://example.com/jobs/1",
+        )
+
+        with self.assertNumQueries(5):
+            created = upsert_jobs(
+                [
+                    self.entry("https://example.com/jobs/1", "Updated"),
+                    self.entry("https://example.com/jobs/2", "New"),
+                    self.entry("https://example.com/jobs/3", "Newer"),
+                ]
+            )
+
+        self.assertEqual([job.title for job in created], ["New", "Newer"])
+        self.assertTrue(all(job.pk for job in created))
+        existing.refresh_from_db()
+        self.assertEqual(existing.title, "Updated")
+        self.assertEqual(Job.objects.count(), 3)
+
+    def test_upsert_jobs_merges_repeated_urls_in_a_batch(self):
+        created = upsert_jobs(
+            [
+                self.entry("https://example.com/jobs/1", "First"),
+                self.entry("https://example.com/jobs/1", "Second"),
+            ]
+        )
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(Job.objects.get().title, "Second")
+        self.assertEqual(upsert_jobs([]), [])
+
+    def test_upsert_jobs_matches_on_canonical_url(self):
+        job = Job.objects.create(
+            title="Old",
+            company="Acme",
+            location="Remote",
+            description="",
+            source_website="Board",
+            source_url="https://example.com/jobs/1",
+        )
+
+        created = upsert_jobs(
+            [
+                self.entry("HTTP://www.Example.com/jobs/1/?utm_source=feed", "New"),
+                self.entry("", "No link"),
+            ]
+        )
+
+        self.assertEqual(created, [])
+        job.refresh_from_db()
+        self.assertEqual(job.title, "New")
+        self.assertEqual(job.source_key, url_key("https://example.com/jobs/1"))
+
+    def test_upsert_jobs_retries_when_a_key_is_inserted_concurrently(self):
+        Job.objects.create(title="Theirs", source_url="https://example.com/jobs/1")
+        lookup = Job.objects.in_bulk
+        lookups = []
+
+        def stale_lookup(*args, **kwargs):
+            lookups.append(args)
+            if len(lookups) == 1:
+                # As if another worker committed the posting after this lookup.
+                return {}
+            return lookup(*args, **kwargs)
+
+        with patch.object(Job.objects, "in_bulk", side_effect=stale_lookup):
+            created = upsert_jobs(
+                [
+                    self.entry("https://example.com/jobs/1", "Ours"),
+                    self.entry("https://example.com/jobs/2", "New"),
+                ]
+            )
+
+        self.assertEqual(len(lookups), 2)
+        self.assertEqual([job.title for job in created], ["New"])
+        self.assertEqual(
+            dict(Job.objects.values_list("source_url", "title")),
+            {
+                "https://example.com/jobs/1": "Ours",
+                "https://example.com/jobs/2": "New",
+            },
+        )
+
+
+class CanonicalUrlTests(TestCase):
+    def test_canonical_url_drops_tracking_and_session_noise(self):
+        self.assertEqual(
+            canonical_url("HTTP://WWW.Example.com:80/jobs/7/?b=2&utm_medium=x&a=1#top"),
+            "https://example.com/jobs/7?a=1&b=2",
+        )
+        self.assertEqual(
+            canonical_url("https://careers.acme.com/job;jsessionid=AB12?id=7&sid=9"),
+            "https://careers.acme.com/job?id=7&sid=9",
+        )
+        self.assertEqual(
+            canonical_url("https://www.indeed.com/viewjob?jk=abc&from=serp&trk=1h2"),
+            "https://indeed.com/viewjob?from=serp&jk=abc",
+        )
+
+    def test_canonical_url_keeps_generic_params_that_may_identify_a_posting(self):
+        self.assertNotEqual(
+            url_key("https://jobs.example.com/view?ref=4411"),
+            url_key("https://jobs.example.com/view?ref=4412"),
+        )
+        self.assertEqual(
+            canonical_url("https://jobs.example.com/view?tk=9&refid=3&vjs=1"),
+            "https://jobs.example.com/view?refid=3&tk=9&vjs=1",
+        )
+
+    def test_url_key_is_stable_and_blank_for_missing_urls(self):
+        self.assertEqual(
+            url_key("https://example.com/a?x=1&fbclid=z"),
+            url_key("http://www.example.com/a/?x=1"),
+        )
+        self.assertNotEqual(
+            url_key("https://example.com/a"), url_key("https://example.com/b")
+        )
+        self.assertIsNone(url_key("  "))
+
+
+class SourceKeyMigrationTests(TransactionTestCase):
+    before = [("job_scraper", "0021_customwebsite_api_stream_response")]
+    after = [("job_scraper", "0022_job_source_key")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_backfill_merges_tracking_copies_but_keeps_distinct_postings(self):
+        Job = self.migrate(self.before).get_model("job_scraper", "Job")
+        for url in (
+            "https://jobs.example.com/view?tk=1",
+            "https://jobs.example.com/view?tk=2",
+            "https://jobs.example.com/view?sid=1",
+            "https://jobs.example.com/view?sid=2",
+            "https://jobs.example.com/view?sid=2&utm_source=feed",
+        ):
+            Job.objects.create(title="Job", source_url=url)
+
+        Job = self.migrate(self.after).get_model("job_scraper", "Job")
+
+        self.assertEqual(
+            sorted(Job.objects.values_list("source_url", flat=True)),
+            [
+                "https://jobs.example.com/view?sid=1",
+                "https://jobs.example.com/view?sid=2",
+                "https://jobs.example.com/view?tk=1",
+                "https://jobs.example.com/view?tk=2",
+            ],
+        )
+        for source_url, source_key in Job.objects.values_list(
+            "source_url", "source_key"
+        ):
+            self.assertEqual(source_key, url_key(source_url))
+
+
+class KeywordMatcherTests(TestCase):
+    vocabulary = {"a": ["he", "she", "hers"], "b": ["his", "she"], "c": ["usher"]}
+
+    def test_fallback_scan_finds_overlapping_matches_like_automaton(self):
+        with patch("job_scraper.keyword_matcher.ahocorasick", None):
+            fallback = KeywordMatcher(self.vocabulary)
+        compiled = KeywordMatcher(self.vocabulary)
+
+        expected = {"a": {"he", "she", "hers"}, "b": {"she"}, "c": {"usher"}}
+        self.assertEqual(fallback.scan("USHERS"), expected)
+        self.assertEqual(compiled.scan("USHERS"), expected)
+        self.assertEqual(fallback.scan_lines("his\nshe"), {"a": {1}, "b": {0, 1}})
+        self.assertEqual(
+            sorted(fallback.iter_labelled("ushers or hishers")),
+            sorted(compiled.iter_labelled("ushers or hishers")),
+        )
+
+    def test_phrase_matcher_requires_every_term_of_a_phrase(self):
+        matcher = PhraseMatcher([["python"], ["integration", "rfp"], ["chef"]])
+
+        text = "RFP for system integration in Python"
+        self.assertEqual(matcher.matches(text), [0, 1])
+        self.assertEqual(matcher.matches("integration only"), [])
+        self.assertEqual(PhraseMatcher([[]]).matches("anything"), [0])
+
+    def test_is_rfp_query_checks_keyword_markers(self):
+        self.assertTrue(is_rfp_query("IT services RFP"))
+        self.assertTrue(is_rfp_query("contractor"))
+        self.assertFalse(is_rfp_query("python developer"))
+
 
 class GeographyUtilsTests(TestCase):
     def test_parse_location_components_handles_bare_state_code(self):
@@ -473,6 +961,82 @@ class GeographyUtilsTests(TestCase):
         self.assertEqual(europe["continent"], "Europe")
         self.assertEqual(emea["continent"], "Europe")
 
+    def test_parse_location_components_resolves_cities_from_gazetteer(self):
+        berlin = parse_location_components("Berlin")
+        london = parse_location_components("London, England")
+        munich = parse_location_components("Hybrid - München, Bavaria")
+
+        self.assertEqual(
+            berlin, {"city": "Berlin", "country": "Germany", "continent": "Europe"}
+        )
+        self.assertEqual(london["country"], "United Kingdom")
+        self.assertEqual(london["city"], "London")
+        self.assertEqual(munich["city"], "Munich")
+        self.assertEqual(munich["country"], "Germany")
+
+    def test_parse_location_components_strips_remote_markers_and_regions(self):
+        remote_country = parse_location_components("Remote - Germany")
+        remote_region = parse_location_components("Remote (EU)")
+        dach = parse_location_components("DACH")
+
+        self.assertEqual(remote_country["country"], "Germany")
+        self.assertEqual(remote_country["city"], "")
+        self.assertEqual(
+            remote_region, {"city": "", "country": "", "continent": "Europe"}
+        )
+        self.assertEqual(dach["continent"], "Europe")
+
+    def test_parse_location_components_drops_filler_after_remote_markers(self):
+        anywhere = parse_location_components("Anywhere in the US")
+        remote_in = parse_location_components("Remote within Germany")
+        hague = parse_location_components("Hybrid in The Hague")
+
+        self.assertEqual(
+            anywhere,
+            {"city": "", "country": "United States", "continent": "North America"},
+        )
+        self.assertEqual(remote_in["country"], "Germany")
+        self.assertEqual(remote_in["city"], "")
+        self.assertEqual(hague["city"], "The Hague")
+        self.assertEqual(hague["country"], "Netherlands")
+
+    def test_parse_locations_resolves_a_batch_in_order(self):
+        parsed = parse_locations(["Austin, TX", "", "Bengaluru"])
+
+        self.assertEqual([item["city"] for item in parsed], ["Austin", "", "Bangalore"])
+        self.assertEqual(parsed[2]["country"], "India")
+        self.assertEqual(parsed[1]["continent"], "Unknown")
+
+    def test_country_index_resolves_names_aliases_and_iso_codes_offline(self):
+        with patch("job_scraper.utils.pycountry.countries.search_fuzzy") as fuzzy:
+            continents = [
+                get_continent_from_country(name)
+                for name in ("Germany", "DEU", "U.K.", "Viet Nam", "Vietnam", "KE")
+            ]
+
+        fuzzy.assert_not_called()
+        self.assertEqual(
+            continents,
+            ["Europe", "Europe", "Europe", "Asia", "Asia", "Africa"],
+        )
+
+    def test_country_lookup_misses_fall_back_to_cached_fuzzy_search(self):
+        utils._fuzzy_country_code.cache_clear()
+        with patch(
+            "job_scraper.utils.pycountry.countries.search_fuzzy",
+            side_effect=LookupError,
+        ) as fuzzy:
+            self.assertEqual(get_continent_from_country("Remote"), "Unknown")
+            self.assertEqual(get_continent_from_country("remote "), "Unknown")
+
+        self.assertEqual(fuzzy.call_count, 1)
+
+    def test_parse_location_components_returns_independent_copies(self):
+        first = parse_location_components("Berlin, Germany")
+        first["city"] = "Changed"
+
+        self.assertEqual(parse_location_components("Berlin, Germany")["city"], "Berlin")
+
 
 class AntiBotMitigationTests(TestCase):
     def tearDown(self):
@@ -532,7 +1096,7 @@ class ApiScraperLoggingTests(TestCase):
             api_url_key="url",
         )
 
-    @patch("job_scraper.api_scraper.requests.get")
+    @patch("job_scraper.http_sessions.requests.Session.get")
     def test_api_failure_still_creates_execution_log(self, get_mock):
         response = Mock()
         response.raise_for_status.side_effect = requests.HTTPError("boom")
@@ -547,7 +1111,7 @@ class ApiScraperLoggingTests(TestCase):
         self.assertIn("API Request Failed", log.error_message)
         self.assertEqual(log.scraper_type, "api")
 
-    @patch("job_scraper.api_scraper.requests.get")
+    @patch("job_scraper.http_sessions.requests.Session.get")
     def test_api_keyword_filter_matches_split_terms_not_exact_phrase(self, get_mock):
         response = Mock()
         response.raise_for_status = Mock()
@@ -572,7 +1136,7 @@ class ApiScraperLoggingTests(TestCase):
         self.assertEqual(ScraperExecutionLog.objects.count(), 1)
         self.assertEqual(ScraperExecutionLog.objects.first().error_message, "")
 
-    @patch("job_scraper.api_scraper.requests.get")
+    @patch("job_scraper.http_sessions.requests.Session.get")
     def test_api_scraper_resets_private_run_id_after_scrape(self, get_mock):
         response = Mock()
         response.raise_for_status = Mock()
@@ -586,9 +1150,408 @@ class ApiScraperLoggingTests(TestCase):
         self.assertIsNone(scraper._run_id)
 
 
+class ApiFetchPlannerTests(TestCase):
+    def setUp(self):
+        self.website = create_custom_website(
+            name="Loose API",
+            base_url="https://api.example.org",
+            search_url="https://api.example.org/jobs?search={keywords}",
+            is_api=True,
+            api_fetch_once=True,
+            api_jobs_path="data",
+            api_title_key="title",
+            api_company_key="company",
+            api_location_key="location",
+            api_description_key="description",
+            api_url_key="url",
+        )
+
+    def _payload_response(self):
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = {
+            "data": [
+                {
+                    "title": "Python Developer",
+                    "company": "Acme",
+                    "location": "Remote",
+                    "description": "Backend services",
+                    "url": "https://api.example.org/jobs/1",
+                },
+                {
+                    "title": "Integration Consultant",
+                    "company": "Beta",
+                    "location": "Berlin",
+                    "description": "RFP response for system integration",
+                    "url": "https://api.example.org/jobs/2",
+                },
+                {
+                    "title": "Chef",
+                    "company": "Gamma",
+                    "location": "Paris",
+                    "description": "Kitchen work",
+                    "url": "https://api.example.org/jobs/3",
+                },
+            ]
+        }
+        response.text = '{"data": []}'
+        return response
+
+    @patch("job_scraper.http_sessions.requests.Session.get")
+    def test_scrape_phrases_fetches_once_and_matches_every_phrase(self, get_mock):
+        get_mock.return_value = self._payload_response()
+
+        jobs = ApiScraper().scrape_phrases(
+            self.website, ["python", "integration rfp"], "us"
+        )
+
+        get_mock.assert_called_once()
+        self.assertEqual(
+            get_mock.call_args.args[0], "https://api.example.org/jobs?search="
+        )
+        self.assertEqual(
+            sorted(job.source_url for job in jobs),
+            ["https://api.example.org/jobs/1", "https://api.example.org/jobs/2"],
+        )
+        self.assertTrue(Job.objects.get(source_url__endswith="/2").is_rfp)
+        self.assertFalse(Job.objects.get(source_url__endswith="/1").is_rfp)
+        self.assertEqual(ScraperExecutionLog.objects.count(), 1)
+
+    @patch("job_scraper.scheduling.ApolloClient")
+    @patch.object(JobScraper, "_scrape_website", return_value=[])
+    @patch("job_scraper.http_sessions.requests.Session.get")
+    def test_execute_scrape_run_plans_api_fetch_once_websites(
+        self, get_mock, scrape_website_mock, apollo_cls
+    ):
+        get_mock.return_value = self._payload_response()
+        html_website = create_custom_website(name="HTML Board")
+
+        jobs, _ = execute_scrape_run(
+            keywords="python, chef", location="us", limit=0, max_pages=1
+        )
+
+        get_mock.assert_called_once()
+        self.assertEqual(len(jobs), 2)
+        scraped = [call.args[1] for call in scrape_website_mock.call_args_list]
+        self.assertEqual(scraped, [html_website, html_website])
+
+
+class JsonPathAccessorTests(TestCase):
+    item = {
+        "job": {"name": "", "title": "Python Developer"},
+        "offices": [{"city": "Berlin"}, {"city": "Paris"}, {"city": ""}],
+        "tags": ["python", "django"],
+        "links": [{"href": "https://example.com/1"}],
+        "salary": 5000,
+    }
+
+    def test_paths_indices_fallbacks_and_joins(self):
+        extract = compile_extractor(
+            (
+                "job.name|job.title",
+                "offices[].city",
+                "links[0].href",
+                "links.-1.href",
+                "tags[]",
+                "salary",
+                "missing.key",
+                "",
+            )
+        )
+
+        self.assertEqual(
+            extract(self.item),
+            (
+                "Python Developer",
+                "Berlin, Paris",
+                "https://example.com/1",
+                "https://example.com/1",
+                "python, django",
+                "5000",
+                "",
+                "",
+            ),
+        )
+
+    def test_accessor_is_compiled_once_per_expression(self):
+        self.assertIs(compile_accessor("data.jobs"), compile_accessor("data.jobs"))
+        pages = {"pages": [{"jobs": [1, 2]}, {"jobs": [3]}]}
+        self.assertEqual(compile_accessor("pages[].jobs")(pages), [1, 2, 3])
+        self.assertEqual(items_prefix("pages[].jobs"), "pages.item.jobs.item")
+
+    @patch("job_scraper.http_sessions.requests.Session.get")
+    def test_api_scraper_maps_items_through_compiled_accessors(self, get_mock):
+        website = create_custom_website(
+            name="Mapped API",
+            is_api=True,
+            api_jobs_path="results[].postings",
+            api_title_key="name|title",
+            api_company_key="employer.name",
+            api_location_key="offices[].city",
+            api_description_key="description",
+            api_url_key="links[0].href",
+        )
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.json.return_value = {
+            "results": [
+                {
+                    "postings": [
+                        {
+                            "title": "Python Developer",
+                            "employer": {"name": "Acme"},
+                            "offices": [{"city": "Berlin"}, {"city": "Paris"}],
+                            "description": "APIs",
+                            "links": [{"href": "https://example.com/jobs/9"}],
+                        }
+                    ]
+                }
+            ]
+        }
+        response.text = "{}"
+        get_mock.return_value = response
+
+        jobs = ApiScraper().scrape(website, "python", "de")
+
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0].source_url, "https://example.com/jobs/9")
+        self.assertEqual(jobs[0].company, "Acme")
+        self.assertEqual(jobs[0].location, "Berlin, Paris")
+
+
+class ApiStreamingTests(TestCase):
+    def setUp(self):
+        if not json_streaming_available():
+            self.skipTest("ijson is not installed")
+        self.website = create_custom_website(
+            name="Tender Feed",
+            base_url="https://api.example.org",
+            search_url="https://api.example.org/tenders?q={keywords}",
+            is_api=True,
+            api_stream_response=True,
+            api_jobs_path="result.tenders",
+            api_title_key="title",
+            api_company_key="buyer",
+            api_location_key="country",
+            api_description_key="summary",
+            api_url_key="url",
+        )
+
+    def _streamed_response(self, payload):
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(payload)
+        return response
+
+    @patch("job_scraper.http_sessions.requests.Session.get")
+    def test_items_are_matched_from_stream_and_body_is_gzipped(self, get_mock):
+        payload = json.dumps(
+            {
+                "result": {
+                    "count": 2,
+                    "tenders": [
+                        {
+                            "title": "ERP system integration",
+                            "buyer": "City of Lyon",
+                            "country": "France",
+                            "summary": "RFP for ERP rollout",
+                            "url": "https://api.example.org/tenders/1",
+                        },
+                        {
+                            "title": "Road resurfacing",
+                            "buyer": "County",
+                            "country": "France",
+                            "summary": "Asphalt",
+                            "url": "https://api.example.org/tenders/2",
+                        },
+                    ],
+                },
+                "next": None,
+            }
+        ).encode("utf-8")
+        get_mock.return_value = self._streamed_response(payload)
+
+        jobs = ApiScraper().scrape(self.website, "integration", "fr")
+
+        self.assertTrue(get_mock.call_args.kwargs["stream"])
+        self.assertEqual(
+            [job.source_url for job in jobs], ["https://api.example.org/tenders/1"]
+        )
+        log = ScraperExecutionLog.objects.get()
+        self.assertEqual(log.error_message, "")
+        self.assertTrue(log.html_dump.name.endswith(".json.gz"))
+        with log.html_dump.open("rb") as dump:
+            self.assertEqual(gzip.decompress(dump.read()), payload)
+
+    @patch("job_scraper.http_sessions.requests.Session.get")
+    def test_stream_without_job_array_reports_the_path(self, get_mock):
+        get_mock.return_value = self._streamed_response(b'{"result": {"count": 0}}')
+
+        jobs = ApiScraper().scrape(self.website, "integration", "fr")
+
+        self.assertEqual(jobs, [])
+        self.assertIn(
+            "No job list found at path 'result.tenders'",
+            ScraperExecutionLog.objects.get().error_message,
+        )
+
+
+class RateLimiterTests(TestCase):
+    NOW = 1000.0
+
+    def setUp(self):
+        reset_domain("example.com")
+
+    @override_settings(
+        SCRAPER_RATE_LIMIT_PER_MINUTE=60,
+        SCRAPER_RATE_LIMIT_BURST=2,
+        SCRAPER_RATE_LIMIT_JITTER=0,
+    )
+    @patch("job_scraper.rate_limiter.time.time", return_value=NOW)
+    def test_bucket_allows_burst_then_spaces_requests(self, time_mock):
+        waits = [reserve_slot("example.com") for _ in range(4)]
+
+        self.assertEqual(waits, [0.0, 0.0, 1.0, 2.0])
+
+    @override_settings(
+        SCRAPER_RATE_LIMIT_PER_MINUTE=60,
+        SCRAPER_RATE_LIMIT_BURST=1,
+        SCRAPER_RATE_LIMIT_JITTER=0,
+        SCRAPER_DOMAIN_RATE_LIMITS=["www.slow.example=6"],
+    )
+    @patch("job_scraper.rate_limiter.time.time", return_value=NOW)
+    def test_idle_domain_does_not_wait_and_overrides_apply(self, time_mock):
+        reset_domain("slow.example")
+
+        self.assertEqual(reserve_slot("example.com"), 0.0)
+        time_mock.return_value = self.NOW + 5
+        self.assertEqual(reserve_slot("example.com"), 0.0)
+        self.assertEqual(reserve_slot("slow.example"), 0.0)
+        self.assertEqual(reserve_slot("slow.example"), 10.0)
+
+    @override_settings(SCRAPER_RATE_LIMIT_PER_MINUTE=60, SCRAPER_RATE_LIMIT_JITTER=0)
+    @patch("job_scraper.rate_limiter.time.monotonic")
+    @patch("job_scraper.rate_limiter.time.sleep")
+    @patch("job_scraper.rate_limiter._take_token")
+    def test_busy_database_is_retried_then_skipped(
+        self, take_mock, sleep_mock, monotonic_mock
+    ):
+        clock = [0.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        monotonic_mock.side_effect = lambda: clock[0]
+        sleep_mock.side_effect = sleep
+        take_mock.side_effect = [OperationalError("database is locked"), 1.0]
+
+        self.assertEqual(reserve_slot("example.com"), 1.0)
+        self.assertEqual(sleep_mock.call_count, 1)
+
+        take_mock.side_effect = OperationalError("database is locked")
+        with self.assertLogs("job_scraper.rate_limiter", "WARNING"):
+            self.assertEqual(reserve_slot("example.com"), 0.0)
+        slept = sum(call.args[0] for call in sleep_mock.call_args_list[1:])
+        self.assertLessEqual(slept, RESERVE_WAIT_SECONDS)
+
+    @patch("job_scraper.rate_limiter.asyncio.sleep", new_callable=AsyncMock)
+    @patch("job_scraper.rate_limiter.reserve_slot")
+    def test_async_throttle_reserves_off_the_event_loop(self, reserve_mock, sleep_mock):
+        reserve_threads = []
+
+        def reserve(domain, rate_per_minute):
+            reserve_threads.append(threading.get_ident())
+            return 1.5
+
+        reserve_mock.side_effect = reserve
+
+        async def throttle_in_loop():
+            wait = await async_throttle("https://www.example.com/jobs", 30)
+            return wait, threading.get_ident()
+
+        wait, loop_thread = asyncio.run(throttle_in_loop())
+
+        self.assertEqual(wait, 1.5)
+        reserve_mock.assert_called_once_with("example.com", 30)
+        self.assertNotIn(loop_thread, reserve_threads)
+        sleep_mock.assert_awaited_once_with(1.5)
+
+    @override_settings(
+        SCRAPER_RATE_LIMIT_PER_MINUTE=30,
+        SCRAPER_PACING_INCREASE_PER_MINUTE=2,
+        SCRAPER_PACING_DECREASE_FACTOR=0.5,
+        SCRAPER_PACING_MIN_PER_MINUTE=5,
+        SCRAPER_PACING_MAX_PER_MINUTE=33,
+    )
+    def test_website_rate_increases_additively_and_backs_off_multiplicatively(self):
+        website = create_custom_website()
+        self.assertEqual(website_rate(website), 30)
+
+        self.assertEqual(record_pacing_success(website), 32)
+        self.assertEqual(record_pacing_success(website), 33)
+        self.assertEqual(record_pacing_backoff(website), 16.5)
+        self.assertEqual(record_pacing_backoff(website), 8.25)
+        self.assertEqual(record_pacing_backoff(website), 5)
+
+        website.refresh_from_db()
+        self.assertEqual(website.pacing_rate_per_minute, 5)
+        self.assertEqual(website_rate(website), 5)
+
+    @override_settings(
+        SCRAPER_RATE_LIMIT_PER_MINUTE=30,
+        SCRAPER_DOMAIN_RATE_LIMITS=["example.com=6"],
+    )
+    def test_domain_override_caps_learned_rate(self):
+        website = create_custom_website()
+
+        self.assertEqual(record_pacing_success(website), 6)
+
+
+class SharedRateLimitTests(SimpleTestCase):
+    RESERVE_SCRIPT = (
+        "import time, django; django.setup(); "
+        "from job_scraper.rate_limiter import reserve_slot; "
+        "print(*(time.time() + reserve_slot('example.com') for _ in range(5)))"
+    )
+
+    def test_two_processes_draw_from_one_bucket(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            env = {
+                **os.environ,
+                "SQLITE_PATH": str(Path(tmp_dir) / "db.sqlite3"),
+                "SCRAPER_RATE_LIMIT_PER_MINUTE": "60",
+                "SCRAPER_RATE_LIMIT_BURST": "1",
+                "SCRAPER_RATE_LIMIT_JITTER": "0",
+            }
+            subprocess.run(
+                [sys.executable, "manage.py", "migrate", "--verbosity", "0"],
+                cwd=settings.BASE_DIR,
+                env=env,
+                check=True,
+            )
+            processes = [
+                subprocess.Popen(
+                    [sys.executable, "-c", self.RESERVE_SCRIPT],
+                    cwd=settings.BASE_DIR,
+                    env=env,
+                    stdout=subprocess.PIPE,
+                    text=True,
+                )
+                for _ in range(2)
+            ]
+            outputs = [process.communicate(timeout=60)[0] for process in processes]
+
+        send_times = sorted(float(value) for out in outputs for value in out.split())
+        self.assertEqual(len(send_times), 10)
+        # One shared bucket hands out ten slots a second apart; per-process
+        # buckets would each start at "now" and overlap.
+        gaps = [later - earlier for earlier, later in zip(send_times, send_times[1:])]
+        self.assertGreater(min(gaps), 0.9)
+
+
 @override_settings(DEBUG_ENRICHMENT=False)
 class ApolloClientTests(TestCase):
-    @patch("job_scraper.apollo_client.requests.post")
+    @patch("job_scraper.http_sessions.requests.Session.post")
     def test_search_contacts_uses_api_search_then_bulk_match(self, post_mock):
         search_response = Mock()
         search_response.raise_for_status = Mock()
@@ -646,6 +1609,940 @@ class RequestScraperCooldownTests(TestCase):
         )
 
 
+class RequestScraperConcurrencyTests(TestCase):
+    def test_group_websites_by_domain_keeps_same_host_together(self):
+        first = create_custom_website(
+            name="Board A", search_url="https://www.example.com/a?q={keywords}"
+        )
+        second = create_custom_website(
+            name="Board B", search_url="https://example.com/b?q={keywords}"
+        )
+        other = create_custom_website(
+            name="Other", search_url="https://jobs.other.org/search?q={keywords}"
+        )
+
+        groups = group_websites_by_domain([first, other, second])
+
+        self.assertEqual(groups, [[first, second], [other]])
+
+    @override_settings(SCRAPE_MAX_WORKERS=3)
+    @patch("job_scraper.request_scraper.connections")
+    @patch("job_scraper.request_scraper.JobScraper._scrape_website")
+    def test_get_recent_jobs_scrapes_domains_in_parallel_and_dedupes(
+        self, scrape_mock, connections_mock
+    ):
+        create_custom_website(name="One", search_url="https://one.example/s")
+        create_custom_website(name="Two", search_url="https://two.example/s")
+        create_custom_website(name="Three", search_url="https://three.example/s")
+        shared = Job(title="Shared", source_url="https://jobs.example/shared")
+        unique = Job(title="Unique", source_url="https://jobs.example/unique")
+        barrier = threading.Barrier(3, timeout=5)
+
+        def scrape(run_id, website, country, keywords, max_pages):
+            # Every domain must be in flight at the same time to pass the barrier.
+            barrier.wait()
+            return [shared] if website.name != "Three" else [shared, unique]
+
+        scrape_mock.side_effect = scrape
+
+        jobs = JobScraper().get_recent_jobs("us", "python")
+
+        self.assertEqual(scrape_mock.call_count, 3)
+        self.assertEqual([job.title for job in jobs], ["Shared", "Unique"])
+        self.assertEqual(connections_mock.close_all.call_count, 3)
+
+
+class ConditionalRequestTests(TestCase):
+    def setUp(self):
+        self.website = create_custom_website(
+            name="Feed API",
+            base_url="https://feed.example.org",
+            search_url="https://feed.example.org/jobs",
+            is_api=True,
+            api_jobs_path="data",
+            api_title_key="title",
+            api_company_key="company",
+            api_url_key="url",
+        )
+
+    def _response(self, status_code, payload=None, headers=None):
+        response = Mock()
+        response.status_code = status_code
+        response.ok = status_code < 400
+        response.headers = headers or {}
+        response.encoding = "utf-8"
+        response.text = "{}"
+        response.content = b'{"data": []}'
+        response.raise_for_status = Mock()
+        response.json.return_value = payload
+        return response
+
+    @patch("job_scraper.api_scraper.throttle")
+    @patch("job_scraper.http_sessions.requests.Session.get")
+    def test_not_modified_feed_skips_parsing_and_saving(self, get_mock, throttle_mock):
+        first = self._response(
+            200,
+            {"data": [{"title": "Engineer", "company": "Acme", "url": "https://x/1"}]},
+            {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+        not_modified = self._response(304)
+        get_mock.side_effect = [first, not_modified]
+
+        self.assertEqual(len(ApiScraper().scrape(self.website, "", "us")), 1)
+        jobs = ApiScraper().scrape(self.website, "", "us")
+
+        self.assertEqual(jobs, [])
+        self.assertEqual(
+            get_mock.call_args.kwargs["headers"],
+            {
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+            },
+        )
+        not_modified.json.assert_not_called()
+        entry = HttpValidatorCache.objects.get(url="https://feed.example.org/jobs")
+        self.assertEqual(entry.not_modified_count, 1)
+        self.assertEqual(ScraperExecutionLog.objects.filter(jobs_found=0).count(), 1)
+
+    @patch("job_scraper.api_scraper.throttle")
+    @patch("job_scraper.http_sessions.requests.Session.get")
+    def test_validators_are_kept_per_phrase_set(self, get_mock, throttle_mock):
+        payload = {
+            "data": [
+                {"title": "Engineer", "company": "Acme", "url": "https://x/1"},
+                {"title": "RFP writer", "company": "Acme", "url": "https://x/2"},
+            ]
+        }
+        get_mock.side_effect = [
+            self._response(200, payload, {"ETag": '"v1"'}),
+            self._response(200, payload, {"ETag": '"v1"'}),
+            self._response(304),
+        ]
+
+        engineers = ApiScraper().scrape_phrases(self.website, ["engineer"], "us")
+        rfps = ApiScraper().scrape_phrases(self.website, ["rfp"], "us")
+        again = ApiScraper().scrape_phrases(self.website, ["RFP"], "us")
+
+        self.assertEqual([job.title for job in engineers], ["Engineer"])
+        self.assertEqual([job.title for job in rfps], ["RFP writer"])
+        self.assertEqual(again, [])
+        headers = [call.kwargs.get("headers") for call in get_mock.call_args_list]
+        self.assertEqual(headers, [None, None, {"If-None-Match": '"v1"'}])
+        self.assertEqual(HttpValidatorCache.objects.count(), 2)
+
+    @patch("job_scraper.api_scraper.throttle")
+    @patch("job_scraper.http_sessions.requests.Session.get")
+    def test_failed_payload_does_not_record_validators(self, get_mock, throttle_mock):
+        response = self._response(200, None, {"ETag": '"v1"'})
+        response.json.side_effect = ValueError("not json")
+        get_mock.return_value = response
+
+        ApiScraper().scrape(self.website, "", "us")
+
+        self.assertFalse(HttpValidatorCache.objects.exists())
+
+    @patch("job_scraper.api_scraper.upsert_jobs", side_effect=DatabaseError("locked"))
+    @patch("job_scraper.api_scraper.throttle")
+    @patch("job_scraper.http_sessions.requests.Session.get")
+    def test_failed_save_does_not_record_validators(
+        self, get_mock, throttle_mock, upsert_mock
+    ):
+        get_mock.return_value = self._response(
+            200,
+            {"data": [{"title": "Engineer", "company": "Acme", "url": "https://x/1"}]},
+            {"ETag": '"v1"'},
+        )
+
+        self.assertEqual(ApiScraper().scrape(self.website, "", "us"), [])
+
+        upsert_mock.assert_called_once()
+        self.assertFalse(HttpValidatorCache.objects.exists())
+
+    @patch(
+        "job_scraper.request_scraper.upsert_jobs", side_effect=DatabaseError("locked")
+    )
+    @patch("job_scraper.request_scraper.throttle")
+    def test_failed_page_save_does_not_record_validators(
+        self, throttle_mock, upsert_mock
+    ):
+        website = create_custom_website(name="Validator Board")
+        clear_block_state(website.id)
+        page = self._response(200, headers={"ETag": '"p1"'})
+        page.text = (
+            '<div class="job"><a class="link" href="/jobs/1">'
+            '<span class="title">Job 1</span></a></div>'
+        )
+        page.content = page.text.encode("utf-8")
+        scraper = JobScraper()
+        scraper.session = Mock()
+        scraper.session.get.return_value = page
+
+        jobs = scraper._scrape_custom_website(website, "us", "python", 1)
+
+        self.assertEqual(jobs, [])
+        upsert_mock.assert_called_once()
+        self.assertFalse(HttpValidatorCache.objects.exists())
+
+
+class HttpSessionRegistryTests(TestCase):
+    def setUp(self):
+        close_sessions()
+
+    def tearDown(self):
+        close_sessions()
+
+    def test_named_sessions_share_connection_pools_but_not_headers(self):
+        scraper = get_session("scraper", {"User-Agent": "browser"})
+        api = get_session("api")
+
+        self.assertIs(get_session("scraper"), scraper)
+        self.assertIs(
+            scraper.get_adapter("https://a.example"),
+            api.get_adapter("https://b.example"),
+        )
+        self.assertEqual(scraper.headers["User-Agent"], "browser")
+        self.assertNotEqual(api.headers["User-Agent"], "browser")
+        retries = api.get_adapter("https://a.example").max_retries
+        self.assertEqual(retries.read, 0)
+        self.assertGreater(retries.connect, 0)
+
+    def test_sessions_are_rebuilt_after_fork(self):
+        session = get_session("api")
+
+        with patch("job_scraper.http_sessions.os.getpid", return_value=-1):
+            self.assertIsNot(get_session("api"), session)
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.client = Mock()
+        self.client.get.side_effect = self._live_response
+
+    def _live_response(self, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = b"<div class='job'>Same body</div>"
+        return response
+
+    def _settings(self, mode):
+        return override_settings(
+            HTTP_RESPONSE_CACHE_MODE=mode, HTTP_RESPONSE_CACHE_DIR=self.tmp_dir.name
+        )
+
+    def _fetch_and_accept(self, client, url):
+        response = client.get(url, timeout=5)
+        remember_response(url, response)
+        return response
+
+    def test_record_serves_repeat_requests_from_disk_and_dedupes_bodies(self):
+        with self._settings("record"):
+            client = cached_client(self.client)
+            self._fetch_and_accept(client, "https://example.com/a")
+            self._fetch_and_accept(client, "https://example.com/b")
+            replayed = client.get("https://example.com/a", timeout=5)
+
+        self.assertEqual(self.client.get.call_count, 2)
+        self.assertTrue(is_cached_response(replayed))
+        self.assertEqual(replayed.text, "<div class='job'>Same body</div>")
+        objects = list(Path(self.tmp_dir.name, "objects").glob("*/*.gz"))
+        self.assertEqual(len(objects), 1)
+
+    def test_replay_never_touches_the_network(self):
+        with self._settings("record"):
+            self._fetch_and_accept(cached_client(self.client), "https://example.com/a")
+
+        with self._settings("replay"):
+            client = cached_client(self.client)
+            self.assertEqual(client.get("https://example.com/a").status_code, 200)
+            with self.assertRaises(ResponseCacheMiss):
+                client.get("https://example.com/missing")
+
+        self.assertEqual(self.client.get.call_count, 1)
+
+    def test_off_mode_returns_the_client_unchanged(self):
+        with self._settings("off"):
+            self.assertIs(cached_client(self.client), self.client)
+
+    def test_evict_drops_expired_entries_and_bodies_over_budget(self):
+        with self._settings("record"):
+            client = cached_client(self.client)
+            self._fetch_and_accept(client, "https://example.com/a")
+            with override_settings(HTTP_RESPONSE_CACHE_TTL_SECONDS=-1):
+                self.assertEqual(evict(), 2)
+            self._fetch_and_accept(client, "https://example.com/b")
+            evict(max_bytes=0)
+            self.assertFalse(is_cached_response(client.get("https://example.com/b")))
+
+    @patch("job_scraper.request_scraper.throttle")
+    def test_challenge_page_is_not_recorded(self, throttle_mock):
+        website = create_custom_website(name="Challenge Board")
+        clear_block_state(website.id)
+        challenge = requests.Response()
+        challenge.status_code = 200
+        challenge.url = website.search_url
+        challenge._content = b"<html><div id='cf-challenge'>Verify you are human</div>"
+        self.client.get.side_effect = None
+        self.client.get.return_value = challenge
+
+        with self._settings("record"):
+            scraper = JobScraper()
+            scraper.session = cached_client(self.client)
+            scraper._scrape_custom_website(website, "us", "python", 1)
+            scraper._scrape_custom_website(website, "us", "python", 1)
+
+        self.assertEqual(self.client.get.call_count, 2)
+        self.assertFalse(list(Path(self.tmp_dir.name).glob("index/*/*.json")))
+
+    @patch("job_scraper.request_scraper.record_pacing_backoff")
+    @patch("job_scraper.request_scraper.record_block_event")
+    def test_replayed_challenge_page_skips_block_bookkeeping(
+        self, record_block_mock, backoff_mock
+    ):
+        website = create_custom_website(name="Replayed Board")
+        url = JobScraper()._build_search_url(website, "us", "python", 1)
+
+        with self._settings("replay"):
+            store_content(url, b"<html><div id='cf-challenge'></div></html>")
+            scraper = JobScraper()
+            scraper.session = cached_client(self.client)
+            jobs = scraper._scrape_custom_website(website, "us", "python", 1)
+
+        self.assertEqual(jobs, [])
+        self.client.get.assert_not_called()
+        record_block_mock.assert_not_called()
+        backoff_mock.assert_not_called()
+        self.assertIn(
+            "Anti-bot challenge detected",
+            ScraperExecutionLog.objects.get(website=website).error_message,
+        )
+
+
+class RequestScraperIncrementalCrawlTests(TestCase):
+    def setUp(self):
+        self.website = create_custom_website(name="Incremental Board")
+        clear_block_state(self.website.id)
+        for number in (2, 3, 4):
+            Job.objects.create(
+                title=f"Known {number}",
+                company="Acme",
+                location="Remote",
+                source_website="Incremental Board",
+                source_url=f"https://example.com/jobs/{number}",
+            )
+
+    def _search_page(self, numbers):
+        response = Mock()
+        response.status_code = 200
+        response.text = "".join(
+            f'<div class="job"><a class="link" href="/jobs/{number}">'
+            f'<span class="title">Job {number}</span></a></div>'
+            for number in numbers
+        )
+        response.content = response.text.encode("utf-8")
+        return response
+
+    def _scrape(self):
+        pages = {
+            1: self._search_page([1, 2]),
+            2: self._search_page([3, 4]),
+            3: self._search_page([5, 6]),
+        }
+        scraper = JobScraper()
+        scraper.session = Mock()
+        scraper.session.get.side_effect = lambda url, timeout: pages[
+            int(url.rsplit("=", 1)[1])
+        ]
+        jobs = scraper._scrape_custom_website(self.website, "us", "python", 3)
+        return jobs, scraper.session.get.call_count
+
+    @override_settings(SCRAPER_INCREMENTAL_STOP_RATIO=1.0)
+    @patch("job_scraper.request_scraper.throttle")
+    def test_stops_after_first_fully_known_page(self, throttle_mock):
+        jobs, page_fetches = self._scrape()
+
+        self.assertEqual(page_fetches, 2)
+        self.assertEqual(
+            [job.source_url for job in jobs], ["https://example.com/jobs/1"]
+        )
+
+    @override_settings(SCRAPER_INCREMENTAL_STOP_RATIO=0.5)
+    @patch("job_scraper.request_scraper.throttle")
+    def test_partial_ratio_stops_on_mostly_known_page(self, throttle_mock):
+        _, page_fetches = self._scrape()
+
+        self.assertEqual(page_fetches, 1)
+
+    @override_settings(SCRAPER_INCREMENTAL_STOP_RATIO=0)
+    @patch("job_scraper.request_scraper.throttle")
+    def test_zero_ratio_walks_every_page(self, throttle_mock):
+        jobs, page_fetches = self._scrape()
+
+        self.assertEqual(page_fetches, 3)
+        self.assertEqual(len(jobs), 3)
+
+
+class RequestScraperDetailFetchTests(TestCase):
+    def setUp(self):
+        self.website = create_custom_website(
+            name="Detail Board",
+            description_selector=".description",
+            detail_fetch_limit=2,
+        )
+        clear_block_state(self.website.id)
+
+    def _response(self, html, status_code=200):
+        response = Mock()
+        response.status_code = status_code
+        response.text = html
+        response.content = html.encode("utf-8")
+        response.raise_for_status = Mock()
+        return response
+
+    @override_settings(REQUEST_DETAIL_CONCURRENCY=2)
+    @patch("job_scraper.request_scraper.throttle")
+    def test_detail_fetch_respects_budget_and_reuses_known_descriptions(
+        self, throttle_mock
+    ):
+        Job.objects.create(
+            title="Known",
+            company="Acme",
+            location="Remote",
+            description="Stored description",
+            source_website="Detail Board",
+            source_url="https://example.com/jobs/1",
+        )
+        search_html = "".join(
+            f'<div class="job"><a class="link" href="/jobs/{number}">'
+            f'<span class="title">Job {number}</span></a>'
+            '<span class="company">Acme</span><span class="location">Remote</span></div>'
+            for number in range(1, 5)
+        )
+        pages = {
+            "https://example.com/search?q=python&l=us&page=1": search_html,
+            "https://example.com/jobs/2": '<div class="description">Second</div>',
+            "https://example.com/jobs/3": '<div class="description">Third</div>',
+        }
+        scraper = JobScraper()
+        scraper.session = Mock()
+        scraper.session.get.side_effect = lambda url, timeout: self._response(
+            pages[url]
+        )
+
+        jobs = scraper._scrape_custom_website(self.website, "us", "python", 1)
+
+        fetched = sorted(call.args[0] for call in scraper.session.get.call_args_list)
+        self.assertEqual(
+            fetched,
+            [
+                "https://example.com/jobs/2",
+                "https://example.com/jobs/3",
+                "https://example.com/search?q=python&l=us&page=1",
+            ],
+        )
+        self.assertEqual(len(jobs), 3)
+        descriptions = dict(Job.objects.values_list("source_url", "description"))
+        self.assertEqual(
+            descriptions,
+            {
+                "https://example.com/jobs/1": "Stored description",
+                "https://example.com/jobs/2": "Second",
+                "https://example.com/jobs/3": "Third",
+                "https://example.com/jobs/4": "",
+            },
+        )
+
+    @override_settings(REQUEST_DETAIL_CONCURRENCY=2)
+    @patch("job_scraper.request_scraper.connections")
+    @patch("job_scraper.request_scraper.throttle")
+    def test_detail_fetch_workers_close_their_connections(
+        self, throttle_mock, connections_mock
+    ):
+        search_html = "".join(
+            f'<div class="job"><a class="link" href="/jobs/{number}">'
+            f'<span class="title">Job {number}</span></a></div>'
+            for number in range(1, 3)
+        )
+        pages = {
+            "https://example.com/search?q=python&l=us&page=1": search_html,
+            "https://example.com/jobs/1": '<div class="description">First</div>',
+            "https://example.com/jobs/2": '<div class="description">Second</div>',
+        }
+        scraper = JobScraper()
+        scraper.session = Mock()
+        scraper.session.get.side_effect = lambda url, timeout: self._response(
+            pages[url]
+        )
+
+        scraper._scrape_custom_website(self.website, "us", "python", 1)
+
+        self.assertEqual(connections_mock.close_all.call_count, 2)
+
+
+class ParsingPoolTests(TestCase):
+    def setUp(self):
+        self.selectors = website_selectors(
+            create_custom_website(name="Parsed Board", salary_selector=".salary")
+        )
+        self.html = (
+            '<div class="job"><a class="link" href="/jobs/1">'
+            '<span class="title"> Python  Dev </span></a>'
+            '<span class="company">Acme</span><span class="salary">$10</span></div>'
+            '<div class="job"><span class="title">No link</span></div>'
+        ).encode("utf-8")
+
+    def tearDown(self):
+        shutdown_parse_pool()
+
+    def test_parse_search_page_returns_picklable_cards(self):
+        parsed = parse_search_page(self.html, self.selectors, 2)
+
+        self.assertEqual(parsed["card_count"], 2)
+        card_number, job_data = parsed["cards"][0]
+        self.assertEqual(card_number, 1)
+        self.assertEqual(job_data["title"], "Python Dev")
+        self.assertEqual(job_data["job_url"], "https://example.com/jobs/1")
+        self.assertEqual(job_data["salary"], "$10")
+        self.assertIn("title", parsed["selector_metrics"])
+
+    @override_settings(SCRAPER_PARSE_WORKERS=1)
+    def test_run_parser_in_worker_process_matches_inline_result(self):
+        pooled = run_parser(parse_search_page, self.html, self.selectors, 2)
+
+        self.assertEqual(pooled, parse_search_page(self.html, self.selectors, 2))
+
+
+RECORDED_SEARCH_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Jobs</title>
+<style>.job-card { color: red; }</style>
+<script>window.__STATE__ = {"jobs": []};</script></head>
+<body><header><nav><a href="/login">Sign in</a></nav></header>
+<ul class="jobs-search__results-list">
+  <li><div class="base-card job-card">
+    <a class="base-card__full-link" href="/jobs/view/101?refId=abc&amp;trk=x">
+      <span class="sr-only">Senior Python Developer</span></a>
+    <h3 class="base-search-card__title" title="Senior Python Developer">
+      Senior Python   Developer </h3>
+    <h4 class="base-search-card__subtitle"><a href="/company/acme">Acme &amp; Co</a></h4>
+    <span class="job-search-card__location">Addis Ababa, Ethiopia</span>
+    <span class="job-search-card__salary-info">$4,000 - $5,000</span>
+    <time class="job-search-card__listdate" datetime="2026-10-01">2 weeks ago</time>
+  </div></li>
+  <li><div class="base-card job-card">
+    <a class="base-card__full-link" href="https://example.com/jobs/view/102">
+      <span class="sr-only">Data Engineer</span></a>
+    <h3 class="base-search-card__title">Data <b>Engineer</b><script>track()</script></h3>
+    <h4 class="base-search-card__subtitle">Globex</h4>
+    <span class="job-search-card__location">Remote</span>
+  </div></li>
+  <li><div class="base-card job-card"><h3 class="base-search-card__title">Ad slot</h3></div></li>
+</ul>
+<footer><p>&copy; 2026</p></footer></body></html>
+"""
+
+RECORDED_DETAIL_PAGE = """<html><body>
+<div class="show-more-less-html__markup"><p>Build <strong>scrapers</strong>.</p>
+<p>Line one<br>Line two</p></div>
+<ul class="requirements"><li>Python</li> <li>Django</li></ul>
+<a class="apply-button" href="/apply/101">Apply</a>
+</body></html>
+"""
+
+
+class HtmlParserBackendTests(TestCase):
+    """Every installed backend must extract exactly what html.parser does."""
+
+    def setUp(self):
+        self.website = create_custom_website(
+            name="Recorded Board",
+            job_list_selector="ul.jobs-search__results-list > li > div.job-card",
+            title_selector="h3.base-search-card__title",
+            company_selector="h4.base-search-card__subtitle",
+            location_selector=".job-search-card__location",
+            salary_selector=".job-search-card__salary-info",
+            date_selector="time.job-search-card__listdate",
+            job_link_selector="a.base-card__full-link",
+            description_selector=".show-more-less-html__markup",
+            requirements_selector="ul.requirements",
+            apply_link_selector="a.apply-button",
+        )
+
+    def _selectors(self, parser):
+        self.website.html_parser = parser
+        return website_selectors(self.website)
+
+    def _assert_matches_html_parser(self, parser):
+        if not parser_available(parser):
+            self.skipTest(f"{parser} is not installed")
+        baseline = self._selectors(PARSER_HTML)
+        selectors = self._selectors(parser)
+        self.assertEqual(selectors["parser"], parser)
+        content = RECORDED_SEARCH_PAGE.encode("utf-8")
+        detail = RECORDED_DETAIL_PAGE.encode("utf-8")
+        job_url = "https://example.com/jobs/view/101"
+
+        self.assertEqual(
+            parse_search_page(content, selectors, 1),
+            parse_search_page(content, baseline, 1),
+        )
+        self.assertEqual(
+            parse_stealth_search_page(RECORDED_SEARCH_PAGE, selectors),
+            parse_stealth_search_page(RECORDED_SEARCH_PAGE, baseline),
+        )
+        self.assertEqual(
+            parse_detail_page(detail, job_url, selectors),
+            parse_detail_page(detail, job_url, baseline),
+        )
+        self.assertEqual(
+            extract_description(
+                RECORDED_DETAIL_PAGE, ".show-more-less-html__markup", parser
+            ),
+            extract_description(RECORDED_DETAIL_PAGE, ".show-more-less-html__markup"),
+        )
+
+    def test_html_parser_extracts_recorded_page(self):
+        parsed = parse_search_page(
+            RECORDED_SEARCH_PAGE.encode("utf-8"), self._selectors(PARSER_HTML), 1
+        )
+
+        self.assertEqual(parsed["card_count"], 3)
+        _, first = parsed["cards"][0]
+        self.assertEqual(first["title"], "Senior Python Developer")
+        self.assertEqual(first["company"], "Acme & Co")
+        self.assertEqual(
+            first["job_url"], "https://example.com/jobs/view/101?refId=abc&trk=x"
+        )
+        _, second = parsed["cards"][1]
+        self.assertEqual(second["title"], "Data Engineer")
+
+    def test_lxml_matches_html_parser(self):
+        self._assert_matches_html_parser(PARSER_LXML)
+
+    def test_selectolax_matches_html_parser(self):
+        self._assert_matches_html_parser(PARSER_SELECTOLAX)
+
+    @override_settings(SCRAPER_HTML_PARSER="no-such-parser")
+    def test_unknown_backend_falls_back_to_html_parser(self):
+        self.assertEqual(resolve_parser("no-such-parser"), PARSER_HTML)
+        self.assertEqual(self._selectors("")["parser"], PARSER_HTML)
+
+
+class ExtractionPlanTests(TestCase):
+    def setUp(self):
+        self.selectors = website_selectors(
+            create_custom_website(
+                name="Strained Board",
+                job_list_selector="ul.results > li.job",
+                salary_selector=".salary",
+            )
+        )
+        self.html = (
+            "<html><head><script>var ads = 1;</script></head><body>"
+            '<header><li class="job"><span class="title">Promo</span></li></header>'
+            '<ul class="results main">'
+            '<li class="job"><span class="title">Python Dev</span>'
+            '<span class="company">Acme</span><a class="link" href="/jobs/1">x</a></li>'
+            '<li class="job"><span class="title">Go Dev</span>'
+            '<span class="salary">$10</span><a class="link" href="/jobs/2">x</a></li>'
+            "</ul><footer>About us</footer></body></html>"
+        ).encode("utf-8")
+
+    def test_only_list_container_subtrees_are_built(self):
+        plan = extraction_plan(self.selectors)
+        root = parse_html(self.html, PARSER_HTML, parse_only=plan.parse_only)
+
+        self.assertNotIn("Promo", root.text())
+        self.assertNotIn("About us", root.text())
+        parsed = parse_search_page(self.html, self.selectors, 1)
+        self.assertEqual(
+            [job["title"] for _, job in parsed["cards"]], ["Python Dev", "Go Dev"]
+        )
+
+    def test_each_field_selector_runs_once_per_card(self):
+        calls = []
+        select_one = SoupNode.select_one
+
+        def counting_select_one(node, selector):
+            calls.append(selector)
+            return select_one(node, selector)
+
+        with patch.object(SoupNode, "select_one", counting_select_one):
+            parsed = parse_search_page(self.html, self.selectors, 1)
+
+        # title, company, location, link and salary; the date selector is unset.
+        self.assertEqual(len(calls), 2 * 5)
+        self.assertIn("title=2/2(100%)", parsed["selector_metrics"])
+        self.assertIn("company=1/2(50%)", parsed["selector_metrics"])
+        self.assertIn("salary=1/2(50%)", parsed["selector_metrics"])
+        self.assertIn("date=0/2(0%)", parsed["selector_metrics"])
+
+    def test_plan_is_compiled_once_and_dropped_when_the_website_is_saved(self):
+        website = CustomWebsite.objects.get(pk=self.selectors["pk"])
+        plan = extraction_plan(website_selectors(website))
+
+        self.assertIs(extraction_plan(website_selectors(website)), plan)
+        self.assertEqual(plan.field_selectors["title"].pattern, ".title")
+
+        website.title_selector = ".name"
+        website.save()
+        self.assertNotIn((website.pk, self.selectors["fingerprint"]), parsing._plans)
+        edited = extraction_plan(website_selectors(website))
+        self.assertIsNot(edited, plan)
+        self.assertEqual(edited.field_selectors["title"].pattern, ".name")
+
+    def test_complex_list_selectors_parse_the_full_tree(self):
+        for selector in ("h2 + ul li", ".a, .b", "li:has(a)", "[data-job]", "* > li"):
+            self.assertIsNone(_list_strainer(selector), selector)
+        self.assertIsNotNone(_list_strainer("div#jobs.list .card"))
+
+
+class AsyncEngineScraperTests(TestCase):
+    def setUp(self):
+        self.website = create_custom_website(
+            name="Async Board",
+            description_selector=".description",
+            use_async_engine=True,
+        )
+        clear_block_state(self.website.id)
+
+    @patch("job_scraper.request_scraper.AsyncFetchEngine.fetch", new_callable=AsyncMock)
+    def test_async_engine_fetches_search_and_detail_pages(self, fetch_mock):
+        search_html = (
+            '<div class="job"><a class="link" href="/jobs/1">'
+            '<span class="title">Python Developer</span></a>'
+            '<span class="company">Acme</span><span class="location">Berlin, Germany</span></div>'
+            '<div class="job"><a class="link" href="/jobs/2">'
+            '<span class="title">Data Engineer</span></a>'
+            '<span class="company">Beta</span><span class="location">Remote</span></div>'
+        )
+        pages = {
+            "https://example.com/search?q=python&l=us&page=1": search_html,
+            "https://example.com/jobs/1": '<div class="description">Full-time role</div>',
+            "https://example.com/jobs/2": '<div class="description">Contract role</div>',
+        }
+
+        async def fetch(url, timeout, rate_per_minute=None):
+            return AsyncResponse(url, 200, pages[url].encode("utf-8"), "utf-8")
+
+        fetch_mock.side_effect = fetch
+
+        jobs = JobScraper().get_recent_jobs("us", "python", max_pages=1)
+
+        self.assertEqual(len(jobs), 2)
+        self.assertEqual(fetch_mock.call_count, 3)
+        job = Job.objects.get(source_url="https://example.com/jobs/1")
+        self.assertEqual(job.description, "Full-time role")
+        log = ScraperExecutionLog.objects.get(website=self.website)
+        self.assertEqual(log.jobs_found, 2)
+        self.assertEqual(log.error_message, "")
+
+    @patch("job_scraper.request_scraper.AsyncFetchEngine.fetch", new_callable=AsyncMock)
+    def test_async_engine_records_block_and_stops(self, fetch_mock):
+        fetch_mock.return_value = AsyncResponse(
+            "https://example.com/search", 403, b"<html>captcha-delivery</html>", None
+        )
+
+        jobs = JobScraper().get_recent_jobs("us", "python", max_pages=3)
+
+        self.assertEqual(jobs, [])
+        self.assertEqual(fetch_mock.call_count, 1)
+        log = ScraperExecutionLog.objects.get(website=self.website)
+        self.assertIn("Anti-bot challenge detected", log.error_message)
+
+
+class BrowserPoolTests(TestCase):
+    def setUp(self):
+        self.managers = []
+        self.pool = BrowserPool(self._factory, size=1, max_pages=3)
+
+    def _factory(self):
+        manager = Mock()
+        manager.__enter__ = Mock(return_value=Mock())
+        manager.__exit__ = Mock(return_value=False)
+        manager.__enter__.return_value.driver.window_handles = ["main"]
+        self.managers.append(manager)
+        return manager
+
+    def test_lease_reuses_healthy_browser_until_page_budget_is_spent(self):
+        first = self.pool.lease()
+        self.pool.release(first, pages=2)
+        second = self.pool.lease()
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.managers), 1)
+
+        self.pool.release(second, pages=1)
+        third = self.pool.lease()
+
+        self.assertIsNot(third, first)
+        self.assertEqual(len(self.managers), 2)
+        self.managers[0].__exit__.assert_called_once()
+
+    def test_invalid_session_and_failed_health_check_recycle_browser(self):
+        first = self.pool.lease()
+        self.pool.release(first, broken=True)
+        second = self.pool.lease()
+        self.pool.release(second)
+        type(second.driver.driver).window_handles = property(
+            Mock(side_effect=RuntimeError("invalid session id"))
+        )
+
+        third = self.pool.lease()
+
+        self.assertEqual(len(self.managers), 3)
+        self.assertIsNot(third, second)
+
+    @patch.object(StealthScraper, "_build_session_manager")
+    @patch.object(StealthScraper, "_scrape_pages")
+    @patch.object(StealthScraper, "_warm_up_session")
+    @patch("job_scraper.stealth_scraper.jitter_sleep")
+    def test_stealth_scraper_leases_pooled_browser_and_warms_it_once(
+        self, sleep_mock, warm_up_mock, scrape_pages_mock, build_manager_mock
+    ):
+        website = create_custom_website(name="Stealth Board", use_stealth=True)
+        install_browser_pool(self.pool)
+        self.addCleanup(install_browser_pool, None)
+
+        StealthScraper(headless=True).scrape(website, "python", "us")
+        StealthScraper(headless=True).scrape(website, "golang", "us")
+
+        self.assertEqual(len(self.managers), 1)
+        warm_up_mock.assert_called_once()
+        self.assertEqual(scrape_pages_mock.call_count, 2)
+        build_manager_mock.assert_not_called()
+
+
+class FakeTabbedDriver:
+    """Just enough of a Selenium driver to open, poll and close tabs."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.urls = {"main": ""}
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.switch_to = Mock()
+        self.switch_to.window.side_effect = self._switch
+
+    def _switch(self, handle):
+        self.current_window_handle = handle
+
+    def execute_script(self, script, *args):
+        if script.startswith("window.open"):
+            handle = f"tab-{len(self.urls)}"
+            self.urls[handle] = "about:blank"
+            self.window_handles.append(handle)
+        elif script.startswith("window.location"):
+            self.urls[self.current_window_handle] = args[0]
+        return "agent"
+
+    def find_elements(self, by, selector):
+        return ["ready"] if self.urls[self.current_window_handle] in self.pages else []
+
+    @property
+    def page_source(self):
+        return self.pages.get(self.urls[self.current_window_handle], "")
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+
+class StealthMultiTabDescriptionTests(TestCase):
+    def setUp(self):
+        self.website = create_custom_website(
+            name="Tabbed Board",
+            description_selector=".description",
+            detail_fetch_limit=3,
+            use_stealth=True,
+        )
+
+    @patch("job_scraper.stealth_scraper.throttle")
+    @patch("job_scraper.stealth_scraper.jitter_sleep")
+    @patch("job_scraper.stealth_scraper.time.monotonic")
+    def test_multi_tab_fetch_harvests_ready_tabs_and_closes_all(
+        self, monotonic_mock, sleep_mock, throttle_mock
+    ):
+        monotonic_mock.side_effect = [0, 0, 0, 100]
+        driver = FakeTabbedDriver(
+            {
+                "https://example.com/jobs/1": '<div class="description">One</div>',
+                "https://example.com/jobs/2": '<div class="description">Two</div>',
+            }
+        )
+        scraper = StealthScraper(headless=True)
+        scraper._driver = Mock(driver=driver)
+        scraper._driver.get_page_source.side_effect = lambda: driver.page_source
+
+        descriptions = scraper._get_descriptions_multi_tab(
+            [
+                "https://example.com/jobs/1",
+                "https://example.com/jobs/2",
+                "https://example.com/jobs/3",
+            ],
+            ".description",
+        )
+
+        self.assertEqual(
+            descriptions,
+            {
+                "https://example.com/jobs/1": "One",
+                "https://example.com/jobs/2": "Two",
+                "https://example.com/jobs/3": "",
+            },
+        )
+        self.assertEqual(driver.window_handles, ["main"])
+        self.assertEqual(driver.current_window_handle, "main")
+        self.assertEqual(scraper._pages_opened, 3)
+
+    @override_settings(STEALTH_DETAIL_TABS=2)
+    @patch.object(StealthScraper, "_get_descriptions_multi_tab")
+    def test_prefetch_batches_tabs_within_budget_and_stops_on_invalid_session(
+        self, multi_tab_mock
+    ):
+        Job.objects.create(
+            title="Known",
+            company="Acme",
+            location="Remote",
+            description="Stored",
+            source_website="Tabbed Board",
+            source_url="https://example.com/jobs/1",
+        )
+        cards = [
+            {"title": "Job", "job_url": f"https://example.com/jobs/{number}"}
+            for number in range(1, 7)
+        ]
+        multi_tab_mock.side_effect = [
+            {
+                "https://example.com/jobs/2": "Two",
+                "https://example.com/jobs/3": "Three",
+            },
+            InvalidSessionIdException("dead session"),
+        ]
+        scraper = StealthScraper(headless=True)
+        state = {
+            "detail_fetch_count": 0,
+            "detail_fetch_limit": 4,
+            "detail_fetch_disabled": False,
+            "detail_fetch_session_failures": 0,
+        }
+
+        descriptions = scraper._prefetch_descriptions(self.website, cards, state)
+
+        self.assertEqual(
+            [call.args[0] for call in multi_tab_mock.call_args_list],
+            [
+                ["https://example.com/jobs/2", "https://example.com/jobs/3"],
+                ["https://example.com/jobs/4", "https://example.com/jobs/5"],
+            ],
+        )
+        self.assertEqual(len(descriptions), 2)
+        self.assertEqual(state["detail_fetch_count"], 2)
+        self.assertTrue(state["detail_fetch_disabled"])
+        self.assertTrue(scraper._session_invalid)
+
+
 class StealthScraperRegressionTests(TestCase):
     def setUp(self):
         self.website = create_custom_website(
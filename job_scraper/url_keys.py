@@ -0,0 +1,111 @@
+"""Canonical job URLs and the de-duplication key derived from them.
+
+The same posting is often linked with different tracking parameters,
+session tokens, schemes or host spellings. ``canonical_url`` removes those
+differences and ``url_key`` hashes the result into the fixed-width value
+stored (uniquely indexed) in ``Job.source_key``.
+"""
+
+import hashlib
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click or the visitor. Short generic
+# names (``ref``, ``from``, ``tk``, ``sid``...) are left alone: some boards
+# use them to identify the posting itself.
+TRACKING_PARAMS = frozenset(
+    {
+        "gclid",
+        "gclsrc",
+        "dclid",
+        "fbclid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "_ga",
+        "_gl",
+        "mc_cid",
+        "mc_eid",
+        "ref_src",
+        "referrer",
+        "trk",
+        "trkinfo",
+        "trackingid",
+        "lipi",
+        "ebp",
+    }
+)
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_")
+# Session tokens, in the query string or as ";name=value" path parameters.
+SESSION_PARAMS = frozenset(
+    {
+        "jsessionid",
+        "phpsessid",
+        "aspsessionid",
+        "sessionid",
+        "session_id",
+        "cfid",
+        "cftoken",
+    }
+)
+_PATH_SESSION_RE = re.compile(
+    r";(?:%s)=[^/?#;]*" % "|".join(sorted(SESSION_PARAMS)), re.IGNORECASE
+)
+_DEFAULT_PORTS = {"80", "443"}
+
+
+def canonical_url(url: str) -> str:
+    """``url`` with https, a bare lowercase host and only meaningful params.
+
+    The fragment, default ports, a leading ``www.``, a trailing slash,
+    tracking parameters and session tokens are dropped, and the remaining
+    query parameters are sorted.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if host and scheme in ("http", "https", ""):
+        scheme = "https"
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if host and port is not None and str(port) not in _DEFAULT_PORTS:
+        host = f"{host}:{port}"
+
+    path = _PATH_SESSION_RE.sub("", parts.path)
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _is_noise_param(name)
+        )
+    )
+    if host:
+        path = path or "/"
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def url_key(url: str) -> Optional[str]:
+    """SHA-1 hex digest of the canonical URL; ``None`` for a blank URL."""
+    canonical = canonical_url(url)
+    if not canonical:
+        return None
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def _is_noise_param(name: str) -> bool:
+    name = name.lower()
+    return (
+        name in TRACKING_PARAMS
+        or name in SESSION_PARAMS
+        or name.startswith(TRACKING_PREFIXES)
+    )
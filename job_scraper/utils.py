@@ -1,8 +1,13 @@
+import functools
 import logging
 import re
+from typing import Iterable, Optional
 
+import pycountry
 import pycountry_convert as pc
 
+from .gazetteer import location_parts, lookup_city, normalize_place, region_continent
+
 logger = logging.getLogger(__name__)
 
 US_STATE_CODES = {
@@ -63,8 +68,31 @@ COUNTRY_SPECIAL_CASES = {
     "United Kingdom": "GB",
     "UAE": "AE",
     "United States": "US",
+    "England": "GB",
+    "Scotland": "GB",
+    "Wales": "GB",
+    "Northern Ireland": "GB",
+    "Great Britain": "GB",
+    "Russia": "RU",
+    "Turkey": "TR",
+    "Czech Republic": "CZ",
+    "Holland": "NL",
+    "Ivory Coast": "CI",
+    "Korea": "KR",
+}
+# Shorter names than pycountry's for countries job boards write plainly.
+COUNTRY_DISPLAY_NAMES = {"RU": "Russia", "TR": "Turkey"}
+# pycountry-convert has no continent for these codes.
+CONTINENT_CODE_OVERRIDES = {
+    "AQ": "AN",
+    "TF": "AN",
+    "EH": "AF",
+    "PN": "OC",
+    "SX": "NA",
+    "TL": "AS",
+    "UM": "OC",
+    "VA": "EU",
 }
-LOCATION_SPLIT_RE = re.compile(r"\s*,\s*")
 
 
 WEEKDAYS = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
@@ -160,84 +188,133 @@ def resolve_scrape_location(countries: str = "", continents: str = "", fallback_
 def get_continent_from_country(country_name: str) -> str:
     """
     Returns the continent name for a given country name.
+
+    Names, common and official names, aliases and ISO alpha-2/alpha-3 codes
+    resolve through an in-memory index; only unknown text falls back to
+    pycountry's (slow) fuzzy search, whose answers are cached.
     """
     if not country_name:
         return "Unknown"
 
     try:
-        # Try to get the country code from the country name
-        # Many sources might provide full names, some might provide codes.
-        # This is a bit naive but covers common cases.
         country_name = country_name.strip()
 
         if country_name.upper() in US_STATE_CODES:
             return "North America"
 
-        # Handle some common mismatches or simplified inputs
-        country_code = COUNTRY_SPECIAL_CASES.get(country_name, None)
-
-        if not country_code:
-            # Try to lookup ISO code by name
-            # pycountry can be used here for more robustness if needed
-            # but pycountry-convert expect alpha2 codes.
-            try:
-                import pycountry
-
-                country = pycountry.countries.search_fuzzy(country_name)[0]
-                country_code = country.alpha_2
-            except Exception:
-                # Fallback: if it's already a 2-letter code, use it
-                if len(country_name) == 2:
-                    country_code = country_name.upper()
-                else:
-                    return "Unknown"
-
-        continent_code = pc.country_alpha2_to_continent_code(country_code)
-        continent_name = pc.convert_continent_code_to_continent_name(continent_code)
-        return continent_name
+        codes, continents, _ = _country_index()
+        key = normalize_place(country_name)
+        country_code = codes.get(key) or _fuzzy_country_code(key)
+        return continents.get(country_code, "Unknown")
     except Exception:
         logger.exception("continent_lookup_failed country=%s", country_name)
         return "Unknown"
 
 
+@functools.lru_cache(maxsize=1)
+def _country_index() -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
+    """Normalized name or code -> alpha-2, then alpha-2 -> continent and name."""
+    codes: dict[str, str] = {}
+    continents: dict[str, str] = {}
+    names: dict[str, str] = {}
+    for country in pycountry.countries:
+        alpha_2 = country.alpha_2
+        continent_code = CONTINENT_CODE_OVERRIDES.get(alpha_2)
+        if not continent_code:
+            try:
+                continent_code = pc.country_alpha2_to_continent_code(alpha_2)
+            except KeyError:
+                continue
+        continents[alpha_2] = pc.convert_continent_code_to_continent_name(
+            continent_code
+        )
+        names[alpha_2] = COUNTRY_DISPLAY_NAMES.get(alpha_2) or getattr(
+            country, "common_name", country.name
+        )
+        for name in (
+            alpha_2,
+            country.alpha_3,
+            country.name,
+            getattr(country, "common_name", ""),
+            getattr(country, "official_name", ""),
+        ):
+            if name:
+                codes.setdefault(normalize_place(name), alpha_2)
+    for alias, alpha_2 in COUNTRY_SPECIAL_CASES.items():
+        codes[normalize_place(alias)] = alpha_2
+    return codes, continents, names
+
+
+@functools.lru_cache(maxsize=2048)
+def _fuzzy_country_code(key: str) -> Optional[str]:
+    """Fuzzy match for text the index does not know; misses are cached too."""
+    if not key:
+        return None
+    try:
+        return pycountry.countries.search_fuzzy(key)[0].alpha_2
+    except LookupError:
+        return None
+
+
 def parse_location_components(location_text: str) -> dict[str, str]:
     """Normalize location text into city/country/continent."""
-    loc_text = (location_text or "").strip()
-    if not loc_text:
+    return dict(_location_components((location_text or "").strip()))
+
+
+def parse_locations(location_texts: Iterable[str]) -> list[dict[str, str]]:
+    """``parse_location_components`` for a batch, e.g. every card of a page."""
+    return [parse_location_components(text) for text in location_texts]
+
+
+@functools.lru_cache(maxsize=4096)
+def _location_components(loc_text: str) -> tuple[tuple[str, str], ...]:
+    # Cached as a tuple so callers cannot mutate a shared result.
+    return tuple(_parse_location(loc_text).items())
+
+
+def _parse_location(loc_text: str) -> dict[str, str]:
+    parts = location_parts(loc_text)
+    if not parts:
         return {"city": "", "country": "", "continent": "Unknown"}
 
+    codes, continents, names = _country_index()
     city = ""
-    country = ""
-    continent = ""
-    loc_upper = loc_text.upper()
-
-    if "EUROPE" in loc_upper:
-        return {"city": "", "country": "", "continent": "Europe"}
-    if "EMEA" in loc_upper:
-        return {"city": "", "country": "", "continent": "Europe"}
-    if "USA" in loc_upper or "UNITED STATES" in loc_upper:
-        return {"city": "", "country": "United States", "continent": "North America"}
-
-    parts = [part.strip() for part in LOCATION_SPLIT_RE.split(loc_text) if part.strip()]
-    if len(parts) >= 2:
-        city = parts[0]
-        last_part = parts[-1].upper()
-        if last_part in US_STATE_CODES or last_part in {"USA", "US", "UNITED STATES"}:
-            return {
-                "city": city,
-                "country": "United States",
-                "continent": "North America",
-            }
-        country = parts[-1]
-    else:
-        only_part = parts[0]
-        if only_part.upper() in US_STATE_CODES:
-            return {
-                "city": "",
-                "country": "United States",
-                "continent": "North America",
-            }
-        country = only_part
-
-    continent = get_continent_from_country(country) if country else "Unknown"
-    return {"city": city, "country": country, "continent": continent}
+    country_code = None
+    region = ""
+    # The broadest place usually comes last: "Austin, TX", "Berlin, Germany".
+    for part in reversed(parts):
+        key = normalize_place(part)
+        if country_code is None and not region:
+            if part.upper() in US_STATE_CODES:
+                country_code = "US"
+                continue
+            if key in codes:
+                country_code = codes[key]
+                continue
+            region = region_continent(key) or ""
+            if region:
+                continue
+        found = lookup_city(key)
+        if found and not city:
+            city, city_country = found
+            country_code = country_code or city_country
+
+    if country_code is None and not region:
+        country_code = _fuzzy_country_code(normalize_place(parts[-1]))
+        if country_code is None and len(parts) == 1:
+            # Neither a known place nor anything like a country: keep it as
+            # the city rather than filing it under a bogus country.
+            return {"city": parts[0], "country": "", "continent": "Unknown"}
+
+    first_key = normalize_place(parts[0])
+    if not city and len(parts) >= 2 and first_key not in codes:
+        if not region_continent(first_key):
+            city = parts[0]
+
+    if country_code is None:
+        return {"city": city, "country": "", "continent": region or "Unknown"}
+    return {
+        "city": city,
+        "country": names.get(country_code, ""),
+        "continent": continents.get(country_code, "Unknown"),
+    }
@@ -17,6 +17,7 @@ from django.views.decorators.http import require_POST
 
 from .models import CustomWebsite, Job, ScheduledScrape
 from .request_scraper import JobScraper
+from .scheduling import split_keyword_phrases
 from .utils import describe_cron, resolve_scrape_location
 
 logger = logging.getLogger(__name__)
@@ -302,10 +303,8 @@ def trigger_scrape(request: HttpRequest) -> HttpResponseRedirect:
         except ValueError:
             pass
 
-    from .management.commands.run_scraper import _split_keyword_phrases
-
     scraper = JobScraper()
-    phrases = _split_keyword_phrases(keywords)
+    phrases = split_keyword_phrases(keywords)
     logger.info(
         "manual_scrape_start website_id=%s location=%s keywords=%s phrases=%d",
         website_id,
@@ -0,0 +1,192 @@
+import logging
+from datetime import timedelta
+from typing import List, Optional
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .api_scraper import api_fetches_once
+from .models import Job, ScheduledScrapeRun, ScrapeWorkUnit
+from .request_scraper import JobScraper
+from .scheduling import enrich_new_jobs, finish_scheduled_run, split_keyword_phrases
+
+logger = logging.getLogger(__name__)
+
+CLAIM_CANDIDATES = 10
+
+
+def claim_work_unit(worker_id: str) -> Optional[ScrapeWorkUnit]:
+    """Lease the next available unit, or ``None`` when the queue is idle.
+
+    Claims are optimistic: the UPDATE only matches if the unit still has
+    the status and attempt count we read, so two workers racing for the
+    same row cannot both win. Running units whose lease has expired are
+    visible again and get re-claimed.
+    """
+    now = timezone.now()
+    candidates = ScrapeWorkUnit.objects.filter(
+        Q(status=ScrapeWorkUnit.STATUS_PENDING, available_at__lte=now)
+        | Q(status=ScrapeWorkUnit.STATUS_RUNNING, lease_expires_at__lte=now)
+    )[:CLAIM_CANDIDATES]
+
+    for unit in candidates:
+        if unit.attempts >= unit.max_attempts:
+            _expire_unit(unit)
+            continue
+
+        claimed = ScrapeWorkUnit.objects.filter(
+            id=unit.id, status=unit.status, attempts=unit.attempts
+        ).update(
+            status=ScrapeWorkUnit.STATUS_RUNNING,
+            worker_id=worker_id,
+            attempts=F("attempts") + 1,
+            lease_expires_at=now + timedelta(seconds=settings.WORK_QUEUE_LEASE_SECONDS),
+        )
+        if claimed:
+            unit.refresh_from_db()
+            logger.info(
+                "work_unit_claimed unit_id=%s run_id=%s website_id=%s attempt=%s worker=%s",
+                unit.id,
+                unit.run_id,
+                unit.website_id,
+                unit.attempts,
+                worker_id,
+            )
+            return unit
+    return None
+
+
+def process_work_unit(unit: ScrapeWorkUnit, scraper: JobScraper) -> None:
+    try:
+        jobs = execute_work_unit(unit, scraper)
+    except Exception as exc:
+        logger.exception(
+            "work_unit_failed unit_id=%s run_id=%s website_id=%s attempt=%s",
+            unit.id,
+            unit.run_id,
+            unit.website_id,
+            unit.attempts,
+        )
+        fail_work_unit(unit, str(exc))
+    else:
+        complete_work_unit(unit, jobs)
+    finalize_run_if_complete(unit.run_id)
+
+
+def execute_work_unit(unit: ScrapeWorkUnit, scraper: JobScraper) -> List[Job]:
+    website = unit.website
+    if api_fetches_once(website):
+        jobs, _ = scraper.get_api_jobs_once(
+            unit.location, split_keyword_phrases(unit.phrase), [website.id]
+        )
+        return jobs
+    return scraper.get_recent_jobs(
+        unit.location,
+        unit.phrase,
+        max_pages=unit.max_pages,
+        website_id=website.id,
+    )
+
+
+def complete_work_unit(unit: ScrapeWorkUnit, jobs: List[Job]) -> None:
+    updated = _owned(unit).update(
+        status=ScrapeWorkUnit.STATUS_DONE,
+        job_ids=[job.id for job in jobs],
+        lease_expires_at=None,
+        completed_at=timezone.now(),
+    )
+    if not updated:
+        # The lease ran out and another worker took the unit over; the
+        # jobs are saved either way, only the bookkeeping is dropped.
+        logger.warning(
+            "work_unit_lease_lost unit_id=%s run_id=%s worker=%s jobs_new=%s",
+            unit.id,
+            unit.run_id,
+            unit.worker_id,
+            len(jobs),
+        )
+
+
+def fail_work_unit(unit: ScrapeWorkUnit, error: str) -> None:
+    now = timezone.now()
+    if unit.attempts < unit.max_attempts:
+        delay = settings.WORK_QUEUE_RETRY_DELAY_SECONDS * unit.attempts
+        _owned(unit).update(
+            status=ScrapeWorkUnit.STATUS_PENDING,
+            available_at=now + timedelta(seconds=delay),
+            lease_expires_at=None,
+            last_error=error,
+        )
+        return
+    _owned(unit).update(
+        status=ScrapeWorkUnit.STATUS_FAILED,
+        lease_expires_at=None,
+        last_error=error,
+        completed_at=now,
+    )
+
+
+def finalize_run_if_complete(run_id: int) -> bool:
+    """Enrich and email a run once its last unit settles.
+
+    Setting ``completed_at`` is the guard, so exactly one worker finalizes
+    even when several finish the last units at the same moment.
+    """
+    open_units = ScrapeWorkUnit.objects.filter(
+        run_id=run_id,
+        status__in=[ScrapeWorkUnit.STATUS_PENDING, ScrapeWorkUnit.STATUS_RUNNING],
+    )
+    if open_units.exists():
+        return False
+    claimed = ScheduledScrapeRun.objects.filter(
+        id=run_id, completed_at__isnull=True
+    ).update(completed_at=timezone.now())
+    if not claimed:
+        return False
+
+    run = ScheduledScrapeRun.objects.select_related("schedule").get(id=run_id)
+    job_ids = []
+    for unit_job_ids in run.work_units.order_by("id").values_list("job_ids", flat=True):
+        job_ids.extend(job_id for job_id in unit_job_ids if job_id not in job_ids)
+    jobs_by_id = Job.objects.in_bulk(job_ids)
+    new_jobs = [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id]
+
+    contacts_found = enrich_new_jobs(new_jobs, run.schedule.enrichment_limit)
+    finish_scheduled_run(run.schedule, run, new_jobs, contacts_found)
+    logger.info(
+        "scheduled_run_finalized run_id=%s schedule_id=%s jobs_new=%s failed_units=%s",
+        run.id,
+        run.schedule_id,
+        len(new_jobs),
+        run.work_units.filter(status=ScrapeWorkUnit.STATUS_FAILED).count(),
+    )
+    return True
+
+
+def _owned(unit: ScrapeWorkUnit):
+    return ScrapeWorkUnit.objects.filter(
+        id=unit.id,
+        status=ScrapeWorkUnit.STATUS_RUNNING,
+        worker_id=unit.worker_id,
+        attempts=unit.attempts,
+    )
+
+
+def _expire_unit(unit: ScrapeWorkUnit) -> None:
+    expired = ScrapeWorkUnit.objects.filter(
+        id=unit.id, status=unit.status, attempts=unit.attempts
+    ).update(
+        status=ScrapeWorkUnit.STATUS_FAILED,
+        lease_expires_at=None,
+        last_error=unit.last_error or "Lease expired on the final attempt.",
+        completed_at=timezone.now(),
+    )
+    if expired:
+        logger.warning(
+            "work_unit_expired unit_id=%s run_id=%s attempts=%s",
+            unit.id,
+            unit.run_id,
+            unit.attempts,
+        )
+        finalize_run_if_complete(unit.run_id)